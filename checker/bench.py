@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+성능 회귀 벤치마크 모듈
+
+측정값을 benchmarks/baseline.json의 기준값과 비교해 회귀를 감지한다.
+Railway 배포마다 콜드 스타트가 발생하므로 임포트 시간도 함께 감시한다.
+추출/상태 벤치마크는 합성 예약 데이터(synthetic.py)를 규모별로 만들어 네트워크 없이 측정한다.
+
+사용법:
+    python -m checker.bench                # 모든 벤치마크 실행 후 기준값과 비교 (회귀 시 종료 코드 1)
+    python -m checker.bench imports        # 특정 벤치마크만 실행 (imports, extract, state)
+    python -m checker.bench --update       # 현재 측정값으로 기준값 갱신
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BASELINE_FILE = Path(__file__).resolve().parent.parent / "benchmarks" / "baseline.json"
+REGRESSION_TOLERANCE = 1.5  # 기준값 대비 허용 배수
+
+# 가벼운 CLI 모드에서 임포트되면 안 되는 무거운 의존성
+HEAVY_MODULES = ("telegram", "apscheduler", "bs4", "aiohttp", "requests", "httpx")
+
+# 합성 데이터 규모 (small: 현재 운영 규모, large: 테마/날짜 창 확장 시나리오)
+SYNTHETIC_SCALES = {
+    'small': {'themes': 10, 'days': 30, 'slots_per_day': 8},
+    'large': {'themes': 60, 'days': 180, 'slots_per_day': 16},
+}
+
+
+def measure(func: Callable[[], object], rounds: int = 10, warmup: int = 1) -> Dict[str, float]:
+    """
+    함수 실행 시간 측정
+    
+    Returns:
+        dict: min/median/mean (초), rounds
+    """
+    for _ in range(warmup):
+        func()
+    
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'rounds': rounds,
+    }
+
+
+def _measure_import(module: str, rounds: int = 5) -> Dict[str, object]:
+    """새 인터프리터에서 모듈 임포트 시간과 함께 로드된 무거운 의존성 측정"""
+    code = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - started)\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    project_root = str(Path(__file__).resolve().parent.parent)
+    
+    samples = []
+    heavy = []
+    for _ in range(rounds):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True,
+            cwd=project_root, check=True
+        ).stdout.splitlines()
+        samples.append(float(output[0]))
+        heavy = [m for m in output[1].split(",") if m] if len(output) > 1 else []
+    
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'rounds': rounds,
+        'heavy_modules': heavy,
+    }
+
+
+def bench_imports() -> Dict[str, Dict[str, object]]:
+    """패키지 임포트 시간 (CLI 진입점과 설정 모듈)"""
+    return {
+        'import_checker_main': _measure_import("checker.main"),
+        'import_checker_config': _measure_import("checker.config"),
+    }
+
+
+@contextmanager
+def _quiet_checker_logs():
+    """측정 중 체커 모듈 로그 출력 끄기 (로그 호출 비용은 그대로 측정됨)"""
+    from loguru import logger
+    logger.disable("checker")
+    try:
+        yield
+    finally:
+        logger.enable("checker")
+
+
+def bench_extract() -> Dict[str, Dict[str, object]]:
+    """날짜 하나의 숨겨진 데이터 파싱과 슬롯 추출 (규모별)"""
+    from .fetch import ZeroworldFetcher
+    from .synthetic import SyntheticSite, SyntheticTransport
+    from .transport import using_transport
+    
+    results = {}
+    for scale, params in SYNTHETIC_SCALES.items():
+        site = SyntheticSite(**params)
+        date_str = site.dates()[len(site.dates()) // 2]
+        page = site.reservation_page(date_str)
+        api_data = site.theme_payload(date_str)
+        
+        with using_transport(SyntheticTransport(site)), _quiet_checker_logs():
+            fetcher = ZeroworldFetcher()
+            hidden_data = fetcher._extract_hidden_data(page)
+            results[f'extract_hidden_data[{scale}]'] = measure(lambda: fetcher._extract_hidden_data(page))
+            results[f'extract_slots_from_data[{scale}]'] = measure(
+                lambda: fetcher.extract_slots_from_data(api_data, hidden_data, date_str, site.target_theme)
+            )
+    return results
+
+
+def bench_state() -> Dict[str, Dict[str, object]]:
+    """전체 날짜 창 슬롯 상태 저장과 새 예약 가능 슬롯 탐지 (규모별)"""
+    from .state import StateManager
+    from .synthetic import SyntheticSite
+    
+    results = {}
+    for scale, params in SYNTHETIC_SCALES.items():
+        previous_slots = SyntheticSite(seed=1, **params).slot_states()
+        current_slots = SyntheticSite(seed=2, **params).slot_states()
+        
+        with tempfile.TemporaryDirectory(prefix="zeroworld-bench-") as scratch_dir, _quiet_checker_logs():
+            manager = StateManager(Path(scratch_dir) / "state.json")
+            results[f'update_slots[{scale}]'] = measure(lambda: manager.update_slots(current_slots))
+            manager.update_slots(previous_slots)
+            results[f'find_new_available_slots[{scale}]'] = measure(
+                lambda: manager.find_new_available_slots(current_slots)
+            )
+    return results
+
+
+# 이름 → 벤치마크 함수
+BENCHMARKS: Dict[str, Callable[[], Dict[str, Dict[str, object]]]] = {
+    'imports': bench_imports,
+    'extract': bench_extract,
+    'state': bench_state,
+}
+
+
+def load_baseline() -> Dict[str, float]:
+    """기준값 로드 (측정 항목 → median 초)"""
+    if not BASELINE_FILE.exists():
+        return {}
+    with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results: Dict[str, Dict[str, object]]):
+    """현재 측정값을 기준값으로 저장 (기존 항목은 유지하고 덮어씀)"""
+    baseline = load_baseline()
+    baseline.update({name: round(result['median'], 6) for name, result in results.items()})
+    BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(baseline.items())), f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def find_regressions(results: Dict[str, Dict[str, object]], baseline: Dict[str, float],
+                     tolerance: float = REGRESSION_TOLERANCE) -> List[str]:
+    """기준값 대비 회귀 항목 설명 목록"""
+    regressions = []
+    for name, result in results.items():
+        heavy = result.get('heavy_modules')
+        if name == 'import_checker_main' and heavy:
+            regressions.append(f"{name}: 무거운 의존성이 임포트됨 ({', '.join(heavy)})")
+        
+        expected = baseline.get(name)
+        if expected and result['median'] > expected * tolerance:
+            regressions.append(
+                f"{name}: median {result['median'] * 1000:.2f}ms > 기준 {expected * 1000:.2f}ms x {tolerance}"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='제로월드 체커 성능 벤치마크')
+    parser.add_argument('names', nargs='*', help=f"실행할 벤치마크 ({', '.join(BENCHMARKS)})")
+    parser.add_argument('--update', action='store_true', help='현재 측정값으로 기준값 갱신')
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE, help='허용 배수')
+    args = parser.parse_args(argv)
+    
+    names = args.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {', '.join(unknown)}")
+    
+    results = {}
+    for name in names:
+        results.update(BENCHMARKS[name]())
+    
+    baseline = load_baseline()
+    print(f"{'항목':<40} {'min(ms)':>10} {'median(ms)':>12} {'기준(ms)':>10}")
+    for name, result in results.items():
+        expected = baseline.get(name)
+        expected_str = f"{expected * 1000:.2f}" if expected else "-"
+        print(f"{name:<40} {result['min'] * 1000:>10.2f} {result['median'] * 1000:>12.2f} {expected_str:>10}")
+    
+    if args.update:
+        save_baseline(results)
+        print(f"기준값 갱신: {BASELINE_FILE}")
+        return 0
+    
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ 성능 회귀 감지:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    
+    print("\n✅ 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,6 @@
 
 from pathlib import Path
 import os
-from datetime import datetime, timedelta
 
 # 텔레그램 봇 설정 (환경변수에서 읽기)
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "YOUR_BOT_TOKEN_HERE")
@@ -14,6 +13,10 @@ try:
     CHAT_ID = int(CHAT_ID_STR)
 except ValueError:
     CHAT_ID = 0  # 기본값 (설정 필요함을 알림)
+# 설정을 바꾸는 봇 명령(/watch, /unwatch, /interval, /branch)을 허용할 채팅 (TELEGRAM_CHAT_ID는 항상 허용, 쉼표 구분)
+ADMIN_CHAT_IDS = {CHAT_ID} | {int(value) for value in os.getenv("ADMIN_CHAT_IDS", "").split(",") if value.strip().lstrip("-").isdigit()}
+# 모니터링 대상으로 허용할 매장 호스트 (하위 도메인 포함, 쉼표 구분)
+ALLOWED_STORE_HOSTS = [host.strip().lower() for host in os.getenv("ALLOWED_STORE_HOSTS", "zerohongdae.com").split(",") if host.strip()]
 
 # --- 테마 설정 (동적) ---
 BRANCH_THEME_MAPPING = {
@@ -27,20 +30,53 @@ current_branch = os.getenv("RAILWAY_GIT_BRANCH", "main")
 
 # 현재 브랜치에 맞춰 테마 이름 동적 설정
 THEME_NAME = BRANCH_THEME_MAPPING.get(current_branch, "층간소음")
-# ---
 
-# --- 날짜 설정 (고정) ---
-today = datetime.now().date()
-DATE_START = today.strftime("%Y-%m-%d")  # 현재 날짜부터
+# 다중 모니터링 대상 (JSON 리스트, 비어 있으면 THEME_NAME 단일 대상)
+# 예: [{"theme": "층간소음"}, {"theme": "사랑하는감?", "chat_id": 123456789, "date_end": "2026-12-31"}]
+# 항목 키: theme(필수), store(매장 URL, 기본 BASE_URL), date_start, date_end(생략 시 롤링 창), chat_id
+WATCHLIST = os.getenv("WATCHLIST", "")
+
+# 구독자별 알림 필터 (JSON 리스트, 봇 /subscribe로 저장한 설정이 있으면 그쪽 우선)
+# 예: [{"chat_id": 123456789, "weekdays": ["sat", "sun"], "times": ["18:00-23:00"]},
+#      {"chat_id": 987654321, "themes": ["층간소음"], "date_start": "2026-11-07", "date_end": "2026-11-07"}]
+# 항목 키: chat_id(필수), name, themes, date_start, date_end, weekdays(mon~sun, 월~일, weekend, weekday), times(HH:MM-HH:MM)
+# 필터가 있는 채팅은 일치하는 슬롯만 받고, 구독자가 아닌 대상 채팅은 기존처럼 모든 슬롯을 받음
+SUBSCRIBERS = os.getenv("SUBSCRIBERS", "")
+# ---
 
-# 사용자가 요청한 대로, 모니터링 종료 날짜를 2025년 11월 17일로 고정합니다.
-DATE_END = "2025-11-17"
+# --- 날짜 설정 (롤링) ---
+# 오늘부터 DATE_WINDOW_DAYS일을 모니터링 (매 체크마다 오늘 기준으로 다시 계산)
+DATE_WINDOW_DAYS = int(os.getenv("DATE_WINDOW_DAYS", "30"))
 # ---
 
 # 시간 설정
 TIMEZONE = "Asia/Seoul"
 RUN_HOURS = range(0, 24)  # 24시간 무제한 모니터링
 CHECK_INTERVAL_MINUTES = 1
+# 봇 /interval 명령으로 바꿀 수 있는 기본 간격 범위(초)
+MIN_CHECK_INTERVAL_SECONDS = 10
+MAX_CHECK_INTERVAL_SECONDS = 3600
+
+# 적응형 체크 간격 (버스트 폴링)
+# 슬롯 상태 변경 직후나 예약 오픈 시각 전후에는 BURST_INTERVAL_SECONDS 간격으로 체크한 뒤
+# 점차 CHECK_INTERVAL_MINUTES로 복귀 (ADAPTIVE_INTERVAL=1 로 활성화)
+ADAPTIVE_INTERVAL = os.getenv("ADAPTIVE_INTERVAL", "").lower() in ("1", "true", "yes")
+BURST_INTERVAL_SECONDS = int(os.getenv("BURST_INTERVAL_SECONDS", "15"))
+BURST_WINDOW_SECONDS = int(os.getenv("BURST_WINDOW_SECONDS", "300"))
+# 예약 오픈 시각 (HH:MM, 쉼표 구분, 예: "10:00,22:00")
+RELEASE_TIMES = [t.strip() for t in os.getenv("RELEASE_TIMES", "").split(",") if t.strip()]
+RELEASE_WINDOW_SECONDS = int(os.getenv("RELEASE_WINDOW_SECONDS", "120"))
+# 사이트 부하 제한용 시간당 최대 HTTP 요청 수
+MAX_REQUESTS_PER_HOUR = int(os.getenv("MAX_REQUESTS_PER_HOUR", "3000"))
+
+# 런타임 설정
+# PREFETCH=1 이면 다음 체크의 스윕을 체크 시각 직전에 끝나도록 미리 시작 (파이프라인 모드, 요청 수는 동일)
+PREFETCH = os.getenv("PREFETCH", "").lower() in ("1", "true", "yes")
+PREFETCH_MARGIN_SECONDS = float(os.getenv("PREFETCH_MARGIN_SECONDS", "1"))  # 예상 완료 시각과 체크 시각 사이 여유
+# ASYNC_RUNTIME=1 이면 슬롯 체크, 상태 메시지, 봇 polling, 알림을 하나의 asyncio 이벤트 루프에서 실행
+ASYNC_RUNTIME = os.getenv("ASYNC_RUNTIME", "").lower() in ("1", "true", "yes")
+# FAST_START=1 이면 시작 시 시스템 테스트 스윕을 생략하고 첫 체크로 대체 (텔레그램 테스트는 백그라운드)
+FAST_START = os.getenv("FAST_START", "").lower() in ("1", "true", "yes")
 
 # Railway 환경에서 한국 시간대 강제 설정
 if os.getenv("RAILWAY_ENVIRONMENT_NAME"):
@@ -59,9 +95,70 @@ else:
     STATE_FILE = Path("state.json")
     LOG_FILE = "checker.log"
 
+# 봇 명령(/watch, /unwatch, /interval)으로 바꾼 런타임 설정 (재배포 없이 유지)
+WATCHLIST_FILE = STATE_FILE.with_name("watchlist.json")
+# 봇 명령(/subscribe, /unsubscribe)으로 바꾼 구독자 필터
+SUBSCRIBERS_FILE = STATE_FILE.with_name("subscribers.json")
+# 매장별 세션 쿠키와 CSRF 토큰 (재시작 후에도 유효 시간 안이면 재사용)
+SESSION_FILE = STATE_FILE.with_name("sessions.json")
+SESSION_MAX_AGE_SECONDS = float(os.getenv("SESSION_MAX_AGE_SECONDS", "5400"))  # 사이트 세션 수명(120분)보다 짧게
+# --profile 보고서 저장 위치
+PROFILE_DIR = STATE_FILE.with_name("profiles")
+# 응답 기록/재생 코퍼스 디렉터리 (RECORD_DIR: 실제 응답 저장, REPLAY_DIR: 저장된 응답으로 오프라인 실행)
+RECORD_DIR = os.getenv("RECORD_DIR", "")
+REPLAY_DIR = os.getenv("REPLAY_DIR", "")
+
 # HTTP 요청 설정
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 REQUEST_TIMEOUT = 10
+# HTTP 클라이언트: requests(HTTP/1.1) 또는 httpx (h2가 설치되어 있고 서버가 지원하면 HTTP/2로 모든 날짜 요청을 한 연결에 다중화)
+FETCH_HTTP_CLIENT = os.getenv("FETCH_HTTP_CLIENT", "requests").lower()
+FETCH_HTTP2 = os.getenv("FETCH_HTTP2", "true").lower() in ("1", "true", "yes")
+# httpx 클라이언트에서 매장별로 동시에 보낼 날짜 요청 수 (HTTP/2면 한 연결에 다중화, requests는 항상 순차)
+FETCH_DATE_CONCURRENCY = max(1, int(os.getenv("FETCH_DATE_CONCURRENCY", "4")))
+# 체크 1회의 마감 시간(초) - 초과 시 끝나지 않은 날짜는 stale로 처리하고 이전 상태 유지
+CHECK_DEADLINE_SECONDS = float(os.getenv("CHECK_DEADLINE_SECONDS", "45"))
+
+# 예약 페이지 조건부 요청 캐시 (ETag/Last-Modified, 서버가 검증자를 보내지 않으면 자동으로 꺼짐)
+HTTP_CACHE = os.getenv("HTTP_CACHE", "true").lower() in ("1", "true", "yes")
+HTTP_CACHE_PROBE_RESPONSES = int(os.getenv("HTTP_CACHE_PROBE_RESPONSES", "10"))  # 검증자 확인에 쓰는 응답 수
+HTTP_CACHE_MAX_ENTRIES = 256  # 보관할 최대 URL 수
+
+# 서킷 브레이커 (연속 실패 시 남은 날짜 요청을 건너뛰고 지수 백오프로 재시도)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+CIRCUIT_BACKOFF_BASE_SECONDS = float(os.getenv("CIRCUIT_BACKOFF_BASE_SECONDS", "30"))
+CIRCUIT_BACKOFF_MAX_SECONDS = float(os.getenv("CIRCUIT_BACKOFF_MAX_SECONDS", "600"))
+
+# 요청 속도 제한 (토큰 버킷, 모든 사이트 HTTP 요청에 공통 적용)
+RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "2"))  # 초당 토큰 보충량 (0 이하면 비활성화)
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "4"))  # 버킷 최대 토큰 수
+RATE_LIMIT_JITTER_SECONDS = float(os.getenv("RATE_LIMIT_JITTER_SECONDS", "0.2"))  # 요청마다 추가하는 무작위 지연 상한
+
+# 로컬 HTTP 서버 (/metrics Prometheus 메트릭, 0이면 비활성화)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+# 같은 서버의 /events 슬롯 변경 이벤트 스트림 (Server-Sent Events)
+EVENT_BUFFER_SIZE = int(os.getenv("EVENT_BUFFER_SIZE", "500"))  # 재연결 클라이언트에 다시 보낼 수 있는 최근 이벤트 수
+EVENT_HEARTBEAT_SECONDS = 15  # 이벤트가 없을 때 keep-alive 주석 간격
+
+# 슬롯 오픈 감지 지연 (직전 조회 → 텔레그램 전송 확인) 추적 및 SLO
+LATENCY_WINDOW_EVENTS = int(os.getenv("LATENCY_WINDOW_EVENTS", "500"))  # 백분위 계산에 쓰는 최근 이벤트 수
+LATENCY_SLO = os.getenv("LATENCY_SLO", "p95=180")  # 예: "p50=60,p95=180,p99=300" (비우면 알림 없음)
+LATENCY_SLO_MIN_EVENTS = int(os.getenv("LATENCY_SLO_MIN_EVENTS", "5"))  # SLO 판정에 필요한 최소 이벤트 수
+LATENCY_ALERT_COOLDOWN_SECONDS = 3600  # SLO 위반 알림 최소 간격
+
+# 자원 감시 (체크마다 RSS/파일 디스크립터/스레드 샘플링, 한도를 연속으로 넘으면 상태 저장 후 재시작, 0이면 검사 안 함)
+WATCHDOG_MAX_RSS_MB = float(os.getenv("WATCHDOG_MAX_RSS_MB", "450"))
+WATCHDOG_MAX_FDS = int(os.getenv("WATCHDOG_MAX_FDS", "800"))
+WATCHDOG_MAX_THREADS = int(os.getenv("WATCHDOG_MAX_THREADS", "100"))
+WATCHDOG_BREACH_CHECKS = int(os.getenv("WATCHDOG_BREACH_CHECKS", "3"))  # 재시작 전 연속 초과 횟수
+WATCHDOG_WARMUP_CHECKS = 5  # 기준선을 잡기 전 건너뛰는 체크 수
+WATCHDOG_REPORT_EVERY = int(os.getenv("WATCHDOG_REPORT_EVERY", "60"))  # 추세 로그 간격 (체크 수)
+WATCHDOG_TRACEMALLOC = os.getenv("WATCHDOG_TRACEMALLOC", "").lower() in ("1", "true", "yes")  # 할당 증가 위치 추적
+
+# 체크 파이프라인 트레이싱 (TRACE_FILE이 비어 있으면 꺼짐)
+TRACE_FILE = os.getenv("TRACE_FILE", "")
+TRACE_FORMAT = os.getenv("TRACE_FORMAT", "jsonl")  # jsonl 또는 chrome (Chrome trace-event 형식)
 
 # 제로월드 URL 설정
 BASE_URL = "https://zerohongdae.com"
@@ -74,4 +171,12 @@ LOG_RETENTION = "5 days"
 
 # 알림 설정
 MAX_NOTIFICATION_SLOTS = 10
-NOTIFICATION_COOLDOWN = 300
\ No newline at end of file
+NOTIFICATION_COOLDOWN = 300
+
+# 텔레그램 전송 우선순위 (슬롯 알림 > 봇 응답 > 오류 > 상태)
+TELEGRAM_SEND_RATE_PER_MINUTE = float(os.getenv("TELEGRAM_SEND_RATE_PER_MINUTE", "20"))  # 전체 전송 속도 (그룹 채팅 한도)
+TELEGRAM_SEND_BURST = int(os.getenv("TELEGRAM_SEND_BURST", "5"))  # 연속 전송 허용량
+TELEGRAM_SLOT_RESERVE = int(os.getenv("TELEGRAM_SLOT_RESERVE", "2"))  # 슬롯 알림용으로 남겨 두는 토큰 (하위 레인은 사용 불가)
+TELEGRAM_REPLY_MAX_WAIT = float(os.getenv("TELEGRAM_REPLY_MAX_WAIT", "5"))  # 봇 응답이 양보하며 기다리는 최대 시간(초)
+TELEGRAM_SLOT_RETRY_MAX_WAIT = 30  # 슬롯 알림이 RetryAfter를 기다렸다 재전송하는 최대 대기(초)
+TELEGRAM_MAX_DEFERRED = 20  # 보류할 수 있는 하위 레인 메시지 수
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+슬롯 변경 이벤트 스트림 모듈
+
+diff가 계산되는 즉시 대상별 열린/닫힌 슬롯을 이벤트로 발행하고, 로컬 서버의 /events 경로가
+Server-Sent Events로 밀어 준다. 다른 도구가 state.json을 주기적으로 읽는 대신 구독하면 된다.
+
+    curl -N http://127.0.0.1:9108/events
+    id: 3f9a1c-42
+    event: opened
+    data: {"target": "층간소음@zerohongdae.com", "theme": "층간소음", "slots": ["2026-11-07 19:00:00"], ...}
+
+최근 EVENT_BUFFER_SIZE개 이벤트를 보관하므로 다시 연결한 클라이언트는 Last-Event-ID 헤더
+(또는 ?last_event_id=)로 놓친 이벤트를 이어 받는다. 이벤트 ID는 프로세스 실행마다 다른 접두어를 가지며,
+다른 실행의 ID이거나 버퍼에서 이미 밀려난 ID면 reset 이벤트를 먼저 보낸다 (state.json을 한 번 다시 읽고 이어서 구독).
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from loguru import logger
+
+from .config import EVENT_BUFFER_SIZE, EVENT_HEARTBEAT_SECONDS
+from .metrics import get_registry
+
+EVENTS_PUBLISHED_TOTAL = get_registry().counter(
+    "zeroworld_events_published_total",
+    "발행한 슬롯 변경 이벤트 수",
+    ("type",),
+)
+EVENT_STREAM_CLIENTS = get_registry().gauge(
+    "zeroworld_event_stream_clients",
+    "연결된 이벤트 스트림 클라이언트 수",
+)
+
+# 연결이 끊긴 클라이언트가 다시 연결하기 전 기다릴 시간 (EventSource retry, 밀리초)
+RECONNECT_MILLISECONDS = 3000
+
+
+class SlotEvent:
+    """대상 하나의 슬롯 변경 (열림 또는 닫힘)"""
+    
+    __slots__ = ('seq', 'type', 'data')
+    
+    def __init__(self, seq: int, event_type: str, data: Dict[str, Any]):
+        self.seq = seq
+        self.type = event_type
+        self.data = data
+
+
+class EventBroker:
+    """슬롯 변경 이벤트 발행 및 재전송 버퍼 (크기 제한)"""
+    
+    def __init__(self, buffer_size: int = EVENT_BUFFER_SIZE):
+        # 이벤트 ID 접두어 (다른 실행의 Last-Event-ID를 구분)
+        self.run_id = os.urandom(3).hex()
+        self._events: "deque[SlotEvent]" = deque(maxlen=buffer_size)
+        self._seq = 0
+        self._closed = False
+        self._clients = 0
+        self._condition = threading.Condition()
+    
+    def event_id(self, event: SlotEvent) -> str:
+        return f"{self.run_id}-{event.seq}"
+    
+    def publish(self, target, opened: List[str], closed: List[str]):
+        """diff 결과 발행 (변경이 없는 종류는 건너뜀)"""
+        detected_at = datetime.now().isoformat(timespec='seconds')
+        with self._condition:
+            for event_type, slots in (('opened', opened), ('closed', closed)):
+                if not slots:
+                    continue
+                self._seq += 1
+                self._events.append(SlotEvent(self._seq, event_type, {
+                    'target': target.key,
+                    'theme': target.theme,
+                    'store': target.store,
+                    'slots': sorted(slots),
+                    'detected_at': detected_at,
+                }))
+                EVENTS_PUBLISHED_TOTAL.inc(type=event_type)
+            self._condition.notify_all()
+    
+    def resume_point(self, last_event_id: Optional[str]) -> Tuple[int, bool]:
+        """
+        Last-Event-ID → 이어서 보낼 기준 seq
+        
+        Returns:
+            tuple: (이 seq 다음부터 전송, 놓친 이벤트를 재전송할 수 없어 reset이 필요한지)
+        """
+        with self._condition:
+            if not last_event_id:
+                # 새 구독자는 지금 이후 이벤트만 받음
+                return self._seq, False
+            
+            run_id, _, seq_text = last_event_id.partition('-')
+            if run_id != self.run_id or not seq_text.isdigit() or int(seq_text) > self._seq:
+                return self._seq, True
+            seq = int(seq_text)
+            oldest = self._events[0].seq if self._events else self._seq + 1
+            # 버퍼에서 이미 밀려난 이벤트가 있으면 재전송 불가
+            return seq, seq + 1 < oldest
+    
+    def wait(self, after_seq: int, timeout: float) -> Optional[List[SlotEvent]]:
+        """
+        after_seq 이후 이벤트를 기다려 반환 (타임아웃이면 빈 리스트, 브로커가 닫혔으면 None)
+        """
+        with self._condition:
+            if self._seq <= after_seq and not self._closed:
+                self._condition.wait(timeout)
+            if self._closed:
+                return None
+            return [event for event in self._events if event.seq > after_seq]
+    
+    def count_client(self, delta: int):
+        """연결된 스트림 클라이언트 수 증감"""
+        with self._condition:
+            self._clients += delta
+            EVENT_STREAM_CLIENTS.set(self._clients)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {'clients': self._clients, 'buffered': len(self._events), 'last_seq': self._seq}
+    
+    def close(self):
+        """스트림 종료 (서버 중지 시 연결된 클라이언트를 깨워 응답을 끝냄)"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+    
+    def reopen(self):
+        """서버를 다시 시작할 때 스트림 재개"""
+        with self._condition:
+            self._closed = False
+
+
+def format_sse(event_type: str, data: Dict[str, Any], event_id: Optional[str] = None) -> bytes:
+    """SSE 메시지 한 개"""
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return ("\n".join(lines) + "\n\n").encode('utf-8')
+
+
+def events_route(request: BaseHTTPRequestHandler):
+    """/events - 슬롯 변경 Server-Sent Events 스트림 (응답을 직접 작성)"""
+    broker = get_event_broker()
+    query = parse_qs(urlparse(request.path).query)
+    last_event_id = request.headers.get('Last-Event-ID') or query.get('last_event_id', [None])[0]
+    after_seq, reset = broker.resume_point(last_event_id)
+    
+    request.send_response(200)
+    request.send_header("Content-Type", "text/event-stream; charset=utf-8")
+    request.send_header("Cache-Control", "no-cache")
+    request.send_header("X-Accel-Buffering", "no")
+    request.end_headers()
+    # 응답 길이를 알 수 없으므로 스트림이 끝나면 연결도 닫음
+    request.close_connection = True
+    
+    broker.count_client(1)
+    logger.info(f"📡 이벤트 스트림 연결: {request.address_string()} (Last-Event-ID: {last_event_id or '없음'})")
+    try:
+        request.wfile.write(f"retry: {RECONNECT_MILLISECONDS}\n\n".encode('utf-8'))
+        if reset:
+            request.wfile.write(format_sse('reset', {
+                'reason': '재전송할 수 없는 이벤트가 있습니다 - state.json을 다시 읽은 뒤 이어서 구독하세요',
+                'last_event_id': last_event_id,
+            }))
+        request.wfile.flush()
+        
+        while True:
+            events = broker.wait(after_seq, EVENT_HEARTBEAT_SECONDS)
+            if events is None:
+                break
+            if events:
+                request.wfile.write(b"".join(
+                    format_sse(event.type, event.data, broker.event_id(event)) for event in events
+                ))
+                after_seq = events[-1].seq
+            else:
+                # 끊긴 연결을 감지하고 프록시 유휴 타임아웃을 피하는 주석 줄
+                request.wfile.write(b": keep-alive\n\n")
+            request.wfile.flush()
+    except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+        pass
+    finally:
+        broker.count_client(-1)
+        logger.info(f"📡 이벤트 스트림 종료: {request.address_string()}")
+    return None
+
+
+# 전역 이벤트 브로커
+_event_broker: Optional[EventBroker] = None
+_event_broker_lock = threading.Lock()
+
+
+def get_event_broker() -> EventBroker:
+    """전역 이벤트 브로커 반환"""
+    global _event_broker
+    with _event_broker_lock:
+        if _event_broker is None:
+            _event_broker = EventBroker()
+    return _event_broker
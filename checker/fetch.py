@@ -8,34 +8,259 @@ HTML 전체 파싱으로 숨겨진 예약 데이터와 API 데이터를 조합
 import requests
 import json
 import datetime as dt
+import importlib.util
 import time
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Dict, List, Optional, Set, Tuple
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from .config import (
-    BASE_URL, RESERVATION_URL, THEME_NAME,
-    DATE_START, DATE_END, USER_AGENT, REQUEST_TIMEOUT
+    BASE_URL, THEME_NAME, USER_AGENT, REQUEST_TIMEOUT, CHECK_DEADLINE_SECONDS,
+    FETCH_HTTP_CLIENT, FETCH_HTTP2, FETCH_DATE_CONCURRENCY, SESSION_MAX_AGE_SECONDS, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_BACKOFF_BASE_SECONDS, CIRCUIT_BACKOFF_MAX_SECONDS
 )
+from .httpcache import get_http_cache
+from .latency import get_latency_tracker
+from .metrics import CIRCUIT_STATE, CIRCUIT_TRIPS_TOTAL, get_registry, stage_timer
+from .ratelimit import get_rate_limiter
+from .sessions import export_cookies, get_session_store, import_cookies
+from .tracing import span
+from .transport import current_time, get_transport
+from .targets import WatchTarget, default_target, group_by_store
+
+# 사이트(Laravel)가 CSRF 토큰/세션 만료 시 돌려주는 상태 코드
+CSRF_REJECTED_STATUS = 419
+
+# 네트워크 오류로 처리할 예외 (httpx 클라이언트 사용 시 httpx 예외 포함)
+NETWORK_ERRORS = (requests.exceptions.RequestException,)
+if FETCH_HTTP_CLIENT == 'httpx':
+    import httpx
+    NETWORK_ERRORS += (httpx.HTTPError,)
+
+
+class CircuitBreaker:
+    """
+    사이트 장애 시 요청을 차단하는 서킷 브레이커
+    
+    - closed: 정상. 연속 실패가 임계값에 도달하면 open
+    - open: 요청 차단. 백오프 시간이 지나면 half_open
+    - half_open: 탐색 요청 1건만 허용. 성공하면 closed, 실패하면 백오프를 두 배로 늘려 다시 open
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    # 메트릭 게이지 값
+    STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+    
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 backoff_base: float = CIRCUIT_BACKOFF_BASE_SECONDS,
+                 backoff_max: float = CIRCUIT_BACKOFF_MAX_SECONDS, store: str = BASE_URL):
+        self.store = store
+        self.failure_threshold = max(1, failure_threshold)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.trip_count = 0  # 복구 없이 연속으로 열린 횟수 (백오프 지수)
+        self._retry_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    def _current_backoff(self) -> float:
+        return min(self.backoff_max, self.backoff_base * (2 ** max(0, self.trip_count - 1)))
+    
+    def seconds_until_retry(self) -> float:
+        """다음 탐색 요청까지 남은 시간(초)"""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self._retry_at - time.monotonic())
+    
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (half_open 전환 시 탐색 요청 1건 허용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            
+            if self.state == self.OPEN:
+                if time.monotonic() < self._retry_at:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+                logger.info("🔌 서킷 half-open: 탐색 요청 시도")
+            
+            # half_open: 동시에 하나의 탐색 요청만 허용
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+    
+    def record_success(self):
+        """요청 성공 기록"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("🔌 서킷 closed: 사이트 응답 정상화")
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.trip_count = 0
+            self._probe_in_flight = False
+    
+    def release_probe(self):
+        """탐색 요청을 보내지 않고 끝난 경우 탐색 차례 반납 (half_open 유지)"""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record_failure(self):
+        """요청 실패 기록"""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.trip_count += 1
+                CIRCUIT_TRIPS_TOTAL.inc(store=self.store)
+                backoff = self._current_backoff()
+                self.state = self.OPEN
+                self._retry_at = time.monotonic() + backoff
+                logger.warning(
+                    f"🔌 서킷 open: 연속 {self.consecutive_failures}회 실패, "
+                    f"{backoff:.0f}초 후 재시도 ({self.trip_count}회째)"
+                )
+
+
+# 매장별 서킷 브레이커 (체크마다 새 fetcher가 만들어져도 상태 유지)
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(store: str = BASE_URL) -> CircuitBreaker:
+    """매장(base URL)별 서킷 브레이커 반환"""
+    with _circuit_breakers_lock:
+        if store not in _circuit_breakers:
+            _circuit_breakers[store] = CircuitBreaker(store=store)
+        return _circuit_breakers[store]
+
+
+def _collect_circuit_metrics():
+    """/metrics 출력 직전 매장별 서킷 상태 게이지 갱신"""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    for breaker in breakers:
+        CIRCUIT_STATE.set(CircuitBreaker.STATE_VALUES[breaker.state], store=breaker.store)
+
+
+get_registry().add_collector(_collect_circuit_metrics)
+
+
+def create_session(base_url: str, reservation_url: str):
+    """
+    HTTP 세션 생성 (FETCH_HTTP_CLIENT에 따라 requests.Session 또는 httpx.Client)
+    
+    Accept-Encoding은 직접 지정하지 않는다. 두 클라이언트 모두 설치된 디코더 기준으로
+    (gzip, deflate + brotli/zstandard가 있으면 br, zstd) 풀 수 있는 형식만 광고한다.
+    """
+    headers = {
+        'User-Agent': USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+        'Origin': base_url,
+        'Referer': reservation_url
+    }
+    
+    if FETCH_HTTP_CLIENT == 'httpx':
+        # HTTP/2는 h2 패키지가 있어야 하고, 서버가 ALPN으로 h2를 고르지 않으면 HTTP/1.1로 동작
+        http2 = FETCH_HTTP2 and importlib.util.find_spec("h2") is not None
+        return httpx.Client(http2=http2, headers=headers, follow_redirects=True)
+    
+    session = requests.Session()
+    session.headers.update(headers)
+    return session
+
+
+def http_version(response) -> str:
+    """응답의 HTTP 버전 (httpx는 http_version, requests는 urllib3 raw.version)"""
+    version = getattr(response, 'http_version', None)
+    if version:
+        return version
+    raw_version = getattr(getattr(response, 'raw', None), 'version', None)
+    if isinstance(raw_version, int):
+        return f"HTTP/{raw_version // 10}.{raw_version % 10}"
+    return "unknown"
 
 
 class ZeroworldFetcher:
     """제로월드 예약 정보 가져오기 클래스"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Origin': BASE_URL,
-            'Referer': RESERVATION_URL
-        })
+    def __init__(self, base_url: str = BASE_URL):
+        self.base_url = base_url.rstrip('/')
+        self.reservation_url = f"{self.base_url}/reservation"
         
-        # CSRF 토큰과 초기 HTML 가져오기
+        self.session = create_session(self.base_url, self.reservation_url)
+        
+        # 모든 요청에 공통 적용되는 토큰 버킷 리미터
+        self.rate_limiter = get_rate_limiter()
+        # 예약 페이지 조건부 요청 캐시 (fetcher 간 공유)
+        self.http_cache = get_http_cache()
+        # 재시작 후에도 이어 쓰는 세션 쿠키/CSRF 토큰 저장소
+        self.session_store = get_session_store()
+        
+        # 마지막 get_theme_data의 요청 시작/응답 수신 시각 (감지 지연 추적용, 날짜를 동시에 요청하므로 스레드별)
+        self._request_times = threading.local()
+        # 동시 날짜 요청 중 세션 재초기화는 한 스레드만
+        self._session_lock = threading.Lock()
+        
+        # CSRF 토큰 (저장된 세션이 유효하면 이어 쓰고, 아니면 초기 HTML에서 가져오기)
         self.csrf_token = None
-        self._initialize_session()
+        self.csrf_issued_at = 0.0
+        # 마지막으로 초기화 GET이 성공한 시각 (monotonic, 서킷 성공 집계용)
+        self.session_initialized_at = 0.0
+        if not self._resume_session():
+            self._initialize_session()
+    
+    @property
+    def last_request_start(self) -> float:
+        return getattr(self._request_times, 'start', 0.0)
+    
+    @last_request_start.setter
+    def last_request_start(self, value: float):
+        self._request_times.start = value
+    
+    @property
+    def last_response_received(self) -> float:
+        return getattr(self._request_times, 'received', 0.0)
+    
+    @last_response_received.setter
+    def last_response_received(self, value: float):
+        self._request_times.received = value
+    
+    def _request(self, method: str, url: str, stage: Optional[str] = None, **kwargs) -> requests.Response:
+        """
+        속도 제한을 거쳐 현재 전송 계층(실시간/기록/재생)으로 HTTP 요청 전송
+        
+        stage가 있으면 토큰 대기를 뺀 요청 시간을 메트릭에 기록한다. 재생 중에는 속도 제한을 건너뛴다.
+        """
+        transport = get_transport()
+        if transport.live:
+            waited = self.rate_limiter.acquire()
+            if waited >= 1.0:
+                logger.debug(f"요청 토큰 대기: {waited:.2f}초 ({method} {url})")
+        if stage is None:
+            return transport.request(self.session, method, url, **kwargs)
+        with span(stage, method=method, url=url) as current, stage_timer(stage):
+            response = transport.request(self.session, method, url, **kwargs)
+            current.set(
+                status=response.status_code, http_version=http_version(response),
+                content_encoding=response.headers.get('Content-Encoding', 'identity'),
+            )
+            return response
+    
+    def close(self):
+        """HTTP 세션(연결 풀) 닫기"""
+        self.session.close()
     
     def _time_to_timestamp(self, date_str: str, time_str: str) -> int:
         """날짜와 시간을 타임스탬프로 변환"""
@@ -90,11 +315,11 @@ class ZeroworldFetcher:
                 logger.debug(f"특별 제외 슬롯: {date_str} {time_str}")
                 return False
             
-            # ⚠️ 추가 검증: 현재 시간보다 과거인 슬롯은 무조건 매진 처리
+            # ⚠️ 추가 검증: 현재 시간보다 과거인 슬롯은 무조건 매진 처리 (재생 중에는 기록 시각 기준)
             from datetime import datetime
             try:
                 slot_datetime = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
-                if slot_datetime < datetime.now():
+                if slot_datetime < current_time():
                     logger.debug(f"과거 시간대로 매진 처리: {date_str} {time_str}")
                     return False
             except:
@@ -120,8 +345,14 @@ class ZeroworldFetcher:
     def _initialize_session(self):
         """세션 초기화 및 CSRF 토큰 획득"""
         try:
-            response = self.session.get(RESERVATION_URL, timeout=REQUEST_TIMEOUT)
+            response = self._request('GET', self.reservation_url, stage='session_init', timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
+            if get_transport().live:
+                logger.info(
+                    f"HTTP 클라이언트: {FETCH_HTTP_CLIENT} ({http_version(response)}), "
+                    f"Accept-Encoding: {self.session.headers.get('Accept-Encoding')}, "
+                    f"응답 압축: {response.headers.get('Content-Encoding', '없음')}"
+                )
             
             soup = BeautifulSoup(response.text, 'html.parser')
             csrf_meta = soup.find('meta', {'name': 'csrf-token'})
@@ -136,17 +367,119 @@ class ZeroworldFetcher:
             else:
                 logger.warning("CSRF 토큰을 찾을 수 없습니다")
                 self.csrf_token = None
+            
+            if self.csrf_token:
+                self.csrf_issued_at = time.time()
+                self.session_initialized_at = time.monotonic()
+                self.persist_session()
                 
         except Exception as e:
             logger.error(f"세션 초기화 실패: {e}")
             self.csrf_token = None
     
-    def get_theme_data(self, date: str) -> Optional[Tuple[Dict, Dict]]:
+    def _renew_session(self, rejected_token: Optional[str]) -> bool:
+        """
+        거부된(또는 없는) 토큰 대신 새 세션 초기화 (토큰이 있으면 True)
+        
+        날짜를 동시에 요청하다 여러 스레드가 함께 거부되면 한 스레드만 초기화하고,
+        나머지는 그 사이 바뀐 토큰으로 재시도한다.
+        """
+        with self._session_lock:
+            if self.csrf_token == rejected_token:
+                if rejected_token:
+                    self.session_store.discard(self.base_url)
+                    self.session.cookies.clear()
+                self._initialize_session()
+            return bool(self.csrf_token)
+    
+    def _resume_session(self) -> bool:
+        """저장된 세션 쿠키와 CSRF 토큰 복원 (실시간 전송 계층에서만, 유효하면 True)"""
+        if not get_transport().live:
+            return False
+        saved = self.session_store.load(self.base_url)
+        if saved is None:
+            return False
+        
+        restored = import_cookies(self.session.cookies, saved['cookies'])
+        self.csrf_token = saved['csrf_token']
+        self.csrf_issued_at = saved['issued_at']
+        logger.info(
+            f"저장된 세션 재사용 ({self.base_url}, 쿠키 {restored}개, "
+            f"{(time.time() - self.csrf_issued_at) / 60:.0f}분 전 발급)"
+        )
+        return True
+    
+    def session_expired(self) -> bool:
+        """CSRF 토큰이 없거나 유효 시간이 지났는지"""
+        return not self.csrf_token or time.time() - self.csrf_issued_at > SESSION_MAX_AGE_SECONDS
+    
+    def persist_session(self):
+        """현재 세션 쿠키와 CSRF 토큰 저장 (바뀌지 않았으면 파일을 쓰지 않음)"""
+        if self.csrf_token and get_transport().live:
+            self.session_store.save(
+                self.base_url, self.csrf_token, self.csrf_issued_at, export_cookies(self.session.cookies)
+            )
+    
+    def _get_hidden_data(self, page_url: str, timeout: float) -> Optional[Dict]:
+        """
+        예약 페이지를 가져와 숨겨진 데이터 추출
+        
+        조건부 요청 캐시가 켜져 있으면 보관한 검증자를 보내고, 304면 파싱 없이 이전 결과를 사용한다.
+        """
+        cache = self.http_cache
+        conditional = cache.request_headers(page_url) if cache.enabled else None
+        page_response = self._request('GET', page_url, stage='html_get', timeout=timeout, headers=conditional)
+        
+        if page_response.status_code == 304:
+            hidden_data = cache.not_modified(page_url)
+            if hidden_data is not None:
+                logger.debug(f"HTML 페이지 변경 없음 (304): {page_url}")
+                return hidden_data
+            # 그 사이 캐시에서 밀려난 경우 조건 없이 다시 요청
+            page_response = self._request('GET', page_url, stage='html_get', timeout=timeout)
+        
+        if page_response.status_code != 200:
+            logger.error(f"HTML 페이지 가져오기 실패: {page_response.status_code}")
+            return None
+        
+        # 숨겨진 데이터 추출
+        with span('hidden_parse'), stage_timer('hidden_parse'):
+            hidden_data = self._extract_hidden_data(page_response.text)
+        if cache.enabled:
+            cache.store(page_url, page_response.headers, hidden_data)
+        return hidden_data
+    
+    def _post_theme(self, api_url: str, date: str, timeout: float):
+        """테마/시간표 API 호출 (현재 CSRF 토큰 사용)"""
+        # Ajax 요청용 헤더 설정
+        ajax_headers = {
+            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+            'X-Requested-With': 'XMLHttpRequest',
+            'X-CSRF-TOKEN': self.csrf_token,
+            'Accept': 'application/json, text/javascript, */*; q=0.01'
+        }
+        
+        data = {
+            'reservationDate': date,
+            'name': '',
+            'phone': '',
+            'paymentType': '1'
+        }
+        
+        return self._request(
+            'POST', api_url, stage='api_post',
+            data=data, 
+            headers=ajax_headers,
+            timeout=timeout
+        )
+    
+    def get_theme_data(self, date: str, timeout: float = REQUEST_TIMEOUT) -> Optional[Tuple[Dict, Dict]]:
         """
         특정 날짜의 테마 정보와 숨겨진 예약 데이터 가져오기
         
         Args:
             date: YYYY-MM-DD 형식의 날짜
+            timeout: 요청별 타임아웃(초)
             
         Returns:
             (API 데이터, 숨겨진 데이터) 튜플 또는 None
@@ -154,52 +487,36 @@ class ZeroworldFetcher:
         try:
             if not self.csrf_token:
                 logger.error("CSRF 토큰이 없습니다. 세션 재초기화...")
-                self._initialize_session()
-                if not self.csrf_token:
+                if not self._renew_session(None):
                     logger.error("CSRF 토큰을 가져올 수 없습니다")
                     return None
             
             # 1. HTML 페이지 전체 가져오기 (숨겨진 데이터 포함)
             logger.info(f"날짜 {date}의 HTML 페이지 가져오는 중...")
+            self.last_request_start = time.time()
             
-            # 예약 페이지에 날짜 파라미터 추가해서 접근
-            page_url = f"{RESERVATION_URL}?date={date}"
-            page_response = self.session.get(page_url, timeout=REQUEST_TIMEOUT)
-            
-            if page_response.status_code != 200:
-                logger.error(f"HTML 페이지 가져오기 실패: {page_response.status_code}")
+            # 예약 페이지에 날짜 파라미터 추가해서 접근 (검증자가 있으면 조건부 요청)
+            page_url = f"{self.reservation_url}?date={date}"
+            hidden_data = self._get_hidden_data(page_url, timeout)
+            if hidden_data is None:
                 return None
             
-            # 2. 숨겨진 데이터 추출
-            hidden_data = self._extract_hidden_data(page_response.text)
-            
             # 3. API 데이터 가져오기
             logger.info(f"날짜 {date}의 API 데이터 가져오는 중...")
             
-            api_url = f"{BASE_URL}/reservation/theme"
-            
-            # Ajax 요청용 헤더 설정
-            ajax_headers = {
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'X-Requested-With': 'XMLHttpRequest',
-                'X-CSRF-TOKEN': self.csrf_token,
-                'Accept': 'application/json, text/javascript, */*; q=0.01'
-            }
-            
-            data = {
-                'reservationDate': date,
-                'name': '',
-                'phone': '',
-                'paymentType': '1'
-            }
+            api_url = f"{self.reservation_url}/theme"
+            used_token = self.csrf_token
+            api_response = self._post_theme(api_url, date, timeout)
             
-            api_response = self.session.post(
-                api_url, 
-                data=data, 
-                headers=ajax_headers,
-                timeout=REQUEST_TIMEOUT
-            )
+            if api_response.status_code == CSRF_REJECTED_STATUS:
+                # 저장된 세션이 서버에서 만료된 경우 등 - 새 세션으로 한 번만 재시도
+                logger.warning("CSRF 토큰이 거부되었습니다 (419) - 세션 재초기화 후 재시도")
+                if not self._renew_session(used_token):
+                    logger.error("CSRF 토큰을 가져올 수 없습니다")
+                    return None
+                api_response = self._post_theme(api_url, date, timeout)
             
+            self.last_response_received = time.time()
             logger.info(f"API 요청: {api_url}, 날짜: {date}")
             logger.info(f"API 응답 상태: {api_response.status_code}")
             
@@ -226,7 +543,7 @@ class ZeroworldFetcher:
                 logger.debug(f"API 응답 내용: {api_response.text[:500]}")
                 return None
                 
-        except requests.exceptions.RequestException as e:
+        except NETWORK_ERRORS as e:
             logger.error(f"네트워크 오류: {e}")
             return None
         except Exception as e:
@@ -234,7 +551,7 @@ class ZeroworldFetcher:
             return None
     
     def extract_slots_from_data(self, api_data: Dict, hidden_data: Dict, 
-                               target_date: str) -> Dict[str, str]:
+                               target_date: str, theme_name: str = THEME_NAME) -> Dict[str, str]:
         """
         API 응답과 숨겨진 데이터를 조합하여 실제 슬롯 정보 추출
         
@@ -242,6 +559,7 @@ class ZeroworldFetcher:
             api_data: API 응답 데이터
             hidden_data: HTML에서 추출한 숨겨진 예약 데이터
             target_date: 대상 날짜
+            theme_name: 대상 테마 이름
             
         Returns:
             슬롯 정보 딕셔너리 {"2025-01-29 18:30": "예약가능"}
@@ -275,7 +593,7 @@ class ZeroworldFetcher:
                 def simplify(text: str) -> str:
                     return re.sub(r'[^가-힣]', '', text)
 
-                simplified_target_name = simplify(THEME_NAME)
+                simplified_target_name = simplify(theme_name)
 
                 for theme in data_content:
                     if isinstance(theme, dict):
@@ -284,7 +602,7 @@ class ZeroworldFetcher:
                         
                         if simplified_target_name in simplified_theme_title:
                             theme_pk = theme.get('PK')
-                            logger.info(f"✅ '{THEME_NAME}' 테마 발견: '{theme_title}' (PK={theme_pk})")
+                            logger.info(f"✅ '{theme_name}' 테마 발견: '{theme_title}' (PK={theme_pk})")
                             break
             else:
                 logger.warning("🚨 API 응답에 'data' 필드가 없습니다!")
@@ -294,7 +612,7 @@ class ZeroworldFetcher:
                 # 해당 테마의 시간 슬롯 정보 가져오기
                 theme_times = api_data['times'].get(str(theme_pk), [])
                 
-                logger.debug(f"=== {target_date} {THEME_NAME} 테마 슬롯 처리 ===")
+                logger.debug(f"=== {target_date} {theme_name} 테마 슬롯 처리 ===")
                 logger.debug(f"총 슬롯 수: {len(theme_times)}")
                 logger.debug(f"숨겨진 데이터 키: {list(hidden_data.keys())}")
                 
@@ -316,9 +634,9 @@ class ZeroworldFetcher:
                         
                         logger.debug(f"  슬롯 {i+1}: {time_str} = {slot_status}")
                         
-                logger.info(f"'{THEME_NAME}' 슬롯 {len(slots)}개 추출 완료")
+                logger.info(f"'{theme_name}' 슬롯 {len(slots)}개 추출 완료")
             else:
-                logger.warning(f"'{THEME_NAME}' 테마를 찾을 수 없습니다")
+                logger.warning(f"'{theme_name}' 테마를 찾을 수 없습니다")
             
         except Exception as e:
             logger.error(f"슬롯 추출 중 오류: {e}")
@@ -326,81 +644,377 @@ class ZeroworldFetcher:
         return slots
 
 
-def get_slots(exclude_past_slots: bool = True) -> Dict[str, str]:
+def get_date_range() -> List[str]:
+    """기본 모니터링 대상의 날짜 목록 (YYYY-MM-DD)"""
+    return default_target().dates()
+
+
+def _store_dates(targets: List[WatchTarget]) -> List[str]:
+    """같은 매장 대상들의 날짜 합집합 (정렬)"""
+    dates = set()
+    for target in targets:
+        dates.update(target.dates())
+    return sorted(dates)
+
+
+def estimate_request_count(targets: Optional[List[WatchTarget]] = None) -> int:
     """
-    날짜 범위 내 지정된 테마의 모든 슬롯 상태 반환 (숨겨진 데이터 포함)
+    한 번의 스윕에 필요한 HTTP 요청 수 추정
     
-    Args:
-        exclude_past_slots: True면 현재 시간보다 과거인 슬롯 제외
+    매장마다 세션 초기화 최대 1회 + 날짜당 HTML/API 2회 (같은 매장 대상은 응답 공유)
+    """
+    targets = targets or [default_target()]
+    return sum(1 + 2 * len(_store_dates(group)) for group in group_by_store(targets).values())
+
+
+class SweepResult:
+    """
+    한 번의 스윕 결과 (대상별 슬롯)
     
-    Returns:
-        dict: {"2025-01-29 18:30": "예약가능", ...}
+    마감 시간이 지나면 그때까지 완료된 (매장, 날짜)의 슬롯만 담고,
+    끝나지 않은(또는 실패한) 날짜는 대상별 stale 날짜로 보고한다.
     """
-    fetcher = ZeroworldFetcher()
-    all_slots = {}
     
-    # 현재 시간 (시간 필터링용)
-    now = dt.datetime.now()
-    logger.info(f"현재 시간: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    def __init__(self, targets: List[WatchTarget], hot_dates: Optional[Set[str]] = None):
+        self.targets = list(targets)
+        # 스윕 마지막에 가져올 날짜 (프리페치에서 체크 시각에 가장 가깝게 가져오기 위함)
+        self.hot_dates = hot_dates or set()
+        self.slots: Dict[str, Dict[str, str]] = {target.key: {} for target in self.targets}
+        self.completed = set()  # 완료된 (매장, 날짜)
+        self.cancelled = False  # 마감 후 백그라운드 스윕이 더 이상 결과를 쓰지 않도록 표시
+        self._lock = threading.Lock()
     
-    # 날짜 범위 생성
-    start_date = dt.datetime.strptime(DATE_START, "%Y-%m-%d").date()
-    end_date = dt.datetime.strptime(DATE_END, "%Y-%m-%d").date()
+    def add_date(self, store: str, date_str: str, slots_by_target: Dict[str, Dict[str, str]]) -> bool:
+        """완료된 날짜의 대상별 슬롯 추가 (마감 이후면 무시하고 False 반환)"""
+        with self._lock:
+            if self.cancelled:
+                return False
+            for target_key, date_slots in slots_by_target.items():
+                self.slots[target_key].update(date_slots)
+            self.completed.add((store, date_str))
+            return True
     
-    current_date = start_date
-    while current_date <= end_date:
-        date_str = current_date.strftime("%Y-%m-%d")
-        logger.info(f"날짜 {date_str} 처리 중...")
-        
-        # 해당 날짜의 테마 데이터와 숨겨진 데이터 가져오기
-        result = fetcher.get_theme_data(date_str)
+    def snapshot(self) -> Dict[str, Tuple[Dict[str, str], List[str]]]:
+        """
+        현재까지의 결과를 확정하고 반환 (이후 추가 결과는 버림)
         
-        if result:
-            api_data, hidden_data = result
-            # 슬롯 정보 추출 (API + 숨겨진 데이터 조합)
-            date_slots = fetcher.extract_slots_from_data(api_data, hidden_data, date_str)
+        Returns:
+            dict: 대상 키 → (수집된 슬롯, stale 날짜 리스트)
+        """
+        with self._lock:
+            self.cancelled = True
+            return {
+                target.key: (
+                    dict(self.slots[target.key]),
+                    [d for d in target.dates() if (target.store, d) not in self.completed]
+                )
+                for target in self.targets
+            }
+
+
+def _filter_past_slots(date_str: str, date_slots: Dict[str, str], now: dt.datetime) -> Dict[str, str]:
+    """현재 시간보다 과거인 슬롯 제외"""
+    filtered_slots = {}
+    filtered_count = 0
+    
+    for slot_key, slot_status in date_slots.items():
+        try:
+            # 슬롯 시간 파싱
+            slot_datetime = dt.datetime.strptime(slot_key, "%Y-%m-%d %H:%M:%S")
             
-            # 시간 필터링 적용
-            if exclude_past_slots:
-                filtered_slots = {}
-                filtered_count = 0
-                
-                for slot_key, slot_status in date_slots.items():
-                    try:
-                        # 슬롯 시간 파싱
-                        slot_datetime = dt.datetime.strptime(slot_key, "%Y-%m-%d %H:%M:%S")
-                        
-                        # 현재 시간보다 미래인 슬롯만 포함
-                        if slot_datetime > now:
-                            filtered_slots[slot_key] = slot_status
-                        else:
-                            filtered_count += 1
-                            logger.debug(f"과거 슬롯 제외: {slot_key}")
-                            
-                    except ValueError as e:
-                        logger.warning(f"슬롯 시간 파싱 실패: {slot_key}, 오류: {e}")
-                        # 파싱 실패시 포함 (안전장치)
-                        filtered_slots[slot_key] = slot_status
-                
-                if filtered_count > 0:
-                    logger.info(f"날짜 {date_str}: {filtered_count}개 과거 슬롯 제외됨")
-                
-                all_slots.update(filtered_slots)
+            # 현재 시간보다 미래인 슬롯만 포함
+            if slot_datetime > now:
+                filtered_slots[slot_key] = slot_status
             else:
-                all_slots.update(date_slots)
-        else:
-            logger.warning(f"날짜 {date_str}의 데이터를 가져올 수 없습니다")
+                filtered_count += 1
+                logger.debug(f"과거 슬롯 제외: {slot_key}")
+                
+        except ValueError as e:
+            logger.warning(f"슬롯 시간 파싱 실패: {slot_key}, 오류: {e}")
+            # 파싱 실패시 포함 (안전장치)
+            filtered_slots[slot_key] = slot_status
+    
+    if filtered_count > 0:
+        logger.info(f"날짜 {date_str}: {filtered_count}개 과거 슬롯 제외됨")
+    
+    return filtered_slots
+
+
+# 체크 사이에 재사용하는 매장별 fetcher (세션/연결 풀을 체크마다 새로 만들지 않음)
+_idle_fetchers: Dict[str, ZeroworldFetcher] = {}
+_idle_fetchers_lock = threading.Lock()
+
+
+def _checkout_fetcher(store: str) -> ZeroworldFetcher:
+    """
+    매장의 대기 중인 fetcher를 꺼내거나 새로 생성
+    
+    마감 시간을 넘긴 이전 스윕이 아직 fetcher를 쓰고 있으면 새로 만든다 (세션을 스레드 간에 공유하지 않음).
+    재사용할 때는 CSRF 토큰이 유효 시간을 넘긴 경우에만 새로 받는다 (거부되면 get_theme_data가 재초기화).
+    """
+    with _idle_fetchers_lock:
+        fetcher = _idle_fetchers.pop(store.rstrip('/'), None)
+    if fetcher is None:
+        return ZeroworldFetcher(store)
+    if fetcher.session_expired():
+        fetcher._initialize_session()
+    return fetcher
+
+
+def _checkin_fetcher(fetcher: ZeroworldFetcher):
+    """스윕이 끝난 fetcher 반납 (세션 쿠키를 저장하고, 이미 대기 중인 fetcher가 있으면 닫음)"""
+    fetcher.persist_session()
+    with _idle_fetchers_lock:
+        if fetcher.base_url not in _idle_fetchers:
+            _idle_fetchers[fetcher.base_url] = fetcher
+            return
+    fetcher.close()
+
+
+def close_fetchers():
+    """대기 중인 모든 fetcher의 세션 닫기 (종료/재시작 전 정리)"""
+    with _idle_fetchers_lock:
+        fetchers = list(_idle_fetchers.values())
+        _idle_fetchers.clear()
+    for fetcher in fetchers:
+        fetcher.close()
+
+
+def _sweep_store(result: SweepResult, store: str, targets: List[WatchTarget],
+                 exclude_past_slots: bool, deadline: Optional[float]):
+    """
+    한 매장의 날짜들을 순회하며 대상별 슬롯을 기록
+    
+    날짜마다 HTML/API 응답은 한 번만 가져오고, 그 날짜를 포함하는 모든 대상에 대해 슬롯을 추출한다.
+    """
+    breaker = get_circuit_breaker(store)
+    if not breaker.allow_request():
+        logger.warning(f"🔌 서킷 open 상태 ({store}) - {breaker.seconds_until_retry():.0f}초 후 재시도, 이번 체크 건너뜀")
+        return
+    
+    checkout_started = time.monotonic()
+    fetcher = _checkout_fetcher(store)
+    # 이번 스윕에서 실제로 세션 초기화 GET이 성공했을 때만 서킷 성공으로 집계
+    # (저장/재사용한 토큰은 요청이 아니므로 get_theme_data 성공 시에만 집계)
+    if fetcher.csrf_token and fetcher.session_initialized_at >= checkout_started:
+        breaker.record_success()
+    try:
+        _sweep_dates(result, store, targets, fetcher, breaker, exclude_past_slots, deadline)
+    finally:
+        # 취소/마감으로 요청 없이 끝났으면 위에서 받은 탐색 차례를 반납 (half_open에 묶이지 않도록)
+        breaker.release_probe()
+        _checkin_fetcher(fetcher)
+
+
+def _sweep_dates(result: SweepResult, store: str, targets: List[WatchTarget], fetcher: ZeroworldFetcher,
+                 breaker: CircuitBreaker, exclude_past_slots: bool, deadline: Optional[float]):
+    """
+    _sweep_store 본체 (세션 확인 후 날짜 순회)
+    
+    httpx 클라이언트면 첫 날짜(half_open이면 탐색 요청)를 보낸 뒤 나머지 날짜를 FETCH_DATE_CONCURRENCY개씩
+    동시에 요청해 HTTP/2 연결 하나에 다중화한다. requests 세션은 스레드 간 공유가 안전하지 않아 순차로 요청한다.
+    """
+    if not fetcher.csrf_token:
+        breaker.record_failure()
+        logger.error(f"세션 초기화 실패로 이번 체크를 건너뜁니다 ({store})")
+        return
+    
+    # 현재 시간 (시간 필터링용, 재생 중에는 기록 시각)
+    now = current_time()
+    logger.info(f"현재 시간: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    target_dates = {target.key: set(target.dates()) for target in targets}
+    dates = _store_dates(targets)
+    if result.hot_dates:
+        dates = [d for d in dates if d not in result.hot_dates] + [d for d in dates if d in result.hot_dates]
+    
+    def sweep(date_str: str, first: bool) -> Optional[str]:
+        return _sweep_date(result, store, targets, target_dates, fetcher, breaker,
+                           exclude_past_slots, deadline, now, date_str, first)
+    
+    concurrency = 1 if isinstance(fetcher.session, requests.Session) else FETCH_DATE_CONCURRENCY
+    if concurrency <= 1 or len(dates) <= 1:
+        for index, date_str in enumerate(dates):
+            skipped = sweep(date_str, index == 0)
+            if skipped:
+                _log_skipped_dates(skipped, len(dates) - index)
+                break
+        return
+    
+    # 첫 날짜로 서킷/세션을 확인한 뒤 나머지를 동시에 요청 (마감/서킷은 날짜마다 다시 확인)
+    skipped = sweep(dates[0], True)
+    if skipped:
+        _log_skipped_dates(skipped, len(dates))
+        return
+    
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="date-sweep") as executor:
+        # 스레드마다 현재 span을 부모로 쓰도록 날짜별로 컨텍스트 복사
+        futures = [executor.submit(copy_context().run, sweep, date_str, False) for date_str in dates[1:]]
+        reasons = [future.result() for future in futures]
+    
+    for reason in ('deadline', 'circuit'):
+        count = reasons.count(reason)
+        if count:
+            _log_skipped_dates(reason, count)
+
+
+def _log_skipped_dates(reason: str, count: int):
+    """요청하지 않고 건너뛴 날짜 로그"""
+    if reason == 'deadline':
+        logger.warning(f"⏱️ 체크 마감 시간 초과 - 남은 {count}개 날짜 건너뜀")
+    elif reason == 'circuit':
+        logger.warning(f"🔌 서킷 open - 남은 {count}개 날짜 건너뜀")
+
+
+def _sweep_date(result: SweepResult, store: str, targets: List[WatchTarget], target_dates: Dict[str, Set[str]],
+                fetcher: ZeroworldFetcher, breaker: CircuitBreaker, exclude_past_slots: bool,
+                deadline: Optional[float], now: dt.datetime, date_str: str, first: bool) -> Optional[str]:
+    """
+    날짜 하나를 가져와 대상별 슬롯 기록
+    
+    Returns:
+        요청하지 않고 건너뛴 이유 ('cancelled', 'deadline', 'circuit'), 요청했으면 None
+    """
+    if result.cancelled:
+        return 'cancelled'
+    
+    # 마감 시간 확인 및 요청 타임아웃을 남은 시간으로 제한
+    timeout = REQUEST_TIMEOUT
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return 'deadline'
+        timeout = min(REQUEST_TIMEOUT, max(remaining, 0.5))
+    
+    # 첫 날짜는 _sweep_store에서 받은 허용(half_open이면 탐색 차례)으로 요청
+    if not first and not breaker.allow_request():
+        return 'circuit'
+    
+    logger.info(f"날짜 {date_str} 처리 중...")
+    
+    # 해당 날짜의 테마 데이터와 숨겨진 데이터 가져오기 (같은 매장 대상이 공유)
+    with span('get_theme_data', date=date_str) as date_span:
+        theme_data = fetcher.get_theme_data(date_str, timeout=timeout)
+        date_span.set(ok=theme_data is not None)
+    
+    if not theme_data:
+        breaker.record_failure()
+        logger.warning(f"날짜 {date_str}의 데이터를 가져올 수 없습니다")
+        return None
+    
+    breaker.record_success()
+    api_data, hidden_data = theme_data
+    
+    slots_by_target = {}
+    for target in targets:
+        if date_str not in target_dates[target.key]:
+            continue
+        # 슬롯 정보 추출 (API + 숨겨진 데이터 조합)
+        with span('extract_slots_from_data', date=date_str, target=target.key), stage_timer('extract'):
+            date_slots = fetcher.extract_slots_from_data(api_data, hidden_data, date_str, target.theme)
         
-        current_date += dt.timedelta(days=1)
+        # 시간 필터링 적용
+        if exclude_past_slots:
+            date_slots = _filter_past_slots(date_str, date_slots, now)
+        slots_by_target[target.key] = date_slots
+    
+    if result.add_date(store, date_str, slots_by_target):
+        get_latency_tracker().record_fetch(
+            store, date_str, fetcher.last_request_start, fetcher.last_response_received, time.time()
+        )
+    return None
+
+
+def _run_sweep(result: SweepResult, exclude_past_slots: bool = True, deadline: Optional[float] = None):
+    """
+    모든 대상의 날짜 범위를 매장별로 순회하며 결과를 SweepResult에 기록
     
-    total_slots = len(all_slots)
-    available_slots = len([s for s in all_slots.values() if s == "예약가능"])
+    Args:
+        result: 결과를 기록할 SweepResult
+        exclude_past_slots: True면 현재 시간보다 과거인 슬롯 제외
+        deadline: time.monotonic() 기준 마감 시각 (None이면 제한 없음)
+    """
+    limiter_before = get_rate_limiter().get_stats()
     
-    logger.info(f"총 {total_slots}개 슬롯 정보 수집 완료 (예약가능: {available_slots}개)")
+    for store, targets in group_by_store(result.targets).items():
+        if result.cancelled:
+            break
+        with span('sweep_store', store=store):
+            _sweep_store(result, store, targets, exclude_past_slots, deadline)
+    
+    for target in result.targets:
+        target_slots = result.slots[target.key]
+        available_slots = len([s for s in target_slots.values() if s == "예약가능"])
+        logger.info(f"'{target.theme}' 총 {len(target_slots)}개 슬롯 정보 수집 완료 (예약가능: {available_slots}개)")
     if exclude_past_slots:
         logger.info("⏰ 과거 슬롯 제외 필터링 적용됨")
     
-    return all_slots
+    limiter_after = get_rate_limiter().get_stats()
+    sweep_requests = limiter_after['requests'] - limiter_before['requests']
+    sweep_wait = limiter_after['total_wait'] - limiter_before['total_wait']
+    if sweep_requests:
+        logger.info(f"🪣 요청 {sweep_requests}회, 토큰 대기 합계 {sweep_wait:.2f}초 (최대 {limiter_after['max_wait']:.2f}초)")
+
+
+def get_slots(exclude_past_slots: bool = True) -> Dict[str, str]:
+    """
+    날짜 범위 내 지정된 테마의 모든 슬롯 상태 반환 (숨겨진 데이터 포함)
+    
+    Args:
+        exclude_past_slots: True면 현재 시간보다 과거인 슬롯 제외
+    
+    Returns:
+        dict: {"2025-01-29 18:30": "예약가능", ...}
+    """
+    target = default_target()
+    result = SweepResult([target])
+    _run_sweep(result, exclude_past_slots)
+    return result.slots[target.key]
+
+
+def collect_slots(targets: Optional[List[WatchTarget]] = None,
+                  deadline_seconds: float = CHECK_DEADLINE_SECONDS,
+                  exclude_past_slots: bool = True,
+                  hot_dates: Optional[Set[str]] = None) -> Dict[str, Tuple[Dict[str, str], List[str]]]:
+    """
+    마감 시간 내에 모든 대상의 슬롯 수집 (부분 결과 허용)
+    
+    스윕은 워커 스레드에서 실행되고, 마감 시각이 되면 어떤 날짜가 멈춰 있더라도
+    그때까지 완료된 결과만 반환한다. 워커는 다음 날짜 경계에서 스스로 종료한다.
+    
+    Args:
+        targets: 모니터링 대상 목록 (None이면 기본 대상)
+        deadline_seconds: 체크 마감 시간(초)
+        exclude_past_slots: True면 현재 시간보다 과거인 슬롯 제외
+        hot_dates: 매장별 날짜 순서에서 마지막으로 미룰 날짜
+    
+    Returns:
+        dict: 대상 키 → (수집된 슬롯, 마감까지 끝나지 않은 stale 날짜 리스트)
+    """
+    result = SweepResult(targets or [default_target()], hot_dates)
+    deadline = time.monotonic() + deadline_seconds
+    
+    with span('collect_slots', deadline_seconds=deadline_seconds) as collect_span:
+        # 워커 스레드에서도 현재 span을 부모로 사용하도록 컨텍스트 복사
+        worker = threading.Thread(
+            target=copy_context().run, args=(_run_sweep, result, exclude_past_slots, deadline),
+            name="slot-sweep", daemon=True
+        )
+        worker.start()
+        worker.join(timeout=deadline_seconds)
+        collect_span.set(partial=worker.is_alive())
+    
+    if worker.is_alive():
+        logger.warning(f"⏱️ 체크 마감 시간({deadline_seconds}초) 초과 - 부분 결과 사용")
+    
+    collected = result.snapshot()
+    for target_key, (_, stale_dates) in collected.items():
+        if stale_dates:
+            logger.warning(
+                f"[{target_key}] stale 날짜 {len(stale_dates)}개: "
+                f"{', '.join(stale_dates[:5])}{' ...' if len(stale_dates) > 5 else ''}"
+            )
+    return collected
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+예약 페이지 조건부 요청 캐시 모듈
+
+URL별로 응답 검증자(ETag, Last-Modified)와 그 응답을 파싱한 결과를 보관하고,
+다음 요청에 If-None-Match / If-Modified-Since를 붙인다. 304 응답이면 본문을 받지 않고
+보관한 파싱 결과를 그대로 사용하므로 HTML 파싱까지 건너뛴다.
+
+서버가 검증자를 보내지 않으면 처음 HTTP_CACHE_PROBE_RESPONSES개의 200 응답으로 이를 확인한 뒤
+스스로 꺼진다. 꺼진 뒤에는 fetcher가 enabled 플래그만 확인하므로 추가 비용이 없다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from loguru import logger
+
+from .config import HTTP_CACHE, HTTP_CACHE_PROBE_RESPONSES, HTTP_CACHE_MAX_ENTRIES
+from .metrics import get_registry
+
+HTTP_CACHE_TOTAL = get_registry().counter(
+    "zeroworld_http_cache_total",
+    "조건부 요청 결과 (hit: 304로 파싱 생략, miss: 본문 수신, uncacheable: 검증자 없음)",
+    ("result",),
+)
+
+
+class CacheEntry:
+    """URL 하나의 검증자와 파싱 결과"""
+    
+    __slots__ = ('etag', 'last_modified', 'value')
+    
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], value: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.value = value
+
+
+class ConditionalCache:
+    """URL별 검증자 캐시 (검증자를 보내지 않는 서버면 자동으로 꺼짐)"""
+    
+    def __init__(self, enabled: bool = HTTP_CACHE, probe_responses: int = HTTP_CACHE_PROBE_RESPONSES,
+                 max_entries: int = HTTP_CACHE_MAX_ENTRIES):
+        """
+        Args:
+            enabled: False면 처음부터 꺼짐
+            probe_responses: 검증자가 한 번도 없으면 이만큼의 200 응답 후 꺼짐
+            max_entries: 보관할 최대 URL 수 (오래 쓰지 않은 URL부터 삭제)
+        """
+        self.enabled = enabled
+        self.probe_responses = probe_responses
+        self.max_entries = max_entries
+        self.validators_seen = False
+        self._probed = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def request_headers(self, url: str) -> Optional[Dict[str, str]]:
+        """조건부 요청 헤더 (보관한 검증자가 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self._entries.move_to_end(url)
+        
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+    
+    def not_modified(self, url: str) -> Optional[Any]:
+        """304 응답 처리 - 보관한 파싱 결과 반환 (보관한 항목이 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return None
+        HTTP_CACHE_TOTAL.inc(result="hit")
+        return entry.value
+    
+    def store(self, url: str, headers, value: Any):
+        """200 응답의 검증자와 파싱 결과 보관 (검증자가 없으면 보관하지 않음)"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        
+        with self._lock:
+            if not etag and not last_modified:
+                # 검증자 없는 응답은 다음 요청에 쓸 수 없으므로 이전 항목도 버린다
+                self._entries.pop(url, None)
+                HTTP_CACHE_TOTAL.inc(result="uncacheable")
+                if not self.validators_seen:
+                    self._probed += 1
+                    if self._probed >= self.probe_responses:
+                        self.enabled = False
+                        self._entries.clear()
+                        logger.info(f"🗃️ 서버가 ETag/Last-Modified를 보내지 않아 조건부 요청 캐시를 끕니다 ({self._probed}개 응답 확인)")
+                return
+            
+            if not self.validators_seen:
+                self.validators_seen = True
+                logger.info(f"🗃️ 서버 검증자 확인 (ETag: {bool(etag)}, Last-Modified: {bool(last_modified)}) - 조건부 요청 사용")
+            HTTP_CACHE_TOTAL.inc(result="miss")
+            self._entries[url] = CacheEntry(etag, last_modified, value)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'validators_seen': self.validators_seen,
+                'entries': len(self._entries),
+            }
+
+
+# 전역 조건부 요청 캐시
+_http_cache: Optional[ConditionalCache] = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> ConditionalCache:
+    """전역 조건부 요청 캐시 반환"""
+    global _http_cache
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = ConditionalCache()
+    return _http_cache
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+슬롯 오픈 감지 지연 추적 모듈
+
+새로 예약 가능해진 슬롯(오픈 이벤트)마다 파이프라인 단계 시각을 기록한다.
+- request_start: 해당 날짜 요청 시작
+- response_received: HTML/API 응답 수신 완료
+- parse_done: 숨겨진 데이터 파싱 및 슬롯 추출 완료
+- diff_done: 이전 상태와 비교 완료
+- send_acked: 텔레그램 전송 확인
+
+사이트에서 슬롯이 열린 정확한 시각은 알 수 없으므로, 같은 날짜를 직전에 조회한 시각
+(그때는 닫혀 있었음)부터 전송 확인까지를 종단 간 감지 지연(상한)으로 본다.
+직전 조회 기록이 없는 슬롯(시작 직후 첫 체크)은 오픈 시점을 알 수 없어 이벤트로 만들지 않는다.
+최근 이벤트의 p50/p95/p99를 유지하고 설정한 SLO를 넘으면 알린다.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from loguru import logger
+
+from .config import (
+    LATENCY_WINDOW_EVENTS, LATENCY_SLO, LATENCY_SLO_MIN_EVENTS, LATENCY_ALERT_COOLDOWN_SECONDS
+)
+from .metrics import get_registry
+
+STAGES = ('request_start', 'response_received', 'parse_done', 'diff_done', 'send_acked')
+
+# 구간 이름 → (시작 단계, 끝 단계). detection의 시작은 직전 조회 시각
+SEGMENTS = {
+    'fetch': ('request_start', 'response_received'),
+    'parse': ('response_received', 'parse_done'),
+    'diff': ('parse_done', 'diff_done'),
+    'send': ('diff_done', 'send_acked'),
+    'pipeline': ('request_start', 'send_acked'),
+    'detection': ('previous_poll', 'send_acked'),
+}
+SEGMENT_LABELS = {
+    'fetch': '요청', 'parse': '파싱', 'diff': 'diff', 'send': '전송',
+    'pipeline': '처리', 'detection': '감지',
+}
+PERCENTILES = (50, 95, 99)
+
+SLOT_EVENT_SECONDS = get_registry().histogram(
+    "zeroworld_slot_event_seconds",
+    "슬롯 오픈 이벤트 구간별 지연 (fetch, parse, diff, send, pipeline, detection)",
+    ("segment",),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+
+
+def parse_slo(spec: str) -> Dict[int, float]:
+    """SLO 설정 파싱 ("p50=60,p95=180" → {50: 60.0, 95: 180.0}, 형식 오류 항목은 무시)"""
+    slo = {}
+    for item in spec.split(","):
+        name, _, value = item.strip().partition("=")
+        try:
+            percentile = int(name.strip().lower().lstrip("p"))
+            if percentile in PERCENTILES:
+                slo[percentile] = float(value)
+                continue
+        except ValueError:
+            pass
+        if item.strip():
+            logger.warning(f"잘못된 지연 SLO 항목 무시: {item.strip()}")
+    return slo
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """nearest-rank 백분위 (정렬된 값 필요)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(-(-p * len(sorted_values) // 100)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LatencyEvent:
+    """슬롯 오픈 이벤트 하나의 단계 시각 (epoch 초)"""
+    
+    __slots__ = ('target', 'slot', 'marks')
+    
+    def __init__(self, target: str, slot: str, marks: Dict[str, Optional[float]]):
+        self.target = target
+        self.slot = slot
+        self.marks = marks
+    
+    def segments(self) -> Dict[str, float]:
+        """측정 가능한 구간별 지연(초)"""
+        values = {}
+        for segment, (start, end) in SEGMENTS.items():
+            started, ended = self.marks.get(start), self.marks.get(end)
+            if started is not None and ended is not None:
+                values[segment] = max(0.0, ended - started)
+        return values
+
+
+class LatencyTracker:
+    """날짜별 조회 시각과 슬롯 오픈 이벤트 지연 추적"""
+    
+    def __init__(self, window: int = LATENCY_WINDOW_EVENTS, slo: Optional[Dict[int, float]] = None,
+                 min_events: int = LATENCY_SLO_MIN_EVENTS,
+                 alert_cooldown: float = LATENCY_ALERT_COOLDOWN_SECONDS):
+        self.slo = parse_slo(LATENCY_SLO) if slo is None else slo
+        self.min_events = min_events
+        self.alert_cooldown = alert_cooldown
+        # (매장, 날짜) → (request_start, response_received, parse_done, 직전 조회의 response_received)
+        self._fetches: Dict[Tuple[str, str], Tuple[float, float, float, Optional[float]]] = {}
+        self._segments: Dict[str, Deque[float]] = {segment: deque(maxlen=window) for segment in SEGMENTS}
+        self.events_total = 0
+        self._last_alert: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def record_fetch(self, store: str, date_str: str, request_start: float,
+                     response_received: float, parse_done: float):
+        """날짜 하나의 조회 완료 기록 (스윕 워커 스레드에서 호출)"""
+        with self._lock:
+            previous = self._fetches.get((store, date_str))
+            previous_poll = previous[1] if previous else None
+            self._fetches[(store, date_str)] = (request_start, response_received, parse_done, previous_poll)
+    
+    def open_events(self, target_key: str, store: str, slots: List[str],
+                    diff_done: Optional[float] = None) -> List[LatencyEvent]:
+        """diff로 찾은 새 예약 가능 슬롯의 이벤트 생성 (직전 조회 기록이 없는 슬롯은 제외)"""
+        diff_done = diff_done or time.time()
+        events = []
+        with self._lock:
+            for slot in slots:
+                fetch = self._fetches.get((store, slot[:10]))
+                if fetch is None or fetch[3] is None:
+                    continue
+                request_start, response_received, parse_done, previous_poll = fetch
+                events.append(LatencyEvent(target_key, slot, {
+                    'previous_poll': previous_poll,
+                    'request_start': request_start,
+                    'response_received': response_received,
+                    'parse_done': parse_done,
+                    'diff_done': diff_done,
+                    'send_acked': None,
+                }))
+        return events
+    
+    def acknowledge(self, events: List[LatencyEvent], send_acked: Optional[float] = None) -> List[str]:
+        """
+        전송 확인 시각을 기록하고 지연을 집계
+        
+        Returns:
+            list: 이번 집계로 SLO를 넘은 항목 설명 (알림 대기 시간 중이면 빈 리스트)
+        """
+        if not events:
+            return []
+        send_acked = send_acked or time.time()
+        with self._lock:
+            for event in events:
+                event.marks['send_acked'] = send_acked
+                for segment, value in event.segments().items():
+                    self._segments[segment].append(value)
+                    SLOT_EVENT_SECONDS.observe(value, segment=segment)
+                logger.info(
+                    f"⏱️ [{event.target}] {event.slot} 오픈 감지: "
+                    + ", ".join(f"{SEGMENT_LABELS[s]} {v:.2f}초" for s, v in event.segments().items())
+                )
+            self.events_total += len(events)
+            return self._check_slo()
+    
+    def forget_dates(self, store: str, dates: List[str]):
+        """날짜 창에서 빠진 날짜의 조회 기록 삭제"""
+        with self._lock:
+            for date_str in dates:
+                self._fetches.pop((store, date_str), None)
+    
+    def percentiles(self, segment: str) -> Tuple[int, Dict[int, float]]:
+        """구간의 (이벤트 수, {50: p50, 95: p95, 99: p99})"""
+        with self._lock:
+            values = sorted(self._segments[segment])
+        return len(values), {p: percentile(values, p) for p in PERCENTILES}
+    
+    def _check_slo(self) -> List[str]:
+        """감지 지연 SLO 판정 (호출하는 쪽에서 잠금 보유)"""
+        if not self.slo:
+            return []
+        values = sorted(self._segments['detection'])
+        if len(values) < self.min_events:
+            return []
+        
+        breaches = [
+            f"감지 지연 p{p} {percentile(values, p):.1f}초 > SLO {limit:g}초"
+            for p, limit in sorted(self.slo.items())
+            if percentile(values, p) > limit
+        ]
+        now = time.monotonic()
+        if not breaches or (self._last_alert is not None and now - self._last_alert < self.alert_cooldown):
+            return []
+        self._last_alert = now
+        return breaches
+    
+    def summary_lines(self) -> List[str]:
+        """상태 메시지용 요약 (이벤트가 없으면 한 줄 안내)"""
+        count, detection = self.percentiles('detection')
+        if not count:
+            return ["⏱️ 감지 지연: 아직 슬롯 오픈 이벤트 없음"]
+        
+        lines = [
+            f"⏱️ 감지 지연 ({count}건): " + " / ".join(f"p{p} {detection[p]:.1f}초" for p in PERCENTILES)
+        ]
+        stage_p95 = []
+        for segment in ('fetch', 'parse', 'diff', 'send'):
+            segment_count, values = self.percentiles(segment)
+            if segment_count:
+                stage_p95.append(f"{SEGMENT_LABELS[segment]} {values[95]:.2f}초")
+        if stage_p95:
+            lines.append("🔧 단계별 p95: " + ", ".join(stage_p95))
+        if self.slo:
+            lines.append("🎯 SLO: " + ", ".join(f"p{p} ≤ {limit:g}초" for p, limit in sorted(self.slo.items())))
+        return lines
+
+
+# 전역 지연 추적기
+_latency_tracker: Optional[LatencyTracker] = None
+_latency_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """전역 지연 추적기 반환"""
+    global _latency_tracker
+    with _latency_tracker_lock:
+        if _latency_tracker is None:
+            _latency_tracker = LatencyTracker()
+    return _latency_tracker
@@ -9,38 +9,185 @@
 import sys
 import signal
 import time
-import zoneinfo
 import asyncio
 import threading
+from collections import deque
 from datetime import datetime, timedelta
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
 from loguru import logger
 
 from .config import (
     RUN_HOURS, TIMEZONE, CHECK_INTERVAL_MINUTES,
     LOG_FILE, LOG_ROTATION, LOG_RETENTION, LOG_LEVEL,
-    DATE_START, DATE_END, THEME_NAME
+    ASYNC_RUNTIME, FAST_START, PREFETCH,
+    ADAPTIVE_INTERVAL, BURST_INTERVAL_SECONDS, BURST_WINDOW_SECONDS,
+    RELEASE_TIMES, RELEASE_WINDOW_SECONDS, MAX_REQUESTS_PER_HOUR,
+    MIN_CHECK_INTERVAL_SECONDS, MAX_CHECK_INTERVAL_SECONDS, METRICS_PORT
 )
-from .fetch import get_slots
-from .state import get_state_manager, find_new_available_slots, update_slots
-from .notifier import send_notification, send_error_notification, test_telegram_connection, get_bot_handler, test_bot_polling
+from .metrics import (
+    CHECKS_TOTAL, CHECK_ERRORS_TOTAL, CHECK_SECONDS, SLOTS_OPENED_TOTAL, SLOTS_CLOSED_TOTAL
+)
+from .latency import get_latency_tracker
+from .prefetch import Prefetcher
+from .ratelimit import get_rate_limiter
+from .state import get_state_manager
+from .subscribers import get_subscriber_registry
+from .tracing import configure_tracing, span, traced
+from .targets import group_by_store, load_watch_targets, load_runtime_config, save_runtime_config
+from .watchdog import ResourceWatchdog, restart_process
+
+# 무거운 의존성(apscheduler, telegram, requests/bs4)은 필요한 모드에서만 지연 임포트한다.
+# --config-test 같은 가벼운 CLI 모드와 Railway 콜드 스타트 시간을 줄이기 위함
+
+
+class AdaptiveIntervalController:
+    """
+    적응형 체크 간격 컨트롤러
+    
+    슬롯 상태가 바뀐 직후나 예약 오픈 시각 전후에는 버스트 간격으로 체크하고,
+    버스트 구간이 끝나면 간격을 두 배씩 늘려 기본 간격으로 복귀한다.
+    시간당 요청 예산을 넘지 않도록 간격의 하한을 조정한다.
+    """
+    
+    def __init__(self, base_seconds: float, burst_seconds: float = BURST_INTERVAL_SECONDS,
+                 burst_window: float = BURST_WINDOW_SECONDS, release_times=RELEASE_TIMES,
+                 release_window: float = RELEASE_WINDOW_SECONDS,
+                 max_requests_per_hour: int = MAX_REQUESTS_PER_HOUR):
+        self.base_seconds = base_seconds
+        self._burst_setting = burst_seconds
+        self.burst_seconds = min(burst_seconds, base_seconds)
+        self.burst_window = burst_window
+        self.release_window = release_window
+        self.max_requests_per_hour = max_requests_per_hour
+        self.release_times = []
+        for release_time in release_times:
+            try:
+                parsed = datetime.strptime(release_time, "%H:%M")
+                self.release_times.append((parsed.hour, parsed.minute))
+            except ValueError:
+                logger.warning(f"잘못된 예약 오픈 시각 형식 (HH:MM): {release_time}")
+        
+        self.current_seconds = base_seconds
+        self._burst_until = None
+        self._requests = deque()  # (시각, 요청 수)
+        self._lock = threading.Lock()
+    
+    def _seconds_to_release(self, now: datetime):
+        """가장 가까운 예약 오픈 시각까지 남은 초 (지난 시각은 음수, 오픈 시각이 없으면 None)"""
+        nearest = None
+        for hour, minute in self.release_times:
+            release = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            for candidate in (release - timedelta(days=1), release, release + timedelta(days=1)):
+                delta = (candidate - now).total_seconds()
+                if nearest is None or abs(delta) < abs(nearest):
+                    nearest = delta
+        return nearest
+    
+    def _requests_last_hour(self, now: datetime) -> int:
+        """최근 1시간 동안 사용한 요청 수"""
+        cutoff = now - timedelta(hours=1)
+        while self._requests and self._requests[0][0] < cutoff:
+            self._requests.popleft()
+        return sum(count for _, count in self._requests)
+    
+    def set_base_seconds(self, base_seconds: float):
+        """기본 간격 변경 (다음 간격 계산부터 적용)"""
+        with self._lock:
+            self.base_seconds = base_seconds
+            self.burst_seconds = min(self._burst_setting, base_seconds)
+    
+    def record_check(self, request_count: int, changed: bool, now: datetime = None):
+        """체크 결과 기록 (사용한 요청 수, 슬롯 상태 변경 여부)"""
+        now = now or datetime.now()
+        with self._lock:
+            self._requests.append((now, request_count))
+            if changed:
+                self._burst_until = now + timedelta(seconds=self.burst_window)
+                logger.info(f"⚡ 슬롯 상태 변경 감지 - {self.burst_window}초 동안 버스트 폴링")
+    
+    def next_interval(self, request_cost: int, now: datetime = None) -> float:
+        """
+        다음 체크까지의 간격(초) 계산
+        
+        Args:
+            request_cost: 다음 체크 한 번에 필요한 예상 요청 수
+        """
+        now = now or datetime.now()
+        with self._lock:
+            to_release = self._seconds_to_release(now)
+            in_release_window = to_release is not None and abs(to_release) <= self.release_window
+            in_burst = self._burst_until is not None and now < self._burst_until
+            
+            if in_burst or in_release_window:
+                interval = self.burst_seconds
+            else:
+                # 버스트 종료 후 점진적으로 기본 간격 복귀
+                interval = min(self.base_seconds, self.current_seconds * 2)
+                # 다음 오픈 시각 구간 시작에 맞춰 깨어나기
+                if to_release is not None and to_release > self.release_window:
+                    interval = min(interval, max(self.burst_seconds, to_release - self.release_window))
+            
+            # 요청 예산: 지속 속도 하한 + 예산 소진 시 기본 간격 이상으로 후퇴
+            if self.max_requests_per_hour > 0:
+                interval = max(interval, request_cost * 3600 / self.max_requests_per_hour)
+                used = self._requests_last_hour(now)
+                if used + request_cost > self.max_requests_per_hour:
+                    logger.warning(f"시간당 요청 예산 소진 ({used}/{self.max_requests_per_hour}) - 기본 간격으로 후퇴")
+                    interval = max(interval, self.base_seconds)
+            
+            self.current_seconds = interval
+            return interval
 
 
 class ZeroworldChecker:
     """제로월드 예약 모니터링 클래스"""
     
-    def __init__(self):
-        self.scheduler = BlockingScheduler(timezone=TIMEZONE)
+    def __init__(self, async_mode: bool = ASYNC_RUNTIME, fast_start: bool = FAST_START):
+        # async_mode: 체크/상태 메시지/봇 polling/알림을 하나의 이벤트 루프에서 실행
+        self.async_mode = async_mode
+        # fast_start: 시작 시 시스템 테스트 스윕을 생략하고 첫 체크로 대체
+        self.fast_start = fast_start
+        from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
+        if async_mode:
+            from apscheduler.schedulers.asyncio import AsyncIOScheduler
+            self.scheduler = AsyncIOScheduler(timezone=TIMEZONE)
+        else:
+            from apscheduler.schedulers.blocking import BlockingScheduler
+            self.scheduler = BlockingScheduler(timezone=TIMEZONE)
         self.state_manager = get_state_manager()
+        # False면 예약 가능 슬롯을 로그로만 남기고 텔레그램 알림은 보내지 않음 (프로파일링용)
+        self.notifications_enabled = True
+        # 모니터링 대상 목록 (WATCHLIST 미설정 시 THEME_NAME 단일 대상)
+        self.targets = load_watch_targets()
+        for target in self.targets:
+            target.refresh_dates()
+        # 체크 기본 간격 (봇 /interval 명령으로 저장한 값이 있으면 우선)
+        self.runtime_interval = load_runtime_config().get('interval_seconds')
+        self.base_interval_seconds = float(self.runtime_interval or CHECK_INTERVAL_MINUTES * 60)
+        # 봇 명령으로 예약된 설정 변경 (다음 체크 경계에서 적용)
+        self._config_lock = threading.Lock()
+        self._pending_targets = None
+        self._pending_interval = None
         self.running = False
         self.check_count = 0
         self.last_success_time = None
         self.error_count = 0
         self.start_time = None  # 모니터링 시작 시간
         
+        # 적응형 체크 간격 (비활성화 시 항상 기본 간격)
+        self.interval_controller = AdaptiveIntervalController(self.base_interval_seconds) if ADAPTIVE_INTERVAL else None
+        
+        # 파이프라인 모드: 다음 체크의 스윕을 체크 시각 직전에 끝나도록 미리 실행
+        self.prefetcher = Prefetcher() if PREFETCH else None
+        # 최근 상태가 바뀌었거나 예약 가능 슬롯이 있는 날짜 (프리페치 스윕 마지막에 가져옴)
+        self.hot_dates = set()
+        
+        # 구독자별 알림 필터 (봇 /subscribe 명령으로 바꾸면 역색인을 새로 만들어 교체)
+        self.subscribers = get_subscriber_registry()
+        # 슬롯 변경 이벤트 스트림 (로컬 서버를 켰을 때만 발행)
+        self.event_broker = None
+        
         # 텔레그램 봇 핸들러 설정
+        from .notifier import get_bot_handler
         self.bot_handler = get_bot_handler()
         if self.bot_handler:
             self.bot_handler.set_monitor_instance(self)
@@ -49,6 +196,19 @@ class ZeroworldChecker:
         self.bot_thread = None
         self.bot_loop = None
         
+        # 비동기 런타임 전용 (이벤트 루프, 공유 notifier, 봇 polling 태스크)
+        self.loop = None
+        self.notifier = None
+        self.bot_task = None
+        self._stop_event = None
+        
+        # 체크 소요 시간 측정 시작 시각 (perf_counter)
+        self._check_started = time.perf_counter()
+        
+        # 자원 감시 (한도 초과 시 정리 후 재시작 사유를 남김)
+        self.watchdog = ResourceWatchdog()
+        self.restart_reason = None
+        
         # 로깅 설정
         self._setup_logging()
         
@@ -102,11 +262,22 @@ class ZeroworldChecker:
             
             # 연속 에러가 많으면 알림
             if self.error_count >= 3:
-                send_error_notification(f"연속 {self.error_count}회 오류 발생: {event.exception}")
+                self._notify_error(f"연속 {self.error_count}회 오류 발생: {event.exception}")
         else:
             self.error_count = 0  # 성공시 에러 카운트 리셋
             self.last_success_time = datetime.now()
     
+    def _notify_error(self, error_message: str):
+        """에러 알림 전송 (런타임 모드에 맞춰 동기 전송 또는 이벤트 루프에 예약)"""
+        if self.async_mode and self.loop and self.notifier:
+            # 이벤트 루프 스레드에서 호출될 수 있으므로 블로킹 없이 코루틴만 예약
+            asyncio.run_coroutine_threadsafe(
+                self.notifier.send_error_notification(error_message), self.loop
+            )
+        else:
+            from .notifier import send_error_notification
+            send_error_notification(error_message)
+    
     def _should_run_now(self) -> bool:
         """현재 실행 시간인지 확인"""
         now = datetime.now()
@@ -119,99 +290,479 @@ class ZeroworldChecker:
         
         return True
     
-    def check_slots(self):
-        """슬롯 체크 및 알림 메인 로직"""
-        try:
-            self.check_count += 1
-            logger.info(f"=== 슬롯 체크 시작 ({self.check_count}회차) ===")
+    def _staged_targets(self) -> list:
+        """아직 적용되지 않은 변경까지 반영한 대상 목록 복사본 (_config_lock 안에서 호출)"""
+        return list(self._pending_targets if self._pending_targets is not None else self.targets)
+    
+    def _persist_runtime_config(self, targets):
+        """재시작 후에도 유지되도록 런타임 설정 저장 (_config_lock 안에서 호출)"""
+        interval = self._pending_interval or self.runtime_interval
+        if not save_runtime_config(targets, interval):
+            logger.warning("런타임 설정 저장 실패 - 재시작 시 변경 사항이 사라질 수 있습니다")
+    
+    def get_watch_targets(self) -> list:
+        """다음 체크부터 적용될 대상 목록"""
+        with self._config_lock:
+            return self._staged_targets()
+    
+    def add_watch_target(self, target) -> bool:
+        """
+        모니터링 대상 추가 (같은 매장·테마가 있으면 기간과 채팅을 갱신)
+        
+        다음 체크 경계에서 적용되며, 새로 추가했으면 True
+        """
+        with self._config_lock:
+            targets = self._staged_targets()
+            for index, existing in enumerate(targets):
+                if existing.key == target.key:
+                    targets[index] = target
+                    added = False
+                    break
+            else:
+                targets.append(target)
+                added = True
             
-            # 운영 시간 체크
-            if not self._should_run_now():
-                logger.info("운영 시간이 아니므로 체크를 건너뜁니다")
-                return
+            self._pending_targets = targets
+            self._persist_runtime_config(targets)
+        
+        logger.info(f"📝 모니터링 대상 {'추가' if added else '갱신'} 예약: {target}")
+        return added
+    
+    def remove_watch_target(self, name: str) -> list:
+        """
+        테마 이름(또는 대상 키)이 일치하는 모니터링 대상 제거
+        
+        마지막 대상은 제거할 수 없다 (ValueError). 다음 체크 경계에서 적용되며 제거된 대상 목록 반환
+        """
+        with self._config_lock:
+            targets = self._staged_targets()
+            removed = [target for target in targets if name in (target.theme, target.key)]
+            if not removed:
+                return []
             
-            # 1. 현재 슬롯 상태 가져오기
-            logger.info(f"'{THEME_NAME}' 슬롯 정보 수집 중...")
-            current_slots = get_slots()
+            remaining = [target for target in targets if target not in removed]
+            if not remaining:
+                raise ValueError("마지막 모니터링 대상은 제거할 수 없습니다")
             
-            if not current_slots:
-                logger.warning("슬롯 정보를 가져올 수 없습니다")
-                return
+            self._pending_targets = remaining
+            self._persist_runtime_config(remaining)
+        
+        logger.info(f"📝 모니터링 대상 제거 예약: {', '.join(target.key for target in removed)}")
+        return removed
+    
+    def set_check_interval(self, seconds: float):
+        """체크 기본 간격 변경 (다음 체크 경계에서 적용, 범위 밖이면 ValueError)"""
+        if not MIN_CHECK_INTERVAL_SECONDS <= seconds <= MAX_CHECK_INTERVAL_SECONDS:
+            raise ValueError(
+                f"체크 간격은 {MIN_CHECK_INTERVAL_SECONDS}~{MAX_CHECK_INTERVAL_SECONDS}초 사이여야 합니다"
+            )
+        
+        with self._config_lock:
+            self._pending_interval = float(seconds)
+            self._persist_runtime_config(self._staged_targets())
+        
+        logger.info(f"📝 체크 간격 변경 예약: {seconds:.0f}초")
+    
+    def _apply_pending_config(self):
+        """봇 명령으로 예약된 설정 변경을 체크 경계에서 적용 (재시작 없음)"""
+        with self._config_lock:
+            targets, self._pending_targets = self._pending_targets, None
+            interval, self._pending_interval = self._pending_interval, None
+        
+        if targets is not None:
+            self._apply_targets(targets)
+        if interval is not None:
+            self._apply_interval(interval)
+    
+    def _apply_targets(self, targets):
+        """대상 목록 교체 (빠진 대상의 상태 삭제, 기본 대상이 빠지면 다음 대상을 기본 대상으로 승격)"""
+        keys = {target.key for target in targets}
+        for target in self.targets:
+            if target.key not in keys:
+                self.state_manager.remove_target(target.state_key)
+                logger.info(f"🗑️ 모니터링 대상 제거: {target.key}")
+        
+        for target in targets:
+            target.primary = False
+        targets[0].primary = True
+        if targets[0].key != self.targets[0].key:
+            self.state_manager.promote_target(targets[0].key)
+        
+        previous = {target.key: target for target in self.targets}
+        for target in targets:
+            if target.key not in previous:
+                logger.info(f"➕ 모니터링 대상 추가: {target}")
+            elif target is not previous[target.key]:
+                # 기간이 바뀐 대상은 기존 날짜 창에서 증분 갱신
+                target.inherit_dates(previous[target.key])
+        
+        self.targets = targets
+        logger.info(f"🎯 모니터링 대상 {len(targets)}개 적용 완료")
+    
+    def _apply_interval(self, seconds: float):
+        """체크 기본 간격 교체 후 체크 작업 재예약"""
+        previous = self.base_interval_seconds
+        self.base_interval_seconds = seconds
+        self.runtime_interval = seconds
+        
+        if self.interval_controller:
+            # 적응형 간격은 체크 종료 시 _adjust_interval에서 재예약
+            self.interval_controller.set_base_seconds(seconds)
+        elif self.scheduler.get_job('slot_checker'):
+            self.scheduler.reschedule_job('slot_checker', trigger='interval', seconds=seconds)
+        
+        logger.info(f"🔄 기본 체크 간격 변경: {previous:.0f}초 → {seconds:.0f}초")
+    
+    def _roll_date_windows(self):
+        """대상별 날짜 창을 오늘 기준으로 증분 갱신 (빠진 날짜의 저장 상태도 삭제)"""
+        for target in self.targets:
+            added, dropped = target.refresh_dates()
+            if dropped:
+                self.state_manager.drop_dates(dropped, target.state_key)
+                get_latency_tracker().forget_dates(target.store, dropped)
+            if added or dropped:
+                logger.info(f"📅 [{target.theme}] 날짜 창 갱신: +{len(added)}일, -{len(dropped)}일")
+    
+    def _begin_check(self) -> bool:
+        """설정 변경 및 날짜 창 적용, 체크 회차 증가 및 운영 시간 확인"""
+        self._apply_pending_config()
+        self._roll_date_windows()
+        self.check_count += 1
+        logger.info(f"=== 슬롯 체크 시작 ({self.check_count}회차) ===")
+        
+        # 운영 시간 체크
+        if not self._should_run_now():
+            logger.info("운영 시간이 아니므로 체크를 건너뜁니다")
+            return False
+        
+        themes = ", ".join(f"'{target.theme}'" for target in self.targets)
+        logger.info(f"{themes} 슬롯 정보 수집 중...")
+        CHECKS_TOTAL.inc()
+        self._check_started = time.perf_counter()
+        return True
+    
+    def _collect_current_slots(self) -> list:
+        """
+        마감 시간 내 모든 대상의 슬롯 수집 (부분 결과 허용)
+        
+        Returns:
+            list: (대상, stale 날짜는 이전 상태로 채운 저장용 슬롯, 이번에 새로 수집한 슬롯) 목록
+                  슬롯을 수집하지 못한 대상은 제외 (프리페치 스윕이 아직 진행 중이면 빈 목록)
+        """
+        from .fetch import collect_slots
+        collected = None
+        if self.prefetcher:
+            collected = self.prefetcher.take(self.targets, max_age=self._check_interval_seconds())
+            if collected is None and self.prefetcher.running():
+                # 같은 매장에 스윕이 겹치지 않도록 이번 체크는 건너뜀
+                return []
+        if collected is None:
+            started = time.perf_counter()
+            collected = collect_slots(self.targets)
+            if self.prefetcher:
+                self.prefetcher.observe_duration(time.perf_counter() - started)
+        
+        results = []
+        for target in self.targets:
+            fresh_slots, stale_dates = collected.get(target.key, ({}, []))
+            if not fresh_slots:
+                logger.warning(f"[{target.key}] 슬롯 정보를 가져올 수 없습니다")
+                continue
             
-            logger.info(f"총 {len(current_slots)}개 슬롯 정보 수집 완료")
+            current_slots = self.state_manager.merge_stale_dates(fresh_slots, stale_dates, target.state_key)
+            results.append((target, current_slots, fresh_slots))
+        
+        return results
+    
+    def _find_available_slots(self, current_slots, target=None) -> list:
+        """수집한 슬롯 요약 로그 출력 후 현재 예약 가능한 슬롯 목록 반환"""
+        prefix = f"[{target.theme}] " if target else ""
+        logger.info(f"{prefix}총 {len(current_slots)}개 슬롯 정보 수집 완료")
+        
+        # 예약 가능한 슬롯 개수 확인
+        available_count = len([s for s in current_slots.values() if s == "예약가능"])
+        reserved_count = len(current_slots) - available_count
+        
+        logger.info(f"{prefix}예약 가능: {available_count}개, 매진: {reserved_count}개")
+        
+        # 현재 예약 가능한 모든 슬롯 찾기 (항상 알림)
+        available_slots = [slot for slot, status in current_slots.items() if status == "예약가능"]
+        
+        if available_slots:
+            logger.info(f"🎉 {prefix}예약 가능한 슬롯 {len(available_slots)}개 발견!")
+            for slot in available_slots:
+                logger.info(f"  - {slot}")
+        else:
+            logger.info(f"{prefix}현재 예약 가능한 슬롯이 없습니다")
+        
+        return available_slots
+    
+    def _diff_targets(self, collected) -> dict:
+        """
+        대상별로 이전 상태와 비교
+        
+        Returns:
+            dict: 대상 키 → (새로 열린 슬롯, 새로 매진된 슬롯, 감지 지연 추적용 오픈 이벤트)
+        """
+        diffs = {}
+        with span('diff', targets=len(collected)):
+            for target, current_slots, _ in collected:
+                opened, closed = self.state_manager.diff_slots(current_slots, target.state_key)
+                if self.event_broker:
+                    # 알림 전송을 기다리지 않고 diff 직후 /events 구독자에게 발행
+                    self.event_broker.publish(target, opened, closed)
+                events = get_latency_tracker().open_events(target.key, target.store, opened)
+                diffs[target.key] = (opened, closed, events)
+        return diffs
+    
+    def _route_alerts(self, target, available_slots) -> dict:
+        """예약 가능 슬롯을 받을 채팅별로 나누기 (구독 필터 역색인, 구독자가 아닌 대상 채팅은 전체)"""
+        routes = self.subscribers.route(target.theme, available_slots, target.chat_id)
+        if not routes:
+            logger.info(f"[{target.theme}] 구독 필터와 일치하는 채팅이 없어 알림을 보내지 않습니다")
+        return routes
+    
+    def _log_alert_result(self, target, chat_id, slots, sent) -> bool:
+        """채팅별 알림 전송 결과 로그 (전송 여부 반환)"""
+        if sent:
+            logger.info(f"✅ [{target.theme}] 텔레그램 알림 전송 성공 (채팅 {chat_id}, {len(slots)}개)")
+        else:
+            logger.error(f"❌ [{target.theme}] 텔레그램 알림 전송 실패 (채팅 {chat_id})")
+        return sent
+    
+    def _acknowledge_slot_events(self, events, delivered):
+        """알림 전송이 확인된 슬롯(delivered)의 오픈 이벤트만 지연 집계 (SLO 위반 시 알림)"""
+        events = [event for event in events if event.slot in delivered]
+        if not events:
+            return
+        breaches = get_latency_tracker().acknowledge(events)
+        if breaches:
+            logger.warning(f"⏱️ 감지 지연 SLO 위반: {'; '.join(breaches)}")
+            self._notify_error("감지 지연 SLO 위반\n" + "\n".join(breaches))
+    
+    def _finish_check(self, collected, diffs):
+        """대상별 현재 상태 저장 및 통계 출력"""
+        changed = False
+        hot_dates = set()
+        for target, current_slots, fresh_slots in collected:
+            opened, closed, _ = diffs[target.key]
+            hot_dates.update(slot[:10] for slot in opened + closed)
+            hot_dates.update(slot[:10] for slot, status in fresh_slots.items() if status == "예약가능")
+            SLOTS_OPENED_TOTAL.inc(len(opened), target=target.key)
+            SLOTS_CLOSED_TOTAL.inc(len(closed), target=target.key)
+            changed = changed or bool(opened or closed)
             
-            # 2. 예약 가능한 슬롯 개수 확인
-            available_count = len([s for s in current_slots.values() if s == "예약가능"])
-            reserved_count = len(current_slots) - available_count
+            with span('update_slots', target=target.key, slots=len(current_slots)):
+                saved = self.state_manager.update_slots(current_slots, target.state_key)
+            if saved:
+                logger.debug(f"[{target.key}] 상태 저장 완료")
+            else:
+                logger.warning(f"[{target.key}] 상태 저장 실패")
             
-            logger.info(f"예약 가능: {available_count}개, 매진: {reserved_count}개")
+            stats = self.state_manager.get_stats(target.state_key)
+            logger.info(f"📊 [{target.theme}] 통계 - 전체: {stats['total_slots']}개, 예약가능: {stats['available_slots']}개")
+        
+        self.hot_dates = hot_dates
+        
+        if self.interval_controller:
+            from .fetch import estimate_request_count
+            self.interval_controller.record_check(estimate_request_count(self.targets), changed)
+        
+        CHECK_SECONDS.observe(time.perf_counter() - self._check_started)
+        logger.info("=== 슬롯 체크 완료 ===")
+    
+    def _check_interval_seconds(self) -> float:
+        """현재 체크 간격(초)"""
+        if self.interval_controller:
+            return self.interval_controller.current_seconds
+        return self.base_interval_seconds
+    
+    def _adjust_interval(self):
+        """적응형 간격 계산 후 체크 작업 재예약 (간격이 바뀐 경우에만)"""
+        if not self.interval_controller:
+            return
+        
+        from .fetch import estimate_request_count
+        previous = self.interval_controller.current_seconds
+        interval = self.interval_controller.next_interval(estimate_request_count(self.targets))
+        if interval == previous or not self.scheduler.get_job('slot_checker'):
+            return
+        
+        self.scheduler.reschedule_job('slot_checker', trigger='interval', seconds=interval)
+        logger.info(f"🔄 체크 간격 변경: {previous:.0f}초 → {interval:.0f}초")
+    
+    def _schedule_prefetch(self):
+        """다음 체크 시각에 맞춰 프리페치 예약 (파이프라인 모드)"""
+        if not self.prefetcher or not self.running:
+            return
+        job = self.scheduler.get_job('slot_checker')
+        if not job or not job.next_run_time:
+            return
+        seconds_until_tick = (job.next_run_time - datetime.now(job.next_run_time.tzinfo)).total_seconds()
+        self.prefetcher.schedule(self.targets, seconds_until_tick, self.hot_dates)
+    
+    def _watch_resources(self):
+        """체크 종료 시 자원 샘플링, 한도를 연속으로 넘으면 모니터링을 멈추고 재시작 예약"""
+        reason = self.watchdog.observe()
+        if not reason or self.restart_reason:
+            return
+        
+        # 상태는 체크마다 저장되므로 여기서 멈추면 마지막 체크 결과까지 보존됨
+        self.restart_reason = reason
+        logger.warning(f"♻️ 자원 한도 초과로 재시작합니다: {reason}")
+        self._notify_error(f"자원 한도 초과로 재시작합니다: {reason}")
+        self.stop()
+    
+    def _handle_check_error(self, e: Exception):
+        """슬롯 체크 중 오류 처리"""
+        CHECK_ERRORS_TOTAL.inc()
+        logger.error(f"슬롯 체크 중 오류: {e}")
+        # 중요한 오류는 텔레그램으로도 알림
+        if "network" in str(e).lower() or "connection" in str(e).lower():
+            self._notify_error(f"네트워크 오류: {e}")
+    
+    @traced('check_slots')
+    def check_slots(self) -> bool:
+        """슬롯 체크 및 알림 메인 로직 (슬롯을 수집해 처리했으면 True)"""
+        try:
+            if not self._begin_check():
+                return False
             
-            # 3. 현재 예약 가능한 모든 슬롯 찾기 (항상 알림)
-            available_slots = [slot for slot, status in current_slots.items() if status == "예약가능"]
+            # 1. 대상별 현재 슬롯 상태 가져오기 (마감 시간 초과 날짜는 이전 상태 유지)
+            collected = self._collect_current_slots()
+            if not collected:
+                return False
+            diffs = self._diff_targets(collected)
             
-            # 4. 예약 가능한 슬롯이 있으면 알림 전송
-            if available_slots:
-                logger.info(f"🎉 예약 가능한 슬롯 {len(available_slots)}개 발견!")
-                
-                for slot in available_slots:
-                    logger.info(f"  - {slot}")
+            for target, _, fresh_slots in collected:
+                # 2. 예약 가능한 슬롯 확인 (이번에 수집한 슬롯 기준)
+                available_slots = self._find_available_slots(fresh_slots, target)
                 
-                # 텔레그램 알림 전송 (매번 전송)
-                if send_notification(available_slots):
-                    logger.info("✅ 텔레그램 알림 전송 성공")
-                else:
-                    logger.error("❌ 텔레그램 알림 전송 실패")
-            else:
-                logger.info("현재 예약 가능한 슬롯이 없습니다")
-            
-            # 5. 현재 상태 저장
-            if update_slots(current_slots):
-                logger.debug("상태 저장 완료")
-            else:
-                logger.warning("상태 저장 실패")
+                # 3. 예약 가능한 슬롯이 있으면 구독 필터에 맞춰 채팅별로 텔레그램 알림 전송 (매번 전송)
+                if available_slots and self.notifications_enabled:
+                    from .notifier import send_notification
+                    delivered = set()
+                    for chat_id, slots in self._route_alerts(target, available_slots).items():
+                        with span('notify', target=target.key, chat=chat_id, slots=len(slots)) as notify_span:
+                            sent = send_notification(slots, target.theme, chat_id, target.reservation_url)
+                            notify_span.set(sent=sent)
+                        if self._log_alert_result(target, chat_id, slots, sent):
+                            delivered.update(slots)
+                    if delivered:
+                        self._acknowledge_slot_events(diffs[target.key][2], delivered)
             
-            # 6. 통계 정보 출력
-            stats = self.state_manager.get_stats()
-            logger.info(f"📊 통계 - 전체: {stats['total_slots']}개, 예약가능: {stats['available_slots']}개")
+            # 슬롯 알림 때문에 보류한 오류/상태 메시지는 알림을 모두 보낸 뒤 전송
+            from .notifier import flush_deferred_notifications
+            flush_deferred_notifications()
             
-            logger.info("=== 슬롯 체크 완료 ===")
+            # 4. 현재 상태 저장 및 통계 출력
+            self._finish_check(collected, diffs)
+            return True
             
         except KeyboardInterrupt:
             logger.info("사용자에 의해 중단됨")
             raise
         except Exception as e:
-            logger.error(f"슬롯 체크 중 오류: {e}")
-            # 중요한 오류는 텔레그램으로도 알림
-            if "network" in str(e).lower() or "connection" in str(e).lower():
-                send_error_notification(f"네트워크 오류: {e}")
+            self._handle_check_error(e)
+            return False
+        finally:
+            self._adjust_interval()
+            self._schedule_prefetch()
+            self._watch_resources()
+    
+    @traced('check_slots')
+    async def check_slots_async(self) -> bool:
+        """
+        슬롯 체크 (비동기 런타임용)
+        
+        스크래핑과 상태 저장은 블로킹 I/O라 워커 스레드에서 실행하고,
+        카운터 갱신과 알림 전송은 이벤트 루프 스레드에서만 처리
+        """
+        try:
+            if not self._begin_check():
+                return False
+            
+            collected = await asyncio.to_thread(self._collect_current_slots)
+            if not collected:
+                return False
+            diffs = await asyncio.to_thread(self._diff_targets, collected)
+            
+            for target, _, fresh_slots in collected:
+                available_slots = self._find_available_slots(fresh_slots, target)
+                
+                if available_slots and self.notifications_enabled:
+                    delivered = set()
+                    for chat_id, slots in self._route_alerts(target, available_slots).items():
+                        with span('notify', target=target.key, chat=chat_id, slots=len(slots)) as notify_span:
+                            sent = await self.notifier.send_notification(
+                                slots, target.theme, chat_id, target.reservation_url
+                            )
+                            notify_span.set(sent=sent)
+                        if self._log_alert_result(target, chat_id, slots, sent):
+                            delivered.update(slots)
+                    if delivered:
+                        self._acknowledge_slot_events(diffs[target.key][2], delivered)
+            
+            await self.notifier.flush_deferred()
+            await asyncio.to_thread(self._finish_check, collected, diffs)
+            return True
+            
+        except Exception as e:
+            self._handle_check_error(e)
+            return False
+        finally:
+            self._adjust_interval()
+            self._schedule_prefetch()
+            self._watch_resources()
+    
+    def _build_status_message(self):
+        """정각 상태 메시지 생성 (시작 시간이 없으면 None)"""
+        if not self.start_time:
+            logger.warning("시작 시간이 설정되지 않아 상태 메시지를 보낼 수 없습니다")
+            return None
+        
+        # 런타임 계산
+        now = datetime.now()
+        runtime = now - self.start_time
+        hours = int(runtime.total_seconds() // 3600)
+        minutes = int((runtime.total_seconds() % 3600) // 60)
+        
+        # 상태 메시지 생성
+        if hours > 0:
+            runtime_str = f"{hours}시간 {minutes}분"
+        else:
+            runtime_str = f"{minutes}분"
+        
+        from .fetch import get_circuit_breaker
+        limiter_stats = get_rate_limiter().get_stats()
+        
+        latency_lines = "\n".join(get_latency_tracker().summary_lines())
+        # 활성 대상이 있는 매장별 서킷 상태
+        circuit_states = ", ".join(
+            f"{store.split('://', 1)[-1].rstrip('/')} {get_circuit_breaker(store).state}"
+            for store in group_by_store(self.targets)
+        ) or "대상 없음"
+        
+        return (
+            f"🤖 모니터링 정상 작동중\n"
+            f"⏰ 런타임: {runtime_str}\n"
+            f"📊 총 체크 횟수: {self.check_count}\n"
+            f"✅ 마지막 성공: {self.last_success_time.strftime('%H:%M:%S') if self.last_success_time else '없음'}\n"
+            f"❌ 에러 횟수: {self.error_count}\n"
+            f"🎯 모니터링 대상: {len(self.targets)}개\n"
+            f"🪣 요청 {limiter_stats['requests']}회, 평균 토큰 대기 {limiter_stats['avg_wait']:.2f}초\n"
+            f"🔌 서킷: {circuit_states}\n"
+            f"{latency_lines}\n"
+            f"{self.watchdog.summary_line()}"
+        )
     
     def send_status_message(self):
         """정각마다 모니터링 상태 메시지 전송"""
         try:
-            if not self.start_time:
-                logger.warning("시작 시간이 설정되지 않아 상태 메시지를 보낼 수 없습니다")
+            status_msg = self._build_status_message()
+            if not status_msg:
                 return
             
-            # 런타임 계산
-            now = datetime.now()
-            runtime = now - self.start_time
-            hours = int(runtime.total_seconds() // 3600)
-            minutes = int((runtime.total_seconds() % 3600) // 60)
-            
-            # 상태 메시지 생성
-            if hours > 0:
-                runtime_str = f"{hours}시간 {minutes}분"
-            else:
-                runtime_str = f"{minutes}분"
-            
-            status_msg = (
-                f"🤖 모니터링 정상 작동중\n"
-                f"⏰ 런타임: {runtime_str}\n"
-                f"📊 총 체크 횟수: {self.check_count}\n"
-                f"✅ 마지막 성공: {self.last_success_time.strftime('%H:%M:%S') if self.last_success_time else '없음'}\n"
-                f"❌ 에러 횟수: {self.error_count}"
-            )
-            
             # 텔레그램 알림 전송 (상태 메시지용 함수 사용)
             from .notifier import send_status_notification
             if send_status_notification(status_msg):
@@ -222,6 +773,21 @@ class ZeroworldChecker:
         except Exception as e:
             logger.error(f"상태 메시지 전송 중 오류: {e}")
     
+    async def send_status_message_async(self):
+        """정각마다 모니터링 상태 메시지 전송 (비동기 런타임용)"""
+        try:
+            status_msg = self._build_status_message()
+            if not status_msg:
+                return
+            
+            if await self.notifier.send_status_message(status_msg):
+                logger.info("✅ 상태 메시지 전송 성공")
+            else:
+                logger.warning("❌ 상태 메시지 전송 실패")
+                
+        except Exception as e:
+            logger.error(f"상태 메시지 전송 중 오류: {e}")
+    
     def _start_bot_polling(self):
         """별도 스레드에서 텔레그램 봇 polling 시작"""
         if not self.bot_handler or not self.bot_handler.application:
@@ -267,8 +833,57 @@ class ZeroworldChecker:
             except Exception as e:
                 logger.error(f"봇 스레드 종료 오류: {e}")
     
+    def _start_local_server(self):
+        """메트릭과 슬롯 변경 이벤트 스트림을 노출하는 로컬 HTTP 서버 시작 (METRICS_PORT가 0이면 생략)"""
+        if not METRICS_PORT:
+            return
+        from .events import get_event_broker
+        from .server import get_server
+        self.event_broker = get_event_broker()
+        self.event_broker.reopen()
+        get_server().start()
+    
+    def _stop_local_server(self):
+        """로컬 HTTP 서버 중지 (연결된 이벤트 스트림을 먼저 끝냄)"""
+        if not METRICS_PORT:
+            return
+        from .server import get_server
+        if self.event_broker:
+            self.event_broker.close()
+        get_server().stop()
+    
+    def _test_fetch_and_state(self) -> bool:
+        """API 연결 및 상태 관리 테스트 (시스템 테스트 2~3단계)"""
+        from .fetch import collect_slots
+        
+        # 2. API 연결 테스트 (모니터링 대상 전체를 한 번 스윕)
+        logger.info("2. 제로월드 API 연결 테스트...")
+        collected = collect_slots(self.targets)
+        if collected is None:
+            logger.error("❌ API 연결 실패: 웹사이트와 통신할 수 없거나 페이지 구조가 변경되었을 수 있습니다.")
+            return False
+        slot_count = sum(len(fresh_slots) for fresh_slots, _ in collected.values())
+        logger.info(f"✅ API 연결 성공 ({len(self.targets)}개 대상, {slot_count}개 슬롯 발견)")
+        
+        # 3. 상태 관리 테스트 (대상별 상태 키에 저장해 첫 체크가 같은 대상의 슬롯과 비교하도록)
+        logger.info("3. 상태 관리 테스트...")
+        for target in self.targets:
+            fresh_slots, stale_dates = collected.get(target.key, ({}, []))
+            if not fresh_slots:
+                # 체크와 같이 슬롯을 가져오지 못한 대상의 이전 상태는 덮어쓰지 않음
+                continue
+            current_slots = self.state_manager.merge_stale_dates(fresh_slots, stale_dates, target.state_key)
+            if not self.state_manager.update_slots(current_slots, target.state_key):
+                logger.error(f"❌ 상태 저장 실패 ({target.key})")
+                return False
+        logger.info("✅ 상태 관리 성공")
+        
+        logger.info("🎉 모든 시스템 테스트 통과!")
+        return True
+    
     def test_system(self) -> bool:
         """시스템 전체 테스트"""
+        from .notifier import test_telegram_connection
         logger.info("🔧 시스템 테스트 시작")
         
         try:
@@ -279,57 +894,113 @@ class ZeroworldChecker:
                 return False
             logger.info("✅ 텔레그램 연결 성공")
             
-            # 2. API 연결 테스트
-            logger.info("2. 제로월드 API 연결 테스트...")
-            test_slots = get_slots()
-            if test_slots is None:
-                logger.error("❌ API 연결 실패: 웹사이트와 통신할 수 없거나 페이지 구조가 변경되었을 수 있습니다.")
-                return False
-            logger.info(f"✅ API 연결 성공 ({len(test_slots)}개 슬롯 발견)")
+            return self._test_fetch_and_state()
             
-            # 3. 상태 관리 테스트
-            logger.info("3. 상태 관리 테스트...")
-            if not update_slots(test_slots):
-                logger.error("❌ 상태 저장 실패")
+        except Exception as e:
+            logger.error(f"❌ 시스템 테스트 실패: {e}")
+            return False
+    
+    async def test_system_async(self) -> bool:
+        """시스템 전체 테스트 (비동기 런타임용, 공유 notifier 사용)"""
+        logger.info("🔧 시스템 테스트 시작")
+        
+        try:
+            logger.info("1. 텔레그램 연결 테스트...")
+            if not await self.notifier.test_connection():
+                logger.error("❌ 텔레그램 연결 실패")
                 return False
-            logger.info("✅ 상태 관리 성공")
+            logger.info("✅ 텔레그램 연결 성공")
             
-            logger.info("🎉 모든 시스템 테스트 통과!")
-            return True
+            return await asyncio.to_thread(self._test_fetch_and_state)
             
         except Exception as e:
             logger.error(f"❌ 시스템 테스트 실패: {e}")
             return False
     
-    def start(self):
-        """모니터링 시작"""
-        self.start_time = datetime.now()  # 시작 시간 기록
+    def _warm_start(self):
+        """저장된 상태로 워밍업 (첫 체크의 비교 기준 확인)"""
+        stats = self.state_manager.get_stats()
+        if stats['total_slots']:
+            logger.info(
+                f"💾 저장된 상태로 워밍업: 슬롯 {stats['total_slots']}개 "
+                f"(예약가능 {stats['available_slots']}개, 마지막 갱신 {stats['last_updated']})"
+            )
+        else:
+            logger.info("💾 저장된 상태 없음 - 첫 체크 결과로 초기화")
+    
+    def _run_background_self_test(self):
+        """텔레그램 연결 테스트를 백그라운드 스레드에서 실행"""
+        from .notifier import test_telegram_connection
         
+        def run_test():
+            if test_telegram_connection():
+                logger.info("✅ (백그라운드) 텔레그램 연결 성공")
+            else:
+                logger.error("❌ (백그라운드) 텔레그램 연결 실패 - 알림이 전송되지 않을 수 있습니다")
+        
+        threading.Thread(target=run_test, name="telegram-self-test", daemon=True).start()
+    
+    async def _run_background_self_test_async(self):
+        """텔레그램 연결 테스트 (비동기 런타임 백그라운드 태스크)"""
+        if await self.notifier.test_connection():
+            logger.info("✅ (백그라운드) 텔레그램 연결 성공")
+        else:
+            logger.error("❌ (백그라운드) 텔레그램 연결 실패 - 알림이 전송되지 않을 수 있습니다")
+    
+    def _log_startup_banner(self):
+        """시작 배너 출력"""
         logger.info("🚀 제로월드 예약 모니터링 시스템 시작")
-        logger.info(f"📅 모니터링 기간: {DATE_START} ~ {DATE_END}")
-        logger.info(f"🎯 대상 테마: {THEME_NAME}")
+        for target in self.targets:
+            logger.info(f"🎯 대상: {target.theme} @ {target.store} ({target.window_label()})")
         logger.info(f"⏰ 운영 시간: 24시간 무제한 모니터링")
-        logger.info(f"🔄 체크 간격: {CHECK_INTERVAL_MINUTES}분")
+        logger.info(f"🔄 체크 간격: {self.base_interval_seconds:.0f}초")
+        if self.interval_controller:
+            logger.info(f"⚡ 적응형 간격: 버스트 {BURST_INTERVAL_SECONDS}초, 시간당 최대 {MAX_REQUESTS_PER_HOUR}회 요청")
         logger.info(f"📱 정각마다 상태 메시지 전송")
         logger.info(f"🤖 텔레그램 봇 명령어: /status (현재 상태), /help (도움말)")
-        
-        # 시스템 테스트
-        if not self.test_system():
-            logger.error("시스템 테스트 실패로 모니터링을 시작할 수 없습니다")
+        if self.async_mode:
+            logger.info("🧵 비동기 런타임: 단일 이벤트 루프에서 실행")
+        if self.fast_start:
+            logger.info("🏎️ 빠른 시작: 첫 체크가 시스템 테스트를 겸하고 텔레그램 테스트는 백그라운드 실행")
+    
+    def start(self):
+        """모니터링 시작"""
+        if self.async_mode:
+            self.start_async()
             return
         
-        # 즉시 한 번 실행
-        logger.info("초기 슬롯 체크 실행...")
-        try:
-            self.check_slots()
-        except Exception as e:
-            logger.warning(f"초기 체크 실패: {e}")
+        self.start_time = datetime.now()  # 시작 시간 기록
+        self._log_startup_banner()
+        
+        if self.fast_start:
+            # 빠른 시작: 저장된 상태로 워밍업 후 첫 체크가 API/상태 테스트를 겸함
+            self._warm_start()
+            self._run_background_self_test()
+            
+            logger.info("초기 슬롯 체크 실행 (시스템 테스트 겸용)...")
+            try:
+                if not self.check_slots():
+                    logger.warning("초기 체크에서 슬롯을 수집하지 못했습니다 - 스케줄러는 계속 실행합니다")
+            except Exception as e:
+                logger.warning(f"초기 체크 실패: {e}")
+        else:
+            # 시스템 테스트
+            if not self.test_system():
+                logger.error("시스템 테스트 실패로 모니터링을 시작할 수 없습니다")
+                return
+            
+            # 즉시 한 번 실행
+            logger.info("초기 슬롯 체크 실행...")
+            try:
+                self.check_slots()
+            except Exception as e:
+                logger.warning(f"초기 체크 실패: {e}")
         
         # 스케줄러에 작업 추가
         self.scheduler.add_job(
             func=self.check_slots,
             trigger='interval',
-            minutes=CHECK_INTERVAL_MINUTES,
+            seconds=self._check_interval_seconds(),
             id='slot_checker',
             name='제로월드 슬롯 체크',
             misfire_grace_time=30,  # 30초까지 지연 허용
@@ -347,8 +1018,9 @@ class ZeroworldChecker:
             max_instances=1
         )
         
-        # 텔레그램 봇 polling 시작
+        # 텔레그램 봇 polling 및 로컬 서버 시작
         self._start_bot_polling()
+        self._start_local_server()
         
         # 스케줄러 시작
         try:
@@ -365,30 +1037,144 @@ class ZeroworldChecker:
         finally:
             self.stop()
     
+    def start_async(self):
+        """모니터링 시작 (비동기 런타임) - 모든 작업을 하나의 이벤트 루프에서 실행"""
+        try:
+            asyncio.run(self._run_async())
+        except KeyboardInterrupt:
+            logger.info("사용자에 의해 중단됨")
+    
+    async def _run_async(self):
+        """비동기 런타임 본체"""
+        self.loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        from .notifier import get_notifier
+        self.notifier = get_notifier()
+        self.start_time = datetime.now()
+        self._log_startup_banner()
+        
+        self_test_task = None  # 백그라운드 테스트 태스크 참조 유지 (GC 방지)
+        if self.fast_start:
+            self._warm_start()
+            self_test_task = asyncio.create_task(self._run_background_self_test_async())
+            
+            logger.info("초기 슬롯 체크 실행 (시스템 테스트 겸용)...")
+            if not await self.check_slots_async():
+                logger.warning("초기 체크에서 슬롯을 수집하지 못했습니다 - 스케줄러는 계속 실행합니다")
+        else:
+            if not await self.test_system_async():
+                logger.error("시스템 테스트 실패로 모니터링을 시작할 수 없습니다")
+                return
+            
+            logger.info("초기 슬롯 체크 실행...")
+            await self.check_slots_async()
+        
+        self.scheduler.add_job(
+            func=self.check_slots_async,
+            trigger='interval',
+            seconds=self._check_interval_seconds(),
+            id='slot_checker',
+            name='제로월드 슬롯 체크',
+            misfire_grace_time=30,
+            max_instances=1
+        )
+        self.scheduler.add_job(
+            func=self.send_status_message_async,
+            trigger='cron',
+            minute=0,
+            id='status_messenger',
+            name='모니터링 상태 메시지',
+            misfire_grace_time=60,
+            max_instances=1
+        )
+        
+        # 봇 polling은 같은 루프의 태스크로 실행
+        if self.bot_handler and self.bot_handler.application:
+            self.bot_task = asyncio.create_task(self.bot_handler.start_polling())
+            logger.info("📱 텔레그램 봇 polling 시작됨 (같은 이벤트 루프)")
+        else:
+            logger.warning("텔레그램 봇이 설정되지 않아 polling을 시작할 수 없습니다")
+        
+        self._start_local_server()
+        
+        try:
+            self.scheduler.start()
+            self.running = True
+            logger.info("⚡ 스케줄러 시작됨")
+            logger.info("모니터링 중... (Ctrl+C로 중지)")
+            
+            await self._stop_event.wait()
+        finally:
+            await self._shutdown_async()
+    
+    async def _shutdown_async(self):
+        """비동기 런타임 정리 (스케줄러, 봇 polling)"""
+        self.running = False
+        
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        
+        if self.bot_task:
+            self.bot_task.cancel()
+            try:
+                await self.bot_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            await self.bot_handler.stop_polling()
+            logger.info("📱 텔레그램 봇 polling 중지됨")
+        
+        self._stop_local_server()
+        
+        if self.prefetcher:
+            self.prefetcher.cancel()
+        from .fetch import close_fetchers
+        close_fetchers()
+        if self.notifier:
+            await self.notifier.close()
+        self._log_final_stats()
+    
+    def _log_final_stats(self):
+        """최종 통계 출력"""
+        logger.info(f"📊 최종 통계:")
+        logger.info(f"  - 총 체크 횟수: {self.check_count}")
+        logger.info(f"  - 마지막 성공: {self.last_success_time}")
+        logger.info(f"  - 에러 횟수: {self.error_count}")
+        
+        logger.info("✅ 모니터링 시스템 종료 완료")
+    
     def stop(self):
         """모니터링 중지"""
+        if self.async_mode:
+            # 실제 정리는 이벤트 루프에서 수행
+            if self.loop and self._stop_event and not self._stop_event.is_set():
+                logger.info("🛑 모니터링 중지 중...")
+                self.loop.call_soon_threadsafe(self._stop_event.set)
+            return
+        
         if self.running:
             logger.info("🛑 모니터링 중지 중...")
             self.running = False
             
-            # 텔레그램 봇 polling 중지
+            # 텔레그램 봇 polling 및 로컬 서버 중지
             self._stop_bot_polling()
+            self._stop_local_server()
             
             if self.scheduler.running:
                 self.scheduler.shutdown(wait=False)
             
-            # 최종 통계
-            logger.info(f"📊 최종 통계:")
-            logger.info(f"  - 총 체크 횟수: {self.check_count}")
-            logger.info(f"  - 마지막 성공: {self.last_success_time}")
-            logger.info(f"  - 에러 횟수: {self.error_count}")
-            
-            logger.info("✅ 모니터링 시스템 종료 완료")
+            if self.prefetcher:
+                self.prefetcher.cancel()
+            from .fetch import close_fetchers
+            close_fetchers()
+            self._log_final_stats()
     
     def run_once(self):
         """한 번만 실행 (테스트용)"""
         logger.info("🔍 단일 실행 모드")
         
+        if self.async_mode:
+            return asyncio.run(self._run_once_async())
+        
         if not self.test_system():
             logger.error("시스템 테스트 실패")
             return False
@@ -400,6 +1186,27 @@ class ZeroworldChecker:
             logger.error(f"실행 실패: {e}")
             return False
 
+    
+    async def _run_once_async(self) -> bool:
+        """한 번만 실행 (비동기 런타임)"""
+        self.loop = asyncio.get_running_loop()
+        from .notifier import get_notifier
+        self.notifier = get_notifier()
+        
+        try:
+            if not await self.test_system_async():
+                logger.error("시스템 테스트 실패")
+                return False
+            
+            await self.check_slots_async()
+            return True
+        except Exception as e:
+            logger.error(f"실행 실패: {e}")
+            return False
+        finally:
+            # 이 이벤트 루프가 끝나기 전에 HTTP 클라이언트를 닫음
+            await self.notifier.close()
+
 
 def main():
     """메인 함수"""
@@ -411,23 +1218,44 @@ def main():
     parser.add_argument('--config-test', action='store_true', help='설정 테스트')
     parser.add_argument('--bot-test', action='store_true', help='텔레그램 봇 polling 테스트')
     parser.add_argument('--railway-test', action='store_true', help='Railway API 설정 테스트')
+    parser.add_argument('--async', dest='async_mode', action='store_true', default=ASYNC_RUNTIME,
+                        help='단일 이벤트 루프 비동기 런타임으로 실행')
+    parser.add_argument('--fast-start', action='store_true', default=FAST_START,
+                        help='시작 시 중복 스윕 없이 첫 체크로 시스템 테스트 대체')
+    parser.add_argument('--profile', type=int, metavar='N',
+                        help='체크 N회를 cProfile/tracemalloc으로 프로파일링 후 보고서 저장')
+    parser.add_argument('--replay', metavar='DIR',
+                        help='실제 사이트 대신 기록된 응답 코퍼스로 실행 (예: --profile 3 --replay corpus/)')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='체크마다 span 트리를 파일에 기록 (TRACE_FILE 환경변수와 같음)')
+    parser.add_argument('--trace-format', choices=['jsonl', 'chrome'],
+                        help='트레이스 형식 (기본값: TRACE_FORMAT 또는 jsonl, chrome은 trace viewer에서 바로 열림)')
     
     args = parser.parse_args()
     
-    checker = ZeroworldChecker()
+    if args.trace or args.trace_format:
+        from .config import TRACE_FILE, TRACE_FORMAT
+        configure_tracing(args.trace or TRACE_FILE, args.trace_format or TRACE_FORMAT)
     
+    if args.replay:
+        # 이후 만들어지는 모든 fetcher가 기록된 응답을 사용 (시각도 기록 시각으로 고정)
+        from .transport import ReplayTransport, set_transport
+        set_transport(ReplayTransport(args.replay))
+    
+    # 각 모드는 필요한 것만 만든다 (ZeroworldChecker는 스케줄러/봇/로깅 싱크/시그널 핸들러를 모두 생성)
     if args.config_test:
         # 설정 확인
         logger.info("=== 설정 확인 ===")
         from .config import BOT_TOKEN, CHAT_ID
         print(f"봇 토큰: {'설정됨' if BOT_TOKEN != 'YOUR_BOT_TOKEN_HERE' else '❌ 미설정'}")
         print(f"채팅 ID: {'설정됨' if CHAT_ID != 0 else '❌ 미설정'}")
-        print(f"모니터링 기간: {DATE_START} ~ {DATE_END}")
-        print(f"대상 테마: {THEME_NAME}")
+        for target in load_watch_targets():
+            print(f"대상: {target.theme} @ {target.store} ({target.window_label()}, 채팅 {target.chat_id})")
         print(f"운영 시간: {RUN_HOURS.start:02d}:00 ~ {RUN_HOURS.stop-1:02d}:59")
         
     elif args.bot_test:
         # 텔레그램 봇 polling 테스트
+        from .notifier import test_bot_polling
         if test_bot_polling():
             logger.info("🎉 봇 polling 테스트 완료!")
             logger.info("💡 이제 텔레그램에서 /test 명령어를 입력해보세요")
@@ -447,8 +1275,16 @@ def main():
             logger.error("❌ Railway API 설정 미완료!")
             sys.exit(1)
             
+    elif args.profile:
+        # 체크 프로파일링 (알림 없이 임시 상태 파일 사용)
+        from .profiling import profile_checks
+        checker = ZeroworldChecker(async_mode=False)
+        profile_checks(checker, args.profile)
+        sys.exit(0)
+    
     elif args.test:
         # 시스템 테스트만
+        checker = ZeroworldChecker(async_mode=args.async_mode, fast_start=args.fast_start)
         if checker.test_system():
             logger.info("🎉 모든 테스트 통과!")
             sys.exit(0)
@@ -458,6 +1294,7 @@ def main():
             
     elif args.once:
         # 한 번만 실행
+        checker = ZeroworldChecker(async_mode=args.async_mode, fast_start=args.fast_start)
         if checker.run_once():
             logger.info("✅ 실행 완료")
             sys.exit(0)
@@ -466,7 +1303,10 @@ def main():
             sys.exit(1)
     else:
         # 일반 모니터링 모드
+        checker = ZeroworldChecker(async_mode=args.async_mode, fast_start=args.fast_start)
         checker.start()
+        if checker.restart_reason:
+            restart_process()
 
 
 if __name__ == "__main__":
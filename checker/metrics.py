@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+메트릭 수집 모듈
+
+체크 한 번에 걸린 시간이 어느 단계(HTML GET, API POST, 숨겨진 데이터 파싱,
+슬롯 추출, 상태 저장, 텔레그램 전송)에 쓰였는지 알 수 있도록
+단계별 지연 히스토그램과 카운터를 모아 Prometheus 텍스트 형식으로 내보낸다.
+외부 의존성 없이 동작하며, 로컬 HTTP 서버(server.py)의 /metrics 경로로 노출된다.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 요청/파싱 단계에 맞춘 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    """텍스트 형식 레이블 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """레이블별 값을 가진 메트릭 공통 부분"""
+    
+    kind = ""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames} 필요 (받은 값: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+    
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    
+    kind = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: 카운터는 감소할 수 없습니다")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+    
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values) or ({(): 0} if not self.labelnames else {})
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+    
+    kind = "gauge"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+    
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+    
+    kind = "histogram"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # 레이블 → (버킷별 개수, 합계, 개수)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+    
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+    
+    @contextmanager
+    def time(self, **labels):
+        """블록 실행 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+    
+    def count(self, **labels) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return entry[2] if entry else 0
+    
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = {key: (list(counts), total, count) for key, (counts, total, count) in self._values.items()}
+        
+        lines = []
+        for key, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 Prometheus 텍스트 출력"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+    
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"메트릭 이름 충돌: {metric.name}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+    
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+    
+    def add_collector(self, collector: Callable[[], None]):
+        """출력 직전에 호출되어 게이지 값을 갱신하는 함수 등록"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+    
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = list(self._metrics.values())
+        
+        for collector in collectors:
+            try:
+                collector()
+            except Exception:
+                # 수집 함수 오류가 /metrics 전체를 막지 않도록 무시
+                pass
+        
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# 전역 레지스트리
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> MetricsRegistry:
+    """전역 메트릭 레지스트리 반환"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+    return _registry
+
+
+# 체크 파이프라인 공통 메트릭
+STAGE_SECONDS = get_registry().histogram(
+    "zeroworld_stage_seconds",
+    "체크 단계별 소요 시간 (session_init, html_get, api_post, hidden_parse, extract, state_save, telegram_send)",
+    ("stage",),
+)
+CHECK_SECONDS = get_registry().histogram(
+    "zeroworld_check_seconds", "슬롯 체크 1회 소요 시간",
+    buckets=(1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0),
+)
+CHECKS_TOTAL = get_registry().counter("zeroworld_checks_total", "실행한 슬롯 체크 수")
+CHECK_ERRORS_TOTAL = get_registry().counter("zeroworld_check_errors_total", "오류로 끝난 슬롯 체크 수")
+SLOTS_OPENED_TOTAL = get_registry().counter(
+    "zeroworld_slots_opened_total", "새로 예약 가능해진 슬롯 수", ("target",)
+)
+SLOTS_CLOSED_TOTAL = get_registry().counter(
+    "zeroworld_slots_closed_total", "새로 매진된 슬롯 수", ("target",)
+)
+CIRCUIT_STATE = get_registry().gauge(
+    "zeroworld_circuit_state", "매장별 서킷 상태 (0=closed, 1=half_open, 2=open)", ("store",)
+)
+CIRCUIT_TRIPS_TOTAL = get_registry().counter(
+    "zeroworld_circuit_trips_total", "서킷이 open으로 전환된 횟수", ("store",)
+)
+
+
+def stage_timer(stage: str):
+    """체크 단계 소요 시간 기록용 컨텍스트 매니저 (예: with stage_timer("html_get"): ...)"""
+    return STAGE_SECONDS.time(stage=stage)
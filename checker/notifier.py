@@ -6,32 +6,359 @@
 """
 
 import asyncio
+import re
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 
 try:
     from telegram import Bot, Update
-    from telegram.ext import Application, CommandHandler, ContextTypes
+    from telegram.ext import Application, BaseRateLimiter, CommandHandler, ContextTypes
     from telegram.error import TelegramError, RetryAfter, NetworkError
     TELEGRAM_AVAILABLE = True
 except ImportError:
     logger.warning("python-telegram-bot가 설치되지 않았습니다. 텔레그램 알림이 비활성화됩니다.")
     TELEGRAM_AVAILABLE = False
 
-from .config import BOT_TOKEN, CHAT_ID, MAX_NOTIFICATION_SLOTS, NOTIFICATION_COOLDOWN
+from .metrics import get_registry, stage_timer
+from .config import (
+    BOT_TOKEN, CHAT_ID, MAX_NOTIFICATION_SLOTS, NOTIFICATION_COOLDOWN, RESERVATION_URL,
+    BRANCH_THEME_MAPPING, ADMIN_CHAT_IDS, TELEGRAM_SEND_RATE_PER_MINUTE, TELEGRAM_SEND_BURST, TELEGRAM_SLOT_RESERVE,
+    TELEGRAM_REPLY_MAX_WAIT, TELEGRAM_SLOT_RETRY_MAX_WAIT, TELEGRAM_MAX_DEFERRED
+)
+
+# /watch 명령어의 날짜 인자 (YYYY-MM-DD)
+DATE_ARG_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+# 전송 우선순위 레인 (숫자가 작을수록 먼저)
+PRIORITY_SLOT = 0     # 예약 가능 슬롯 알림
+PRIORITY_REPLY = 1    # 봇 명령어 응답
+PRIORITY_ERROR = 2    # 오류 알림
+PRIORITY_STATUS = 3   # 정각 상태 메시지
+PRIORITY_NAMES = {
+    PRIORITY_SLOT: 'slot',
+    PRIORITY_REPLY: 'reply',
+    PRIORITY_ERROR: 'error',
+    PRIORITY_STATUS: 'status',
+}
+
+TELEGRAM_SEND_TOTAL = get_registry().counter(
+    "zeroworld_telegram_send_total",
+    "텔레그램 전송 결과 (sent: 전송, deferred: 보류, coalesced: 보류 중인 메시지에 합침, dropped: 보류 한도 초과로 버림)",
+    ("lane", "result"),
+)
+
+# 하위 레인이 슬롯 알림을 기다릴 때 상태 확인 간격(초)
+YIELD_POLL_SECONDS = 0.2
+
+
+def _retry_after_seconds(error) -> float:
+    """RetryAfter.retry_after (int 또는 timedelta) → 초"""
+    retry_after = error.retry_after
+    if hasattr(retry_after, 'total_seconds'):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class DeferredMessage:
+    """압박 상태에서 보류한 하위 레인 메시지"""
+    
+    __slots__ = ('priority', 'chat_id', 'text', 'summary', 'kwargs', 'count', 'first_at')
+    
+    def __init__(self, priority: int, chat_id: int, text: str, summary: str, kwargs: Dict[str, Any]):
+        self.priority = priority
+        self.chat_id = chat_id
+        self.text = text
+        self.summary = summary
+        self.kwargs = kwargs
+        self.count = 1
+        self.first_at = datetime.now()
+
+
+class SendScheduler:
+    """
+    텔레그램 전송 우선순위 스케줄러
+    
+    모든 전송이 토큰 버킷 하나(분당 TELEGRAM_SEND_RATE_PER_MINUTE)를 나눠 쓴다.
+    슬롯 알림은 버킷이 비었거나 RetryAfter 대기 중일 때만 기다리고, 하위 레인은
+    슬롯 알림이 대기/전송 중이거나 남은 토큰이 예비분(TELEGRAM_SLOT_RESERVE) 이하면 압박 상태로 본다.
+    압박 상태에서
+    - 봇 응답: 최대 TELEGRAM_REPLY_MAX_WAIT초 양보한 뒤 전송
+    - 오류 알림: 보류하고 같은 내용은 횟수만 늘려 합침 (여러 건이면 한 메시지로 묶어 전송)
+    - 상태 메시지: 가장 최근 것 하나만 보류
+    보류한 메시지는 다음 하위 레인 전송이 끝난 뒤나 체크가 끝날 때 여유가 있으면 보낸다.
+    """
+    
+    def __init__(self, rate_per_minute: float = TELEGRAM_SEND_RATE_PER_MINUTE,
+                 burst: int = TELEGRAM_SEND_BURST, slot_reserve: int = TELEGRAM_SLOT_RESERVE,
+                 max_deferred: int = TELEGRAM_MAX_DEFERRED):
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.slot_reserve = slot_reserve
+        self.max_deferred = max_deferred
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        # RetryAfter로 모든 전송을 멈춰야 하는 시각
+        self._blocked_until = 0.0
+        # 대기/전송 중인 슬롯 알림 수 (0보다 크면 하위 레인은 양보)
+        self._slots_pending = 0
+        self._deferred: "OrderedDict[Tuple[int, int, str], DeferredMessage]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 동기 전송 차례 (공유 Bot은 한 번에 한 이벤트 루프에서만 사용)
+        self._turn = threading.Condition()
+        self._turn_busy = False
+        self._turn_waiting: List[int] = []
+    
+    def _wait_seconds_locked(self, priority: int) -> float:
+        """지금 보낼 수 있으면 토큰을 쓰고 0, 아니면 기다려야 할 초 (잠금 보유)"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if priority != PRIORITY_SLOT and self._slots_pending:
+            return YIELD_POLL_SECONDS
+        
+        needed = 1 if priority == PRIORITY_SLOT else 1 + self.slot_reserve
+        if self._tokens < needed:
+            return (needed - self._tokens) / self.rate
+        self._tokens -= 1
+        return 0.0
+    
+    async def acquire(self, priority: int, max_wait: Optional[float] = None) -> bool:
+        """
+        전송 차례 기다리기
+        
+        Args:
+            priority: 전송 레인
+            max_wait: 최대 대기(초), None이면 차례가 올 때까지
+        
+        Returns:
+            bool: 차례를 얻으면 True, max_wait 안에 얻지 못하면 False
+        """
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            with self._lock:
+                wait = self._wait_seconds_locked(priority)
+            if wait <= 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            await asyncio.sleep(min(wait, 1.0))
+    
+    def block_for(self, seconds: float):
+        """RetryAfter 기록 - 그동안 모든 레인 전송 중지"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+    
+    def under_pressure(self) -> bool:
+        """슬롯 알림 대기 중이거나 RetryAfter 대기 중인지 (하위 레인 전송을 미룰 상황)"""
+        with self._lock:
+            return bool(self._slots_pending) or time.monotonic() < self._blocked_until
+    
+    def has_deferred(self) -> bool:
+        with self._lock:
+            return bool(self._deferred)
+    
+    @contextmanager
+    def slot_pending(self):
+        """슬롯 알림 전송 구간 표시 (이 구간 동안 하위 레인은 양보)"""
+        with self._lock:
+            self._slots_pending += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._slots_pending -= 1
+    
+    @contextmanager
+    def sync_turn(self, priority: int):
+        """동기 전송 차례 (여러 스레드가 기다리면 우선순위가 높은 레인부터)"""
+        with self._turn:
+            self._turn_waiting.append(priority)
+            while self._turn_busy or min(self._turn_waiting) < priority:
+                self._turn.wait()
+            self._turn_waiting.remove(priority)
+            self._turn_busy = True
+        try:
+            yield
+        finally:
+            with self._turn:
+                self._turn_busy = False
+                self._turn.notify_all()
+    
+    def defer(self, priority: int, chat_id: int, text: str, summary: str, kwargs: Dict[str, Any]):
+        """하위 레인 메시지 보류 (같은 내용이 이미 보류 중이면 합침)"""
+        lane = PRIORITY_NAMES[priority]
+        # 상태 메시지는 최신 것 하나만 의미가 있으므로 채팅별로 덮어씀
+        key = (priority, chat_id, summary if priority != PRIORITY_STATUS else '')
+        with self._lock:
+            entry = self._deferred.get(key)
+            if entry is not None:
+                entry.count += 1
+                entry.text = text
+                entry.kwargs = kwargs
+                TELEGRAM_SEND_TOTAL.inc(lane=lane, result="coalesced")
+                return
+            
+            self._deferred[key] = DeferredMessage(priority, chat_id, text, summary, kwargs)
+            TELEGRAM_SEND_TOTAL.inc(lane=lane, result="deferred")
+            while len(self._deferred) > self.max_deferred:
+                # 가장 낮은 우선순위 중 가장 오래된 메시지부터 버림
+                drop_key = max(self._deferred, key=lambda k: k[0])
+                dropped = self._deferred.pop(drop_key)
+                TELEGRAM_SEND_TOTAL.inc(lane=PRIORITY_NAMES[dropped.priority], result="dropped")
+                logger.warning(f"📮 보류 메시지 한도 초과 - {PRIORITY_NAMES[dropped.priority]} 메시지 버림")
+        logger.info(f"📮 {lane} 메시지 보류 (슬롯 알림 우선 또는 전송 한도)")
+    
+    async def send(self, bot, priority: int, chat_id: int, text: str,
+                   summary: Optional[str] = None, **kwargs) -> bool:
+        """
+        레인 규칙에 따라 메시지 전송
+        
+        슬롯 알림은 차례가 올 때까지 기다려 전송하고 RetryAfter면 한 번 재전송한다.
+        오류/상태 메시지는 압박 상태거나 RetryAfter를 받으면 보류한다.
+        
+        Args:
+            bot: 전송에 사용할 Bot (호출한 이벤트 루프에서 열린 것)
+            priority: 전송 레인 (PRIORITY_*)
+            summary: 보류 메시지를 합칠 때 쓰는 원문 (None이면 text)
+        
+        Returns:
+            bool: 전송했거나 보류했으면 True
+        """
+        lane = PRIORITY_NAMES[priority]
+        
+        if priority == PRIORITY_SLOT:
+            with self.slot_pending():
+                await self.acquire(priority)
+                try:
+                    await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+                except RetryAfter as e:
+                    seconds = _retry_after_seconds(e)
+                    self.block_for(seconds)
+                    if seconds > TELEGRAM_SLOT_RETRY_MAX_WAIT:
+                        raise
+                    logger.warning(f"텔레그램 속도 제한 - 슬롯 알림 {seconds:.0f}초 후 재전송")
+                    await self.acquire(priority)
+                    await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+        else:
+            if not await self.acquire(priority, max_wait=0):
+                self.defer(priority, chat_id, text, summary or text, kwargs)
+                return True
+            try:
+                await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+            except RetryAfter as e:
+                self.block_for(_retry_after_seconds(e))
+                self.defer(priority, chat_id, text, summary or text, kwargs)
+                return True
+        
+        TELEGRAM_SEND_TOTAL.inc(lane=lane, result="sent")
+        # 슬롯 알림 뒤에는 보류 메시지를 보내지 않음 (체크가 끝난 뒤 한 번에 flush)
+        if priority != PRIORITY_SLOT:
+            await self.flush(bot)
+        return True
+    
+    def _pop_sendable(self) -> Optional[Tuple[int, int, str, Dict[str, Any]]]:
+        """차례를 얻을 수 있으면 다음 보낼 보류 메시지 꺼내기 (같은 채팅의 오류는 한 메시지로 묶음)"""
+        with self._lock:
+            if not self._deferred:
+                return None
+            key = min(self._deferred, key=lambda k: k[0])
+            priority, chat_id, _ = key
+            if self._wait_seconds_locked(priority) > 0:
+                return None
+            
+            keys = [k for k in self._deferred if k[0] == priority and k[1] == chat_id]
+            entries = [self._deferred.pop(k) for k in keys]
+        
+        if priority != PRIORITY_ERROR:
+            entry = entries[-1]
+            return priority, chat_id, entry.text, entry.kwargs
+        
+        if len(entries) == 1:
+            entry = entries[0]
+            text = entry.text
+            if entry.count > 1:
+                text += f"\n\n🔁 {entry.first_at.strftime('%H:%M:%S')}부터 {entry.count}회 발생"
+            return priority, chat_id, text, entry.kwargs
+        
+        lines = [f"⚠️ <b>보류된 오류 알림 {len(entries)}건</b>", ""]
+        for entry in entries:
+            repeat = f" ({entry.count}회)" if entry.count > 1 else ""
+            lines.append(f"• [{entry.first_at.strftime('%H:%M:%S')}] {entry.summary}{repeat}")
+        lines.append("")
+        lines.append(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        return priority, chat_id, "\n".join(lines), entries[-1].kwargs
+    
+    async def flush(self, bot) -> int:
+        """여유가 있는 만큼 보류 메시지 전송 (전송한 메시지 수 반환)"""
+        sent = 0
+        while True:
+            item = self._pop_sendable()
+            if item is None:
+                return sent
+            priority, chat_id, text, kwargs = item
+            try:
+                await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+            except RetryAfter as e:
+                self.block_for(_retry_after_seconds(e))
+                self.defer(priority, chat_id, text, text, kwargs)
+                return sent
+            except Exception as e:
+                logger.error(f"보류 메시지 전송 실패 ({PRIORITY_NAMES[priority]}): {e}")
+                return sent
+            TELEGRAM_SEND_TOTAL.inc(lane=PRIORITY_NAMES[priority], result="sent")
+            sent += 1
+            logger.info(f"📮 보류했던 {PRIORITY_NAMES[priority]} 메시지 전송")
+
+
+# 전역 전송 스케줄러 (모든 Bot과 이벤트 루프가 공유)
+_send_scheduler: Optional[SendScheduler] = None
+_send_scheduler_lock = threading.Lock()
+
+
+def get_send_scheduler() -> SendScheduler:
+    """전역 전송 스케줄러 반환"""
+    global _send_scheduler
+    with _send_scheduler_lock:
+        if _send_scheduler is None:
+            _send_scheduler = SendScheduler()
+    return _send_scheduler
 
 
 class TelegramNotifier:
     """텔레그램 알림 전송 클래스"""
     
-    def __init__(self, bot_token: str = BOT_TOKEN, chat_id: int = CHAT_ID):
+    def __init__(self, bot_token: str = BOT_TOKEN, chat_id: int = CHAT_ID, bot=None):
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.bot = None
-        self.last_notification_time = 0
-        self._initialize_bot()
+        # bot을 넘기면 이미 만든 Bot(HTTP 클라이언트)을 재사용
+        self.bot = bot
+        self.scheduler = get_send_scheduler()
+        # (채팅, 테마, 예약 링크)별 마지막 슬롯 알림 (슬롯 묶음, 시각) - 같은 슬롯 묶음 반복만 쿨타임 적용
+        self.last_notifications: Dict[Tuple[int, str, str], Tuple[FrozenSet[str], float]] = {}
+        if self.bot is None:
+            self._initialize_bot()
+    
+    async def open(self):
+        """HTTP 클라이언트 준비 (close 이후 다시 사용하면 새로 생성)"""
+        if self.bot:
+            await self.bot.request.initialize()
+    
+    async def close(self):
+        """HTTP 클라이언트 닫기 (이 객체를 사용한 이벤트 루프가 끝나기 전에 호출)"""
+        if self.bot:
+            await self.bot.request.shutdown()
     
     def _initialize_bot(self):
         """봇 초기화"""
@@ -97,20 +424,30 @@ class TelegramNotifier:
             logger.error(f"연결 테스트 중 예상치 못한 오류: {e}")
             return False
     
-    def _should_send_notification(self) -> bool:
-        """알림 전송 가능 여부 확인 (쿨타임 체크)"""
-        current_time = time.time()
-        if current_time - self.last_notification_time < NOTIFICATION_COOLDOWN:
-            remaining = NOTIFICATION_COOLDOWN - (current_time - self.last_notification_time)
-            logger.info(f"알림 쿨타임 중입니다. {remaining:.0f}초 후 재시도 가능")
+    def _should_send_notification(self, key: Tuple[int, str, str], slots: FrozenSet[str]) -> bool:
+        """알림 전송 가능 여부 확인 (같은 채팅/대상에 같은 슬롯 묶음을 쿨타임 안에 다시 보내지 않음)"""
+        last = self.last_notifications.get(key)
+        if last is None or last[0] != slots:
+            return True
+        elapsed = time.time() - last[1]
+        if elapsed < NOTIFICATION_COOLDOWN:
+            logger.info(
+                f"같은 슬롯 알림 쿨타임 중입니다 (채팅 {key[0]}, {key[1]}). "
+                f"{NOTIFICATION_COOLDOWN - elapsed:.0f}초 후 다시 알림"
+            )
             return False
         return True
     
-    def _format_slots_message(self, new_slots: List[str]) -> str:
+    def _format_slots_message(self, new_slots: List[str], theme_name: Optional[str] = None,
+                              reservation_url: str = RESERVATION_URL) -> str:
         """슬롯 정보를 메시지 형식으로 포맷팅"""
         if not new_slots:
             return ""
         
+        if not theme_name:
+            from .config import THEME_NAME
+            theme_name = THEME_NAME
+        
         # 슬롯 개수 제한
         slots_to_show = new_slots[:MAX_NOTIFICATION_SLOTS]
         
@@ -131,26 +468,35 @@ class TelegramNotifier:
                 time_formatted = time_part[:5] if len(time_part) >= 5 else time_part
                 
                 # 메시지 라인 생성: "예약가능확인! {테마이름} 7월30일, 14:00"
-                from .config import THEME_NAME
-                line = f"예약가능확인! {THEME_NAME} {date_korean}, {time_formatted}"
+                line = f"예약가능확인! {theme_name} {date_korean}, {time_formatted}"
                 message_lines.append(line)
                 
             except (ValueError, IndexError) as e:
                 # 파싱 오류시 원본 그대로 사용
-                message_lines.append(f"예약가능확인! 층간소음 {slot}")
+                message_lines.append(f"예약가능확인! {theme_name} {slot}")
         
         # 더 많은 슬롯이 있는 경우 안내 추가
         if len(new_slots) > MAX_NOTIFICATION_SLOTS:
             message_lines.append(f"... 외 {len(new_slots) - MAX_NOTIFICATION_SLOTS}개 슬롯 더 있음")
         
         # 예약 링크 추가
-        message_lines.append("https://zerohongdae.com/reservation")
+        message_lines.append(reservation_url)
         
         # 줄바꿈으로 연결하여 반환
         return "\n".join(message_lines)
     
-    async def send_notification(self, new_slots: List[str]) -> bool:
-        """새로 예약 가능해진 슬롯 알림 전송"""
+    async def send_notification(self, new_slots: List[str], theme_name: Optional[str] = None,
+                                chat_id: Optional[int] = None,
+                                reservation_url: str = RESERVATION_URL) -> bool:
+        """
+        새로 예약 가능해진 슬롯 알림 전송
+        
+        Args:
+            new_slots: 알림할 슬롯 리스트
+            theme_name: 메시지에 표시할 테마 (None이면 THEME_NAME)
+            chat_id: 받을 채팅 ID (None이면 기본 채팅)
+            reservation_url: 메시지에 붙일 예약 페이지 링크
+        """
         if not self.bot:
             logger.error("텔레그램 봇이 초기화되지 않았습니다")
             return False
@@ -159,20 +505,24 @@ class TelegramNotifier:
             logger.info("알림할 새로운 슬롯이 없습니다")
             return True
         
-        if not self._should_send_notification():
-            return False
+        chat_id = chat_id or self.chat_id
+        key = (chat_id, theme_name or '', reservation_url)
+        slots = frozenset(new_slots)
+        if not self._should_send_notification(key, slots):
+            # 이미 이 채팅에 보낸 알림이므로 전송된 것으로 처리
+            return True
         
         try:
-            message = self._format_slots_message(new_slots)
+            message = self._format_slots_message(new_slots, theme_name, reservation_url)
             
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode='HTML',
-                disable_web_page_preview=True
-            )
+            with stage_timer('telegram_send'):
+                await self.scheduler.send(
+                    self.bot, PRIORITY_SLOT, chat_id, message,
+                    parse_mode='HTML',
+                    disable_web_page_preview=True
+                )
             
-            self.last_notification_time = time.time()
+            self.last_notifications[key] = (slots, time.time())
             logger.info(f"알림 전송 완료: {len(new_slots)}개 새로운 슬롯")
             return True
             
@@ -197,9 +547,10 @@ class TelegramNotifier:
         try:
             message = f"⚠️ <b>제로월드 모니터링 오류</b>\n\n{error_message}\n\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
+            # 슬롯 알림이 밀려 있으면 보류했다가 같은 오류끼리 합쳐서 전송
+            await self.scheduler.send(
+                self.bot, PRIORITY_ERROR, self.chat_id, message,
+                summary=error_message,
                 parse_mode='HTML'
             )
             
@@ -210,15 +561,14 @@ class TelegramNotifier:
             logger.error(f"에러 알림 전송 실패: {e}")
             return False
     
-    async def _send_status_message_async(self, status_message: str) -> bool:
+    async def send_status_message(self, status_message: str) -> bool:
         """상태 메시지 전송 (비동기)"""
         if not self.bot:
             return False
         
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=status_message,
+            await self.scheduler.send(
+                self.bot, PRIORITY_STATUS, self.chat_id, status_message,
                 parse_mode='HTML'
             )
             
@@ -228,6 +578,42 @@ class TelegramNotifier:
         except Exception as e:
             logger.error(f"상태 메시지 전송 실패: {e}")
             return False
+    
+    async def flush_deferred(self) -> int:
+        """보류 중인 오류/상태 메시지를 여유가 있는 만큼 전송"""
+        if not self.bot or not self.scheduler.has_deferred():
+            return 0
+        return await self.scheduler.flush(self.bot)
+
+
+if TELEGRAM_AVAILABLE:
+    class ReplyRateLimiter(BaseRateLimiter):
+        """봇 명령어 응답을 응답 레인으로 보내는 PTB rate limiter (슬롯 알림이 밀려 있으면 잠시 양보)"""
+        
+        def __init__(self, max_wait: float = TELEGRAM_REPLY_MAX_WAIT):
+            self.max_wait = max_wait
+        
+        async def initialize(self):
+            pass
+        
+        async def shutdown(self):
+            pass
+        
+        async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+            if not endpoint.startswith('send'):
+                # getUpdates 등 전송이 아닌 요청은 그대로
+                return await callback(*args, **kwargs)
+            
+            scheduler = get_send_scheduler()
+            if not await scheduler.acquire(PRIORITY_REPLY, self.max_wait):
+                logger.debug(f"응답 대기 {self.max_wait:.0f}초 초과 - 그대로 전송")
+            try:
+                result = await callback(*args, **kwargs)
+            except RetryAfter as e:
+                scheduler.block_for(_retry_after_seconds(e))
+                raise
+            TELEGRAM_SEND_TOTAL.inc(lane=PRIORITY_NAMES[PRIORITY_REPLY], result="sent")
+            return result
 
 
 class TelegramBotHandler:
@@ -245,7 +631,10 @@ class TelegramBotHandler:
                 write_timeout=10,
                 connect_timeout=10
             )
-            self.application = Application.builder().token(BOT_TOKEN).request(request).build()
+            self.application = (
+                Application.builder().token(BOT_TOKEN).request(request)
+                .rate_limiter(ReplyRateLimiter()).build()
+            )
             self._setup_handlers()
     
     def _setup_handlers(self):
@@ -269,11 +658,21 @@ class TelegramBotHandler:
         # /branch 명령어 핸들러 (브랜치 전환용)
         self.application.add_handler(CommandHandler("branch", self.handle_branch_command))
         
+        # 모니터링 설정 변경 명령어 (재배포 없이 다음 체크부터 적용)
+        self.application.add_handler(CommandHandler("watch", self.handle_watch_command))
+        self.application.add_handler(CommandHandler("unwatch", self.handle_unwatch_command))
+        self.application.add_handler(CommandHandler("watchlist", self.handle_watchlist_command))
+        self.application.add_handler(CommandHandler("interval", self.handle_interval_command))
+        
+        # 채팅별 알림 필터
+        self.application.add_handler(CommandHandler("subscribe", self.handle_subscribe_command))
+        self.application.add_handler(CommandHandler("unsubscribe", self.handle_unsubscribe_command))
+        
         # 모든 메시지 핸들러 (디버깅용 - 마지막에 등록)
         from telegram.ext import MessageHandler, filters
         self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_all_messages))
         
-        logger.info("🎯 텔레그램 봇 핸들러 등록 완료: /status, /help, /start, /test, /branch")
+        logger.info("🎯 텔레그램 봇 핸들러 등록 완료: /status, /help, /start, /test, /branch, /watch, /unwatch, /watchlist, /interval, /subscribe, /unsubscribe")
     
     async def handle_status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
@@ -321,11 +720,16 @@ class TelegramBotHandler:
         help_msg = (
             f"🤖 <b>제로월드 모니터링 봇 명령어</b>\n\n"
             f"📊 <b>/status</b> - 현재 모니터링 상태 확인\n"
-            f"🌿 <b>/branch</b> - Railway 브랜치 전환 및 배포\n"
-            f"   • <code>/branch main</code> - 메인 브랜치 (층간소음 테마)\n"
-            f"   • <code>/branch test</code> - 테스트 브랜치 (사랑하는감? 테마)\n"
-            f"   • ⏱️ 브랜치 전환 후 약 2-3분 소요\n"
-            f"   • 🎯 테스트 브랜치는 예약 슬롯이 많아 테스트 용이\n"
+            f"🌿 <b>/branch</b> - 브랜치 테마로 모니터링 전환\n"
+            f"   • <code>/branch main</code> - 층간소음 테마\n"
+            f"   • <code>/branch test</code> - 사랑하는감? 테마\n"
+            f"   • 🎯 테스트 테마는 예약 슬롯이 많아 테스트 용이\n"
+            f"👀 <b>/watch</b> 테마 [시작일] [종료일] - 모니터링 대상 추가/기간 변경\n"
+            f"🗑️ <b>/unwatch</b> 테마 - 모니터링 대상 제거\n"
+            f"🎯 <b>/watchlist</b> - 모니터링 대상 목록\n"
+            f"🔄 <b>/interval</b> 초 - 기본 체크 간격 변경\n"
+            f"📬 <b>/subscribe</b> [테마] [요일] [시간대] [날짜] - 이 채팅의 알림 필터\n"
+            f"📭 <b>/unsubscribe</b> - 알림 필터 해제\n"
             f"🧪 <b>/test</b> - 봇 연결 테스트\n"
             f"❓ <b>/help</b> - 이 도움말 보기\n"
             f"🚀 <b>/start</b> - 봇 시작 인사\n\n"
@@ -334,8 +738,8 @@ class TelegramBotHandler:
             f"• 매 정각 상태 메시지 전송\n"
             f"• 오류 발생 시 자동 알림\n\n"
             f"⚠️ <b>주의사항:</b>\n"
-            f"• 브랜치 전환은 새로운 배포를 시작합니다\n"
-            f"• 전환 중에는 잠시 서비스가 중단될 수 있습니다"
+            f"• 설정 변경은 재시작 없이 다음 체크부터 적용됩니다\n"
+            f"• 변경한 설정은 재시작 후에도 유지됩니다"
         )
         
         await update.message.reply_text(help_msg, parse_mode='HTML')
@@ -374,19 +778,22 @@ class TelegramBotHandler:
     
     async def handle_branch_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
-        /branch 명령어 처리 - Railway 브랜치 수동 변경 안내
+        /branch 명령어 처리 - 브랜치에 해당하는 테마로 모니터링 전환 (재배포 없이 다음 체크부터 적용)
         사용법: /branch main | /branch test
         """
         try:
+            if not await self._require_admin(update):
+                return
+            
             user_name = update.effective_user.first_name
 
             # 인자 확인
             if not context.args:
                 help_msg = (
-                    f"🌿 <b>브랜치 변경 안내</b>\n\n"
+                    f"🌿 <b>테마 전환 안내</b>\n\n"
                     f"📖 <b>사용법:</b>\n"
-                    f"• <code>/branch main</code> - 메인 브랜치 (층간소음 테마)\n"
-                    f"• <code>/branch test</code> - 테스트 브랜치 (사랑하는감? 테마)"
+                    f"• <code>/branch main</code> - 층간소음 테마\n"
+                    f"• <code>/branch test</code> - 사랑하는감? 테마"
                 )
                 await update.message.reply_text(help_msg, parse_mode='HTML')
                 return
@@ -404,33 +811,279 @@ class TelegramBotHandler:
                 await update.message.reply_text(error_msg, parse_mode='HTML')
                 return
 
-            # Railway 프로젝트/서비스 ID 가져오기
-            import os
-            project_id = os.getenv("RAILWAY_PROJECT_ID")
-            service_id = os.getenv("RAILWAY_SERVICE_ID")
+            if not self._require_monitor():
+                await update.message.reply_text("❌ 모니터링 인스턴스가 설정되지 않았습니다.")
+                return
 
-            settings_url = "https://railway.app"
-            if project_id and service_id:
-                settings_url = f"https://railway.app/project/{project_id}/service/{service_id}?view=settings"
+            # 브랜치 테마를 추가한 뒤 다른 브랜치 테마 제거 (마지막 대상이 비지 않도록 순서 유지)
+            from .targets import WatchTarget
+            theme = BRANCH_THEME_MAPPING[branch_name]
+            self.monitor_instance.add_watch_target(WatchTarget(theme))
+            for other_theme in set(BRANCH_THEME_MAPPING.values()) - {theme}:
+                self.monitor_instance.remove_watch_target(other_theme)
 
-            # 안내 메시지 생성
-            manual_change_msg = (
-                f"🌿 <b>브랜치 수동 변경 안내</b>\n\n"
-                f"현재 자동 브랜치 변경은 지원되지 않습니다.\n"
-                f"대신 아래 링크에서 직접 브랜치를 변경해주세요.\n\n"
+            switch_msg = (
+                f"🌿 <b>테마 전환 예약</b>\n\n"
                 f"<b>요청 브랜치:</b> {branch_name}\n"
-                f"<b>변경될 테마:</b> {'층간소음' if branch_name == 'main' else '사랑하는감?'}\n\n"
-                f"<a href='{settings_url}'>🔗 <b>Railway 서비스 설정으로 이동</b></a>\n\n"
-                f"페이지 접속 후 'Service Source'에서 브랜치를 변경하고 'Deploy' 버튼을 누르면 적용됩니다."
+                f"<b>변경될 테마:</b> {theme}\n\n"
+                f"⏱️ 재배포 없이 다음 체크부터 적용됩니다."
             )
 
-            await update.message.reply_text(manual_change_msg, parse_mode='HTML', disable_web_page_preview=True)
-            logger.info(f"사용자 {user_name}에게 '{branch_name}' 브랜치 수동 변경을 안내했습니다.")
+            await update.message.reply_text(switch_msg, parse_mode='HTML')
+            logger.info(f"사용자 {user_name}이 '{branch_name}' 브랜치 테마({theme})로 전환했습니다.")
 
         except Exception as e:
             logger.error(f"/branch 명령어 처리 중 오류: {e}")
             await update.message.reply_text("❌ 명령어 처리 중 오류가 발생했습니다.")
     
+    async def _require_admin(self, update: Update) -> bool:
+        """설정 변경 명령은 관리자 채팅(TELEGRAM_CHAT_ID, ADMIN_CHAT_IDS)에서만 허용"""
+        if update.effective_chat.id in ADMIN_CHAT_IDS:
+            return True
+        logger.warning(f"관리자가 아닌 채팅의 설정 변경 명령 거부: {update.effective_chat.id} ({update.message.text})")
+        await update.message.reply_text("❌ 이 명령어는 관리자 채팅에서만 사용할 수 있습니다.")
+        return False
+    
+    def _require_monitor(self) -> bool:
+        """설정 변경 명령에 필요한 모니터링 인스턴스 확인"""
+        return self.monitor_instance is not None and hasattr(self.monitor_instance, 'add_watch_target')
+    
+    async def handle_watch_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """
+        /watch 명령어 처리 - 모니터링 대상 추가/기간 변경 (재배포 없이 다음 체크부터 적용)
+        사용법: /watch <테마> [시작일] [종료일] [매장 URL]
+        """
+        try:
+            if not await self._require_admin(update):
+                return
+            
+            if not self._require_monitor():
+                await update.message.reply_text("❌ 모니터링 인스턴스가 설정되지 않았습니다.")
+                return
+            
+            if not context.args:
+                await update.message.reply_text(
+                    f"👀 <b>모니터링 대상 추가</b>\n\n"
+                    f"📖 <b>사용법:</b>\n"
+                    f"• <code>/watch 층간소음</code> - 오늘부터 롤링 기간으로 추가\n"
+                    f"• <code>/watch 층간소음 2025-11-01 2025-11-30</code> - 기간 지정 (이미 있으면 기간 변경)\n"
+                    f"• 매장 URL(https://...)을 함께 주면 다른 매장도 모니터링 (ALLOWED_STORE_HOSTS에 있는 매장만)",
+                    parse_mode='HTML'
+                )
+                return
+            
+            from .targets import WatchTarget
+            store = next((arg for arg in context.args if arg.startswith("http")), None)
+            dates = [arg for arg in context.args if DATE_ARG_PATTERN.fullmatch(arg)]
+            theme = " ".join(arg for arg in context.args if arg != store and arg not in dates)
+            if not theme or len(dates) > 2:
+                await update.message.reply_text("❌ 테마 이름과 최대 2개의 날짜(YYYY-MM-DD)를 입력해주세요.")
+                return
+            
+            entry = {'theme': theme, 'chat_id': update.effective_chat.id}
+            if store:
+                entry['store'] = store
+            if dates:
+                entry['date_start'] = dates[0]
+            if len(dates) > 1:
+                entry['date_end'] = dates[1]
+            
+            target = WatchTarget.from_dict(entry)
+            added = self.monitor_instance.add_watch_target(target)
+            
+            await update.message.reply_text(
+                f"✅ <b>모니터링 대상 {'추가' if added else '변경'}</b>\n\n"
+                f"🎯 <b>테마:</b> {target.theme}\n"
+                f"🏠 <b>매장:</b> {target.store}\n"
+                f"📅 <b>기간:</b> {target.window_label()}\n\n"
+                f"⏱️ 다음 체크부터 적용됩니다.",
+                parse_mode='HTML'
+            )
+            logger.info(f"사용자 {update.effective_user.first_name}이 /watch 명령어 실행: {target}")
+            
+        except ValueError as e:
+            await update.message.reply_text(f"❌ 잘못된 입력입니다: {e}")
+        except Exception as e:
+            logger.error(f"/watch 명령어 처리 중 오류: {e}")
+            await update.message.reply_text("❌ 명령어 처리 중 오류가 발생했습니다.")
+    
+    async def handle_unwatch_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """
+        /unwatch 명령어 처리 - 모니터링 대상 제거 (다음 체크부터 적용)
+        사용법: /unwatch <테마>
+        """
+        try:
+            if not await self._require_admin(update):
+                return
+            
+            if not self._require_monitor():
+                await update.message.reply_text("❌ 모니터링 인스턴스가 설정되지 않았습니다.")
+                return
+            
+            if not context.args:
+                await update.message.reply_text(
+                    "📖 사용법: <code>/unwatch 층간소음</code>", parse_mode='HTML'
+                )
+                return
+            
+            name = " ".join(context.args)
+            removed = self.monitor_instance.remove_watch_target(name)
+            if not removed:
+                await update.message.reply_text(f"❌ '{name}' 모니터링 대상이 없습니다. /watchlist 로 확인하세요.")
+                return
+            
+            await update.message.reply_text(
+                f"🗑️ <b>모니터링 대상 제거:</b> {', '.join(target.key for target in removed)}\n\n"
+                f"⏱️ 다음 체크부터 적용됩니다.",
+                parse_mode='HTML'
+            )
+            logger.info(f"사용자 {update.effective_user.first_name}이 /unwatch 명령어 실행: {name}")
+            
+        except ValueError as e:
+            await update.message.reply_text(f"❌ {e}")
+        except Exception as e:
+            logger.error(f"/unwatch 명령어 처리 중 오류: {e}")
+            await update.message.reply_text("❌ 명령어 처리 중 오류가 발생했습니다.")
+    
+    async def handle_watchlist_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """
+        /watchlist 명령어 처리 - 현재 모니터링 대상 목록 (적용 대기 중인 변경 포함)
+        """
+        try:
+            if not self._require_monitor():
+                await update.message.reply_text("❌ 모니터링 인스턴스가 설정되지 않았습니다.")
+                return
+            
+            lines = [
+                f"• <b>{target.theme}</b> @ {target.store}\n"
+                f"   📅 {target.window_label()}"
+                for target in self.monitor_instance.get_watch_targets()
+            ]
+            await update.message.reply_text(
+                f"🎯 <b>모니터링 대상</b>\n\n" + "\n".join(lines) +
+                f"\n\n🔄 <b>기본 체크 간격:</b> {self.monitor_instance.base_interval_seconds:.0f}초",
+                parse_mode='HTML'
+            )
+            
+        except Exception as e:
+            logger.error(f"/watchlist 명령어 처리 중 오류: {e}")
+            await update.message.reply_text("❌ 명령어 처리 중 오류가 발생했습니다.")
+    
+    async def handle_interval_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """
+        /interval 명령어 처리 - 체크 기본 간격 변경 (다음 체크부터 적용)
+        사용법: /interval <초>
+        """
+        try:
+            if not await self._require_admin(update):
+                return
+            
+            if not self._require_monitor():
+                await update.message.reply_text("❌ 모니터링 인스턴스가 설정되지 않았습니다.")
+                return
+            
+            if not context.args:
+                await update.message.reply_text(
+                    f"🔄 현재 기본 체크 간격: {self.monitor_instance.base_interval_seconds:.0f}초\n"
+                    f"📖 사용법: <code>/interval 30</code>",
+                    parse_mode='HTML'
+                )
+                return
+            
+            seconds = float(context.args[0])
+            self.monitor_instance.set_check_interval(seconds)
+            
+            await update.message.reply_text(f"✅ 기본 체크 간격을 {seconds:.0f}초로 변경합니다. 다음 체크부터 적용됩니다.")
+            logger.info(f"사용자 {update.effective_user.first_name}이 /interval 명령어 실행: {seconds:.0f}초")
+            
+        except ValueError as e:
+            await update.message.reply_text(f"❌ 잘못된 간격입니다: {e}")
+        except Exception as e:
+            logger.error(f"/interval 명령어 처리 중 오류: {e}")
+            await update.message.reply_text("❌ 명령어 처리 중 오류가 발생했습니다.")
+    
+    async def handle_subscribe_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """
+        /subscribe 명령어 처리 - 이 채팅이 받을 슬롯 알림 필터 등록/변경 (다음 체크부터 적용)
+        사용법: /subscribe [테마] [요일] [HH:MM-HH:MM] [날짜 또는 시작일 종료일]
+        """
+        try:
+            from .subscribers import Subscriber, TIME_WINDOW_PATTERN, get_subscriber_registry, parse_weekdays
+            registry = get_subscriber_registry()
+            chat_id = update.effective_chat.id
+            
+            if not context.args:
+                current = registry.get(chat_id)
+                await update.message.reply_text(
+                    f"📬 <b>알림 필터</b>\n\n"
+                    f"🔎 <b>현재:</b> {current.describe() if current else '없음 (모든 슬롯 알림)'}\n\n"
+                    f"📖 <b>사용법:</b>\n"
+                    f"• <code>/subscribe 주말 18:00-23:00</code> - 주말 저녁만\n"
+                    f"• <code>/subscribe 층간소음 2025-11-07</code> - 한 테마, 하루만\n"
+                    f"• <code>/subscribe 평일 2025-11-01 2025-11-30</code> - 기간 내 평일만\n"
+                    f"• 요일: 월~일, 주말, 평일 (쉼표로 여러 개: <code>금,토</code>)\n"
+                    f"• <code>/unsubscribe</code> - 필터 해제",
+                    parse_mode='HTML'
+                )
+                return
+            
+            dates, times, weekdays, words = [], [], [], []
+            for arg in context.args:
+                if DATE_ARG_PATTERN.fullmatch(arg):
+                    dates.append(arg)
+                elif TIME_WINDOW_PATTERN.fullmatch(arg):
+                    times.append(arg)
+                else:
+                    try:
+                        parse_weekdays(arg.split(','))
+                        weekdays.extend(arg.split(','))
+                    except ValueError:
+                        words.append(arg)
+            if len(dates) > 2:
+                await update.message.reply_text("❌ 날짜(YYYY-MM-DD)는 최대 2개까지 입력할 수 있습니다.")
+                return
+            
+            subscriber = Subscriber(
+                chat_id=chat_id,
+                name=update.effective_chat.title or update.effective_user.first_name,
+                themes=[" ".join(words)] if words else None,
+                date_start=dates[0] if dates else None,
+                date_end=dates[-1] if dates else None,
+                weekdays=weekdays,
+                times=times,
+            )
+            added = registry.subscribe(subscriber)
+            
+            await update.message.reply_text(
+                f"✅ <b>알림 필터 {'등록' if added else '변경'}</b>\n\n"
+                f"🔎 {subscriber.describe()}\n\n"
+                f"⏱️ 다음 체크부터 이 채팅에는 조건에 맞는 슬롯만 알립니다.",
+                parse_mode='HTML'
+            )
+            logger.info(f"사용자 {update.effective_user.first_name}이 /subscribe 명령어 실행: {subscriber}")
+            
+        except ValueError as e:
+            await update.message.reply_text(f"❌ 잘못된 입력입니다: {e}")
+        except Exception as e:
+            logger.error(f"/subscribe 명령어 처리 중 오류: {e}")
+            await update.message.reply_text("❌ 명령어 처리 중 오류가 발생했습니다.")
+    
+    async def handle_unsubscribe_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """
+        /unsubscribe 명령어 처리 - 이 채팅의 알림 필터 해제
+        """
+        try:
+            from .subscribers import get_subscriber_registry
+            if get_subscriber_registry().unsubscribe(update.effective_chat.id):
+                await update.message.reply_text("✅ 알림 필터를 해제했습니다.")
+            else:
+                await update.message.reply_text("ℹ️ 이 채팅에 등록된 알림 필터가 없습니다.")
+            logger.info(f"사용자 {update.effective_user.first_name}이 /unsubscribe 명령어 실행")
+            
+        except Exception as e:
+            logger.error(f"/unsubscribe 명령어 처리 중 오류: {e}")
+            await update.message.reply_text("❌ 명령어 처리 중 오류가 발생했습니다.")
+    
     async def handle_all_messages(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
         모든 메시지 처리 (디버깅용) - 봇이 메시지를 받는지 확인
@@ -524,23 +1177,70 @@ def get_bot_handler() -> Optional[TelegramBotHandler]:
     return _bot_handler
 
 
+# 전역 알림 객체 (동기 함수와 비동기 런타임이 같은 Bot과 반복 알림 쿨타임을 사용)
+_notifier: Optional[TelegramNotifier] = None
+_notifier_lock = threading.Lock()
+
+
+def get_notifier() -> TelegramNotifier:
+    """
+    전역 알림 객체 반환
+    
+    동기 함수는 호출마다 새 이벤트 루프에서 HTTP 클라이언트를 열고 닫고,
+    비동기 런타임은 실행하는 동안 열어 두었다가 종료할 때 닫는다.
+    """
+    global _notifier
+    with _notifier_lock:
+        if _notifier is None:
+            _notifier = TelegramNotifier()
+    return _notifier
+
+
+def _run_sync(action: Callable[[TelegramNotifier], Awaitable[bool]],
+              notifier: Optional[TelegramNotifier] = None, priority: int = PRIORITY_STATUS) -> bool:
+    """
+    새 이벤트 루프에서 알림 코루틴 실행 (루프가 끝나기 전에 HTTP 클라이언트를 닫아 연결을 남기지 않음)
+    
+    공유 Bot의 HTTP 클라이언트는 한 번에 한 이벤트 루프에서만 사용하므로 차례를 기다리고,
+    여러 스레드가 기다리면 슬롯 알림이 먼저 차례를 얻는다.
+    """
+    notifier = notifier or get_notifier()
+    
+    async def run():
+        await notifier.open()
+        try:
+            return await action(notifier)
+        finally:
+            await notifier.close()
+    
+    with get_send_scheduler().sync_turn(priority):
+        return asyncio.run(run())
+
+
 # 동기 함수들 (기존 호환성 유지)
-def send_notification(new_slots: List[str]) -> bool:
+def send_notification(new_slots: List[str], theme_name: Optional[str] = None,
+                      chat_id: Optional[int] = None,
+                      reservation_url: str = RESERVATION_URL) -> bool:
     """동기 알림 전송 함수"""
-    notifier = TelegramNotifier()
-    return asyncio.run(notifier.send_notification(new_slots))
+    return _run_sync(lambda notifier: notifier.send_notification(new_slots, theme_name, chat_id, reservation_url),
+                     priority=PRIORITY_SLOT)
 
 
 def send_error_notification(error_message: str) -> bool:
     """동기 에러 알림 전송 함수"""
-    notifier = TelegramNotifier()
-    return asyncio.run(notifier.send_error_notification(error_message))
+    return _run_sync(lambda notifier: notifier.send_error_notification(error_message), priority=PRIORITY_ERROR)
+
+
+def flush_deferred_notifications() -> int:
+    """동기 보류 메시지 전송 함수 (보류 중인 메시지가 없으면 이벤트 루프를 만들지 않음)"""
+    if not get_send_scheduler().has_deferred():
+        return 0
+    return _run_sync(lambda notifier: notifier.flush_deferred(), priority=PRIORITY_ERROR)
 
 
 def test_telegram_connection() -> bool:
     """동기 텔레그램 연결 테스트 함수"""
-    notifier = TelegramNotifier()
-    return asyncio.run(notifier.test_connection())
+    return _run_sync(lambda notifier: notifier.test_connection(), priority=PRIORITY_REPLY)
 
 
 def test_bot_polling() -> bool:
@@ -638,14 +1338,14 @@ def send_status_notification(status_message: str) -> bool:
         bool: 전송 성공 여부
     """
     try:
-        notifier = TelegramNotifier()
+        notifier = get_notifier()
         
         if not notifier.bot:
             logger.error("텔레그램 봇 초기화 실패로 상태 메시지를 보낼 수 없습니다")
             return False
         
         # 비동기 함수를 동기적으로 실행
-        result = asyncio.run(notifier._send_status_message_async(status_message))
+        result = _run_sync(lambda notifier: notifier.send_status_message(status_message), notifier)
         
         if result:
             logger.debug("상태 메시지 전송 성공")
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+다음 체크 선행 수집(프리페치) 모듈
+
+기본 모드에서는 체크 시각이 되어야 스윕을 시작하므로, diff/알림이 보는 데이터는
+스윕 시간만큼 늦고 마지막 날짜 기준으로는 간격 + 스윕 시간만큼 오래된다.
+파이프라인 모드(PREFETCH=1)에서는 체크가 끝나면 다음 체크 시각에서 예상 스윕 시간을 뺀 시점에
+백그라운드 스윕을 예약해, 체크 시각에 막 끝난 결과로 diff와 알림을 처리한다.
+최근 상태가 바뀌었거나 예약 가능 슬롯이 있는 날짜(hot)는 스윕 마지막에 가져와 가장 신선하게 유지한다.
+
+요청 수는 늘지 않는다. 체크는 프리페치 결과를 쓰거나(진행 중이면 끝날 때까지 대기),
+프리페치가 없거나 대상/날짜 창이 바뀌었으면 기존처럼 직접 스윕한다.
+기다려도 프리페치 스윕이 끝나지 않으면 같은 매장에 요청이 겹치지 않도록 그 체크는 건너뛴다.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from loguru import logger
+
+from .config import CHECK_DEADLINE_SECONDS, PREFETCH_MARGIN_SECONDS
+from .metrics import get_registry
+from .tracing import span
+
+PREFETCH_TOTAL = get_registry().counter(
+    "zeroworld_prefetch_total",
+    "프리페치 결과 (used: 체크에 사용, waited: 진행 중인 프리페치를 기다려 사용, discarded: 대상 변경/만료로 버림, "
+    "busy: 기다려도 끝나지 않아 체크 건너뜀)",
+    ("result",),
+)
+
+# 스윕 시간 이동 평균 가중치
+DURATION_SMOOTHING = 0.3
+
+
+def targets_signature(targets) -> Tuple:
+    """프리페치 결과를 쓸 수 있는지 판단하는 대상/날짜 창 식별값"""
+    return tuple((target.key, tuple(target.dates())) for target in targets)
+
+
+class Prefetcher:
+    """다음 체크의 스윕을 체크 시각 직전에 끝나도록 미리 실행"""
+    
+    def __init__(self, margin_seconds: float = PREFETCH_MARGIN_SECONDS,
+                 deadline_seconds: float = CHECK_DEADLINE_SECONDS):
+        """
+        Args:
+            margin_seconds: 예상 스윕 완료 시각과 체크 시각 사이 여유(초)
+            deadline_seconds: 프리페치 스윕 마감 시간(초)
+        """
+        self.margin_seconds = margin_seconds
+        self.deadline_seconds = deadline_seconds
+        # 최근 스윕 소요 시간 이동 평균 (아직 측정 전이면 None)
+        self.sweep_seconds: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self._thread: Optional[threading.Thread] = None
+        # 실제로 스윕 중인 프리페치 스레드 (취소해도 스윕이 끝날 때까지 유지)
+        self._running: Optional[threading.Thread] = None
+        self._signature = None
+        self._result = None
+        self._finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def observe_duration(self, seconds: float):
+        """스윕 소요 시간 기록 (직접 스윕과 프리페치 모두)"""
+        if self.sweep_seconds is None:
+            self.sweep_seconds = seconds
+        else:
+            self.sweep_seconds += DURATION_SMOOTHING * (seconds - self.sweep_seconds)
+    
+    def schedule(self, targets, seconds_until_tick: float, hot_dates: Set[str]):
+        """
+        다음 체크 시각에 맞춰 프리페치 예약 (이전 예약/결과는 버림)
+        
+        Args:
+            targets: 모니터링 대상 목록
+            seconds_until_tick: 다음 체크까지 남은 초
+            hot_dates: 스윕 마지막에 가져올 날짜
+        """
+        self.cancel()
+        estimate = self.sweep_seconds if self.sweep_seconds is not None else 0.0
+        delay = max(0.0, seconds_until_tick - estimate - self.margin_seconds)
+        
+        targets = list(targets)
+        timer = threading.Timer(delay, self._start, args=(targets, set(hot_dates)))
+        timer.name = "prefetch-timer"
+        timer.daemon = True
+        with self._lock:
+            self._timer = timer
+            self._signature = targets_signature(targets)
+        timer.start()
+        logger.debug(f"⏩ 프리페치 예약: {delay:.1f}초 후 시작 (예상 스윕 {estimate:.1f}초, hot 날짜 {len(hot_dates)}개)")
+    
+    def _start(self, targets, hot_dates: Set[str]):
+        """타이머 스레드에서 프리페치 스윕 실행"""
+        with self._lock:
+            if self._timer is None:
+                return
+            self._timer = None
+            if self._running is not None and self._running.is_alive():
+                logger.warning("⏩ 이전 프리페치 스윕이 아직 진행 중 - 이번 프리페치 건너뜀")
+                return
+            self._thread = self._running = threading.current_thread()
+        
+        from .fetch import collect_slots
+        started = time.perf_counter()
+        try:
+            with span('prefetch', hot_dates=len(hot_dates)):
+                result = collect_slots(targets, self.deadline_seconds, hot_dates=hot_dates)
+        except Exception as e:
+            logger.warning(f"프리페치 실패 - 다음 체크에서 직접 수집: {e}")
+            result = None
+        self.observe_duration(time.perf_counter() - started)
+        
+        with self._lock:
+            self._running = None
+            if self._thread is threading.current_thread():
+                self._result = result
+                self._finished_at = time.monotonic()
+                self._thread = None
+    
+    def take(self, targets, max_age: float) -> Optional[Dict[str, Tuple[Dict[str, str], List[str]]]]:
+        """
+        체크 시각에 프리페치 결과 가져오기
+        
+        진행 중이면 끝날 때까지 기다린다. 대상/날짜 창이 바뀌었거나 결과가 max_age초보다 오래됐으면
+        None을 반환하고 호출한 쪽이 직접 스윕한다. 기다려도 끝나지 않으면 스윕 핸들을 유지한 채
+        None을 반환하므로, 호출한 쪽은 running()이 True인 동안 직접 스윕하지 않는다.
+        """
+        with self._lock:
+            timer, thread = self._timer, self._thread
+            signature = self._signature
+        
+        if timer is not None:
+            # 아직 시작 전 (간격이 줄어 체크가 앞당겨진 경우) - 직접 스윕이 더 빠름
+            self.cancel()
+            return None
+        
+        waited = False
+        if thread is not None:
+            waited = True
+            thread.join(self.deadline_seconds + self.margin_seconds)
+            if thread.is_alive():
+                PREFETCH_TOTAL.inc(result="busy")
+                logger.warning("⏩ 프리페치 스윕이 마감을 넘겨 진행 중 - 끝날 때까지 직접 수집하지 않음")
+                return None
+        
+        with self._lock:
+            result, finished_at = self._result, self._finished_at
+            self._result = None
+            self._finished_at = None
+            self._thread = None
+        
+        if result is None:
+            return None
+        if signature != targets_signature(targets) or time.monotonic() - finished_at > max_age:
+            PREFETCH_TOTAL.inc(result="discarded")
+            logger.info("⏩ 대상/날짜 창이 바뀌었거나 오래된 프리페치 결과 - 직접 수집")
+            return None
+        
+        PREFETCH_TOTAL.inc(result="waited" if waited else "used")
+        logger.info(f"⏩ 프리페치 결과 사용 ({time.monotonic() - finished_at:.1f}초 전 완료)")
+        return result
+    
+    def running(self) -> bool:
+        """프리페치 스윕이 진행 중인지 (취소돼 결과를 버릴 스윕 포함)"""
+        with self._lock:
+            return self._running is not None and self._running.is_alive()
+    
+    def cancel(self):
+        """예약된 프리페치 취소 (진행 중인 스윕은 결과를 버림)"""
+        with self._lock:
+            timer = self._timer
+            self._timer = None
+            self._thread = None
+            self._result = None
+            self._finished_at = None
+        if timer is not None:
+            timer.cancel()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+체크 프로파일링 모듈
+
+check_slots를 N회 cProfile과 tracemalloc 아래에서 실행해
+함수별 소요 시간(핫스팟)과 메모리 할당 위치 상위 항목을 보고서로 남긴다.
+표준 라이브러리만 사용하므로 Railway 컨테이너에서도 추가 도구 없이 실행된다.
+
+사용법:
+    python -m checker.main --profile 3
+"""
+
+import cProfile
+import io
+import pstats
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import List, Tuple
+from loguru import logger
+
+from .config import PROFILE_DIR
+
+# 할당 위치 집계에서 제외할 프레임 (프로파일러 자체 오버헤드)
+_ALLOCATION_EXCLUDES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _format_hotspots(profiler: cProfile.Profile, sort_key: str, top: int) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats(sort_key).print_stats(top)
+    return stream.getvalue().strip()
+
+
+def _format_allocations(snapshot: tracemalloc.Snapshot, top: int) -> str:
+    statistics = snapshot.filter_traces(_ALLOCATION_EXCLUDES).statistics('lineno')
+    lines = []
+    for index, stat in enumerate(statistics[:top], 1):
+        frame = stat.traceback[0]
+        lines.append(f"{index:>3}. {frame.filename}:{frame.lineno} - {stat.size / 1024:.1f} KiB ({stat.count}개 블록)")
+    return "\n".join(lines) if lines else "(할당 기록 없음)"
+
+
+def _use_scratch_state(checker, scratch_dir: Path):
+    """실제 상태 파일을 복사한 임시 상태로 교체 (운영 중인 모니터의 diff 기준을 건드리지 않음)"""
+    from .state import StateManager
+    source = checker.state_manager.state_file
+    scratch_file = scratch_dir / "state.json"
+    if source.exists():
+        shutil.copyfile(source, scratch_file)
+    checker.state_manager = StateManager(scratch_file)
+
+
+def profile_checks(checker, rounds: int = 3, top: int = 30, output_dir: Path = PROFILE_DIR) -> Path:
+    """
+    check_slots를 rounds회 프로파일링하고 보고서 파일 경로 반환
+    
+    텔레그램 알림은 보내지 않고, 상태 저장은 임시 상태 파일에 한다.
+    보고서(.txt)와 함께 snakeviz 등에서 열 수 있는 원본 통계(.prof)도 저장한다.
+    
+    Args:
+        checker: ZeroworldChecker 인스턴스
+        rounds: 실행할 체크 횟수
+        top: 보고서에 남길 항목 수
+        output_dir: 보고서 저장 디렉터리
+    """
+    checker.notifications_enabled = False
+    rounds = max(1, rounds)
+    round_results: List[Tuple[float, bool]] = []
+    profiler = cProfile.Profile()
+    
+    with tempfile.TemporaryDirectory(prefix="zeroworld-profile-") as scratch_dir:
+        _use_scratch_state(checker, Path(scratch_dir))
+        
+        tracemalloc.start(25)
+        try:
+            for index in range(rounds):
+                logger.info(f"🔬 프로파일링 체크 {index + 1}/{rounds}")
+                started = time.perf_counter()
+                profiler.enable()
+                try:
+                    ok = checker.check_slots()
+                finally:
+                    profiler.disable()
+                round_results.append((time.perf_counter() - started, ok))
+            
+            snapshot = tracemalloc.take_snapshot()
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    
+    durations = [duration for duration, _ in round_results]
+    report = "\n".join([
+        f"# check_slots 프로파일 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})",
+        f"체크 {rounds}회, 성공 {sum(ok for _, ok in round_results)}회",
+        "회차별 소요 시간: " + ", ".join(f"{duration:.2f}초" for duration in durations),
+        f"평균 {sum(durations) / len(durations):.2f}초 (tracemalloc 오버헤드 포함)",
+        f"추적 메모리: 현재 {current_memory / 1024 / 1024:.1f} MiB, 최대 {peak_memory / 1024 / 1024:.1f} MiB",
+        "",
+        f"## 누적 시간 상위 {top}개 (cumulative)",
+        _format_hotspots(profiler, 'cumulative', top),
+        "",
+        f"## 자체 시간 상위 {top}개 (tottime)",
+        _format_hotspots(profiler, 'tottime', top),
+        "",
+        f"## 메모리 할당 위치 상위 {top}개",
+        _format_allocations(snapshot, top),
+        "",
+    ])
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    report_path = output_dir / f"{stem}.txt"
+    report_path.write_text(report, encoding='utf-8')
+    profiler.dump_stats(str(output_dir / f"{stem}.prof"))
+    
+    # 컨테이너 파일 시스템은 휘발성이므로 로그에도 보고서 출력
+    print(report)
+    logger.info(f"🔬 프로파일 보고서 저장: {report_path}")
+    return report_path
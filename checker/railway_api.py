@@ -6,7 +6,6 @@ Railway GraphQL API를 사용해서 서비스 설정을 변경하는 기능 제
 """
 
 import os
-import aiohttp
 import asyncio
 from typing import Optional, Dict, Any
 from loguru import logger
@@ -29,6 +28,9 @@ class RailwayAPI:
         if not self.api_token:
             raise ValueError("Railway API 토큰이 설정되지 않았습니다")
         
+        # aiohttp는 실제 API 호출 시에만 필요하므로 지연 임포트
+        import aiohttp
+        
         headers = {
             "Authorization": f"Bearer {self.api_token}",
             "Content-Type": "application/json"
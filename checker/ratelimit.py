@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+요청 속도 제한 모듈
+
+zerohongdae.com으로 나가는 모든 HTTP 요청에 공통으로 적용되는 토큰 버킷 리미터.
+체크가 빨라지거나 동시에 실행되어도 사이트에 차단당하지 않도록 초당 요청 수를 제한한다.
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Any
+from loguru import logger
+
+from .config import RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST, RATE_LIMIT_JITTER_SECONDS
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (지터 포함)"""
+    
+    def __init__(self, rate: float = RATE_LIMIT_PER_SECOND, capacity: int = RATE_LIMIT_BURST,
+                 jitter: float = RATE_LIMIT_JITTER_SECONDS):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.jitter = max(0.0, jitter)
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        
+        # 대기 통계
+        self._acquired = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+    
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 보충"""
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 얻을 때까지 대기
+        
+        Returns:
+            float: 토큰 대기 + 지터로 기다린 시간(초)
+        """
+        if not self.enabled:
+            return 0.0
+        
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+                shortage = (tokens - self._tokens) / self.rate
+            time.sleep(shortage)
+        
+        # 고정된 요청 패턴을 피하기 위한 무작위 지연
+        if self.jitter:
+            time.sleep(random.uniform(0, self.jitter))
+        
+        waited = time.monotonic() - started
+        with self._lock:
+            self._acquired += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            if waited > self.jitter:
+                self._waited += 1
+        return waited
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        대기 통계
+        
+        Returns:
+            dict: requests(요청 수), throttled(지터 이상 대기한 요청 수),
+                  total_wait/avg_wait/max_wait(초)
+        """
+        with self._lock:
+            return {
+                'requests': self._acquired,
+                'throttled': self._waited,
+                'total_wait': self._total_wait,
+                'avg_wait': self._total_wait / self._acquired if self._acquired else 0.0,
+                'max_wait': self._max_wait,
+            }
+    
+    def reset_stats(self):
+        """대기 통계 초기화"""
+        with self._lock:
+            self._acquired = 0
+            self._waited = 0
+            self._total_wait = 0.0
+            self._max_wait = 0.0
+
+
+# 전역 리미터 (모든 fetcher가 공유)
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """전역 토큰 버킷 리미터 반환"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = TokenBucket()
+            if _rate_limiter.enabled:
+                logger.info(
+                    f"요청 속도 제한: 초당 {RATE_LIMIT_PER_SECOND}회, 버스트 {RATE_LIMIT_BURST}, "
+                    f"지터 최대 {RATE_LIMIT_JITTER_SECONDS}초"
+                )
+            else:
+                logger.warning("요청 속도 제한이 비활성화되어 있습니다")
+    return _rate_limiter
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+회귀 시나리오 점검 모듈
+
+리뷰에서 재현한 버그를 합성 사이트(SyntheticTransport)와 가짜 Bot으로 다시 돌려 본다.
+네트워크와 텔레그램 토큰 없이 실행되며, 실패한 시나리오가 있으면 종료 코드 1을 반환한다.
+
+사용법:
+    python -m checker.selfcheck            # 모든 시나리오
+    python -m checker.selfcheck breaker    # 이름에 'breaker'가 들어간 시나리오만
+"""
+
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Dict, List, Tuple
+
+from .config import BASE_URL, THEME_NAME
+from .synthetic import SyntheticSite, SyntheticTransport
+from .transport import build_response
+
+
+class FlakyTransport(SyntheticTransport):
+    """장애를 켜고 끌 수 있는 합성 전송 계층 (요청 수 집계)"""
+    
+    def __init__(self, site: SyntheticSite, store: str = BASE_URL):
+        super().__init__(site, store)
+        self.down = False
+        self.requests = 0
+    
+    def request(self, session, method: str, url: str, **kwargs):
+        self.requests += 1
+        if self.down:
+            return build_response(url, 503)
+        return super().request(session, method, url, **kwargs)
+
+
+def check_breaker_recovers_with_pooled_fetcher():
+    """서킷이 open → half_open → closed로 회복 (대기 중인 fetcher 재사용)"""
+    from . import fetch
+    from .targets import WatchTarget
+    from .transport import using_transport
+    
+    site = SyntheticSite(themes=3, days=3, slots_per_day=4)
+    transport = FlakyTransport(site)
+    target = WatchTarget(THEME_NAME, store=BASE_URL, window_days=3)
+    breaker = fetch.CircuitBreaker(failure_threshold=1, backoff_base=0.05, backoff_max=0.05, store=target.store)
+    
+    with using_transport(transport):
+        fetch.close_fetchers()
+        with fetch._circuit_breakers_lock:
+            previous = fetch._circuit_breakers.get(target.store)
+            fetch._circuit_breakers[target.store] = breaker
+        try:
+            fetch.collect_slots([target])
+            assert breaker.state == breaker.CLOSED, f"정상 스윕 후 서킷: {breaker.state}"
+            
+            transport.down = True
+            fetch.collect_slots([target])
+            assert breaker.state == breaker.OPEN, f"장애 스윕 후 서킷: {breaker.state}"
+            
+            transport.down = False
+            time.sleep(0.1)
+            for _ in range(2):
+                before = transport.requests
+                fetch.collect_slots([target])
+                assert transport.requests > before, (
+                    f"회복 체크에서 요청 없음 (state={breaker.state}, probe={breaker._probe_in_flight})"
+                )
+            assert breaker.state == breaker.CLOSED, f"회복 후 서킷: {breaker.state}"
+            assert not breaker._probe_in_flight, "탐색 차례가 반납되지 않음"
+        finally:
+            fetch.close_fetchers()
+            with fetch._circuit_breakers_lock:
+                if previous is None:
+                    fetch._circuit_breakers.pop(target.store, None)
+                else:
+                    fetch._circuit_breakers[target.store] = previous
+
+
+class SlowTransport(SyntheticTransport):
+    """응답마다 지연을 두고 동시에 처리 중인 요청 수의 최댓값을 기록하는 합성 전송 계층"""
+    
+    def __init__(self, site: SyntheticSite, delay: float, store: str = BASE_URL):
+        super().__init__(site, store)
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+    
+    def request(self, session, method: str, url: str, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return super().request(session, method, url, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class FakeRequest:
+    """Bot.request 대역 (HTTP 클라이언트 열기/닫기 횟수 집계)"""
+    
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+    
+    async def initialize(self):
+        self.opened += 1
+    
+    async def shutdown(self):
+        self.closed += 1
+
+
+class FakeBot:
+    """보낸 메시지를 기록만 하는 텔레그램 Bot 대역"""
+    
+    def __init__(self):
+        self.sent: List[Tuple[int, str]] = []
+        self.request = FakeRequest()
+    
+    async def send_message(self, chat_id: int, text: str, **kwargs):
+        self.sent.append((chat_id, text))
+
+
+def check_alerts_for_two_targets_in_one_chat():
+    """한 채팅에 두 대상의 알림이 모두 전송되고, 같은 슬롯 묶음 반복만 쿨타임으로 생략"""
+    import asyncio
+    from .notifier import TelegramNotifier
+    
+    bot = FakeBot()
+    notifier = TelegramNotifier(chat_id=1, bot=bot)
+    slots_a = ["2026-11-07 19:00:00"]
+    slots_b = ["2026-11-07 21:00:00"]
+    
+    async def run():
+        # 같은 체크: 대상 A, B
+        assert await notifier.send_notification(slots_a, "테마A", 1, "https://a.example/reservation")
+        assert await notifier.send_notification(slots_b, "테마B", 1, "https://b.example/reservation")
+        assert len(bot.sent) == 2, f"같은 체크의 두 대상 알림 중 {len(bot.sent)}건만 전송"
+        
+        # 다음 체크: A는 같은 슬롯이면 생략(전송 실패 아님), 새 슬롯이 추가되면 전송
+        assert await notifier.send_notification(slots_a, "테마A", 1, "https://a.example/reservation")
+        assert len(bot.sent) == 2, "같은 슬롯 묶음이 쿨타임 안에 다시 전송됨"
+        assert await notifier.send_notification(slots_a + slots_b, "테마A", 1, "https://a.example/reservation")
+        assert len(bot.sent) == 3, "새 슬롯이 열렸는데 쿨타임으로 생략됨"
+    
+    asyncio.run(run())
+
+
+def check_sync_and_async_share_alert_cooldown():
+    """동기 함수와 비동기 런타임이 같은 알림 객체(반복 알림 쿨타임)를 사용"""
+    import asyncio
+    from . import notifier as module
+    
+    bot = FakeBot()
+    previous = module._notifier
+    module._notifier = module.TelegramNotifier(chat_id=1, bot=bot)
+    slots = ["2026-11-07 19:00:00"]
+    try:
+        # 동기 경로: 두 번째 같은 알림은 생략
+        assert module.send_notification(slots, "테마A", 1)
+        assert module.send_notification(slots, "테마A", 1)
+        assert len(bot.sent) == 1, f"동기 경로에서 같은 알림 {len(bot.sent)}건 전송"
+        assert bot.request.opened == bot.request.closed, "동기 전송 후 HTTP 클라이언트가 열려 있음"
+        
+        # 비동기 런타임도 같은 쿨타임을 봄
+        assert asyncio.run(module.get_notifier().send_notification(slots, "테마A", 1))
+        assert len(bot.sent) == 1, "비동기 경로가 동기 경로의 쿨타임을 공유하지 않음"
+    finally:
+        module._notifier = previous
+
+
+def check_watch_window_moved_earlier():
+    """/watch로 시작일을 앞당기면 이어받은 날짜 창 앞쪽에 새 날짜가 추가됨"""
+    import datetime as dt
+    from .targets import WatchTarget
+    
+    today = dt.date(2026, 10, 20)
+    old = WatchTarget(THEME_NAME, date_start="2026-11-10", date_end="2026-11-20")
+    old.refresh_dates(today)
+    new = WatchTarget(THEME_NAME, date_start="2026-10-25", date_end="2026-11-20")
+    new.inherit_dates(old)
+    
+    added, dropped = new.refresh_dates(today)
+    assert added[0] == "2026-10-25" and added[-1] == "2026-11-09", f"앞당긴 날짜 추가 안 됨: {added}"
+    assert not dropped, f"빠진 날짜: {dropped}"
+    dates = new.dates()
+    assert dates[0] == "2026-10-25" and dates[-1] == "2026-11-20" and len(dates) == 27, f"날짜 창: {dates}"
+    assert dates == sorted(dates), "날짜 창 순서가 어긋남"
+
+
+def check_httpx_sweeps_dates_concurrently():
+    """httpx 클라이언트면 매장의 날짜들을 동시에 요청하고, 결과는 순차 스윕과 같음"""
+    import httpx
+    from . import fetch
+    from .targets import WatchTarget
+    from .transport import using_transport
+    
+    site = SyntheticSite(themes=3, days=8, slots_per_day=4)
+    target = WatchTarget(THEME_NAME, store=BASE_URL, window_days=8)
+    original_create_session = fetch.create_session
+    
+    def sweep(create_session) -> Tuple[Dict[str, str], int]:
+        transport = SlowTransport(site, delay=0.02)
+        fetch.create_session = create_session
+        fetch.close_fetchers()
+        try:
+            with using_transport(transport):
+                slots, stale_dates = fetch.collect_slots([target])[target.key]
+        finally:
+            fetch.create_session = original_create_session
+            fetch.close_fetchers()
+        assert not stale_dates, f"stale 날짜: {stale_dates}"
+        return slots, transport.max_in_flight
+    
+    sequential, sequential_in_flight = sweep(original_create_session)
+    concurrent, concurrent_in_flight = sweep(lambda base_url, reservation_url: httpx.Client())
+    assert sequential_in_flight == 1, f"requests 세션에서 동시 요청 {sequential_in_flight}건"
+    assert concurrent_in_flight > 1, "httpx 클라이언트에서 날짜 요청이 순차로만 나감"
+    assert concurrent == sequential, "동시 스윕 결과가 순차 스윕과 다름"
+
+
+SCENARIOS: Dict[str, Callable[[], None]] = {
+    'breaker_recovers_with_pooled_fetcher': check_breaker_recovers_with_pooled_fetcher,
+    'alerts_for_two_targets_in_one_chat': check_alerts_for_two_targets_in_one_chat,
+    'sync_and_async_share_alert_cooldown': check_sync_and_async_share_alert_cooldown,
+    'watch_window_moved_earlier': check_watch_window_moved_earlier,
+    'httpx_sweeps_dates_concurrently': check_httpx_sweeps_dates_concurrently,
+}
+
+
+def main(argv=None) -> int:
+    import argparse
+    from loguru import logger
+    
+    parser = argparse.ArgumentParser(description='회귀 시나리오 점검')
+    parser.add_argument('pattern', nargs='?', default='', help='이름에 이 문자열이 들어간 시나리오만 실행')
+    parser.add_argument('--verbose', action='store_true', help='체커 로그 출력')
+    args = parser.parse_args(argv)
+    
+    if not args.verbose:
+        logger.disable("checker")
+    
+    failed: List[str] = []
+    for name, scenario in SCENARIOS.items():
+        if args.pattern not in name:
+            continue
+        try:
+            scenario()
+        except Exception:
+            failed.append(name)
+            print(f"❌ {name}")
+            traceback.print_exc()
+        else:
+            print(f"✅ {name}")
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 HTTP 서버 모듈
+
+체커 프로세스 안에서 데몬 스레드로 실행되는 작은 HTTP 서버.
+경로별 핸들러를 등록해 사용한다 (예: /metrics, /events).
+
+핸들러는 요청 핸들러 객체를 받아 (상태 코드, Content-Type, 본문 bytes)를 반환한다.
+None을 반환하면 핸들러가 응답을 직접 작성한 것으로 본다 (스트리밍 응답용).
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+
+from .config import METRICS_HOST, METRICS_PORT
+
+RouteResult = Optional[Tuple[int, str, bytes]]
+RouteHandler = Callable[[BaseHTTPRequestHandler], RouteResult]
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """등록된 경로로 GET 요청 전달"""
+    
+    server_version = "ZeroworldChecker"
+    
+    def do_GET(self):
+        handler = self.server.routes.get(urlparse(self.path).path)
+        if handler is None:
+            self._send(404, "text/plain; charset=utf-8", b"not found\n")
+            return
+        
+        try:
+            result = handler(self)
+        except Exception as e:
+            logger.error(f"로컬 서버 핸들러 오류 ({self.path}): {e}")
+            self._send(500, "text/plain; charset=utf-8", b"internal error\n")
+            return
+        
+        if result is not None:
+            self._send(*result)
+    
+    def _send(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        # 스크레이프 요청마다 stderr에 찍히지 않도록 debug 로그로 전환
+        logger.debug(f"로컬 서버 요청: {self.address_string()} {format % args}")
+
+
+class LocalServer:
+    """경로 등록형 로컬 HTTP 서버"""
+    
+    def __init__(self, host: str = METRICS_HOST, port: int = METRICS_PORT):
+        self.host = host
+        self.port = port
+        self.routes: Dict[str, RouteHandler] = {}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._httpd is not None
+    
+    def route(self, path: str, handler: RouteHandler):
+        """경로 핸들러 등록 (서버 실행 중에도 등록 가능)"""
+        self.routes[path] = handler
+    
+    def start(self) -> bool:
+        """데몬 스레드에서 서버 시작 (이미 실행 중이면 무시)"""
+        if self._httpd is not None:
+            return True
+        
+        try:
+            httpd = ThreadingHTTPServer((self.host, self.port), _RequestHandler)
+        except OSError as e:
+            logger.error(f"로컬 서버 시작 실패 ({self.host}:{self.port}): {e}")
+            return False
+        
+        httpd.daemon_threads = True
+        httpd.routes = self.routes
+        self._httpd = httpd
+        self.port = httpd.server_address[1]
+        self._thread = threading.Thread(target=httpd.serve_forever, name="local-server", daemon=True)
+        self._thread.start()
+        logger.info(f"🌐 로컬 서버 시작: http://{self.host}:{self.port} ({', '.join(sorted(self.routes))})")
+        return True
+    
+    def stop(self):
+        """서버 중지"""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info("🌐 로컬 서버 중지됨")
+
+
+def metrics_route(request: BaseHTTPRequestHandler) -> RouteResult:
+    """/metrics - Prometheus 텍스트 형식 메트릭"""
+    from .metrics import get_registry
+    body = get_registry().render().encode("utf-8")
+    return 200, "text/plain; version=0.0.4; charset=utf-8", body
+
+
+# 전역 서버 (체커 프로세스당 하나)
+_server: Optional[LocalServer] = None
+_server_lock = threading.Lock()
+
+
+def get_server() -> LocalServer:
+    """전역 로컬 서버 반환 (/metrics, /events 경로 기본 등록)"""
+    global _server
+    with _server_lock:
+        if _server is None:
+            from .events import events_route
+            _server = LocalServer()
+            _server.route("/metrics", metrics_route)
+            _server.route("/events", events_route)
+    return _server
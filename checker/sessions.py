@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 세션 저장 모듈
+
+매장별 세션 쿠키와 CSRF 토큰을 발급 시각과 함께 상태 파일 옆 sessions.json에 저장한다.
+재시작 후 첫 체크는 저장된 세션이 유효 시간(SESSION_MAX_AGE_SECONDS) 안이면 그대로 이어 쓰고,
+서버가 토큰을 거부하면(419) fetcher가 새로 초기화한 세션으로 덮어쓴다.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+from .config import SESSION_FILE, SESSION_MAX_AGE_SECONDS
+
+
+def export_cookies(cookies) -> List[Dict[str, Any]]:
+    """쿠키 저장소(requests 쿠키 jar 또는 httpx.Cookies)를 JSON으로 저장할 수 있는 목록으로 변환"""
+    jar = getattr(cookies, 'jar', cookies)
+    return [
+        {
+            'name': cookie.name,
+            'value': cookie.value,
+            'domain': cookie.domain,
+            'path': cookie.path,
+            'expires': cookie.expires,
+            'secure': cookie.secure,
+            'rest': {'HttpOnly': None} if cookie.has_nonstandard_attr('HttpOnly') else {},
+        }
+        for cookie in jar
+        if not cookie.is_expired()
+    ]
+
+
+def import_cookies(cookies, saved: List[Dict[str, Any]]) -> int:
+    """저장한 쿠키를 쿠키 저장소에 복원 (만료된 쿠키 제외, 복원한 개수 반환)"""
+    from requests.cookies import create_cookie
+    
+    jar = getattr(cookies, 'jar', cookies)
+    restored = 0
+    for item in saved:
+        cookie = create_cookie(**item)
+        if cookie.is_expired():
+            continue
+        jar.set_cookie(cookie)
+        restored += 1
+    return restored
+
+
+class SessionStore:
+    """매장별 세션(쿠키 + CSRF 토큰) 파일 저장소"""
+    
+    def __init__(self, session_file: Path = SESSION_FILE, max_age: float = SESSION_MAX_AGE_SECONDS):
+        self.session_file = Path(session_file)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._sessions: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    def _load_all(self) -> Dict[str, Dict[str, Any]]:
+        """파일에서 전체 세션 로드 (호출하는 쪽에서 잠금 보유, 한 번만 읽음)"""
+        if self._sessions is None:
+            self._sessions = {}
+            if self.session_file.exists():
+                try:
+                    with open(self.session_file, 'r', encoding='utf-8') as f:
+                        self._sessions = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"세션 파일을 읽을 수 없어 새로 시작합니다: {e}")
+        return self._sessions
+    
+    def _write_all(self):
+        """세션 파일 원자적 저장 (호출하는 쪽에서 잠금 보유)"""
+        try:
+            temp_file = self.session_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._sessions, f, indent=2, ensure_ascii=False)
+            temp_file.replace(self.session_file)
+        except OSError as e:
+            logger.warning(f"세션 파일 저장 실패: {e}")
+    
+    def load(self, store: str) -> Optional[Dict[str, Any]]:
+        """
+        유효 시간 안의 저장된 세션 반환
+        
+        Returns:
+            dict: {'csrf_token', 'issued_at', 'cookies'} 또는 None (없거나 만료)
+        """
+        with self._lock:
+            session = self._load_all().get(store)
+        if not session or not session.get('csrf_token'):
+            return None
+        age = time.time() - session.get('issued_at', 0)
+        if age > self.max_age:
+            logger.info(f"저장된 세션 만료 ({store}, {age / 60:.0f}분 경과) - 새로 초기화")
+            return None
+        return session
+    
+    def save(self, store: str, csrf_token: str, issued_at: float, cookies: List[Dict[str, Any]]):
+        """세션 저장 (토큰과 쿠키가 이전과 같으면 파일을 다시 쓰지 않음)"""
+        session = {'csrf_token': csrf_token, 'issued_at': issued_at, 'cookies': cookies}
+        with self._lock:
+            sessions = self._load_all()
+            if sessions.get(store) == session:
+                return
+            sessions[store] = session
+            self._write_all()
+    
+    def discard(self, store: str):
+        """서버가 거부한 세션 삭제"""
+        with self._lock:
+            if self._load_all().pop(store, None) is not None:
+                self._write_all()
+
+
+# 전역 세션 저장소
+_session_store: Optional[SessionStore] = None
+_session_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """전역 세션 저장소 반환"""
+    global _session_store
+    with _session_store_lock:
+        if _session_store is None:
+            _session_store = SessionStore()
+    return _session_store
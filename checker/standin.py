@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+제로월드 대역 서버 모듈 (부하/지연 테스트용)
+
+ZeroworldFetcher가 사용하는 엔드포인트를 흉내 내는 로컬 aiohttp 앱.
+- GET  /reservation          : CSRF 메타 태그 + (date 파라미터가 있으면) 숨겨진 예약 데이터 페이지
+- POST /reservation/theme    : 테마/시간표 JSON (X-CSRF-TOKEN 검증, 만료 시 419)
+- GET  /_standin/stats       : 요청/주입 오류 통계와 열린 슬롯 목록 (감지 지연 계산용)
+
+응답 지연, 오류 주입, 응답 멈춤, CSRF 만료, 시간에 따른 슬롯 오픈 스크립트, ETag 조건부 응답을 설정할 수 있어
+실제 사이트를 건드리지 않고 동시성, 백오프, 종단 간 감지 지연을 노트북에서 시험할 수 있다.
+
+사용법:
+    python -m checker.standin --port 8080 --latency 0.3 --error-rate 0.05 --csrf-ttl 600 --open-every 120
+    WATCHLIST='[{"theme": "층간소음", "store": "http://127.0.0.1:8080"}]' RATE_LIMIT_PER_SECOND=0 python -m checker.main
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import secrets
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+
+from .config import DATE_WINDOW_DAYS
+from .synthetic import SyntheticSite, slot_timestamp
+from .transport import current_time
+
+# Laravel이 CSRF 토큰 만료 시 돌려주는 상태 코드
+CSRF_EXPIRED_STATUS = 419
+
+# 주입하는 서버 오류 상태 코드
+INJECTED_ERROR_STATUSES = (500, 502, 503)
+
+
+def parse_opening(spec: str) -> Tuple[float, str]:
+    """
+    슬롯 오픈 스크립트 항목 파싱
+    
+    형식: "<시작 후 초>@<YYYY-MM-DD HH:MM:SS>" (예: "90@2025-08-02 19:00:00")
+    """
+    at, separator, slot_key = spec.partition("@")
+    if not separator:
+        raise ValueError(f"슬롯 오픈 형식 오류 (초@YYYY-MM-DD HH:MM:SS): {spec}")
+    return float(at), slot_key.strip()
+
+
+class StandinSite:
+    """대역 서버 상태 (합성 데이터 + 지연/오류/CSRF/슬롯 오픈 설정)"""
+    
+    def __init__(self, site: SyntheticSite, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, stall_rate: float = 0.0, stall_seconds: float = 60.0,
+                 csrf_ttl: Optional[float] = None, openings: Optional[List[Tuple[float, str]]] = None,
+                 open_every: Optional[float] = None, etag: bool = False, seed: int = 0):
+        """
+        Args:
+            site: 응답 데이터로 사용할 합성 사이트
+            latency: 모든 응답의 기본 지연(초)
+            jitter: 기본 지연에 더하는 무작위 지연 상한(초)
+            error_rate: 5xx 오류를 돌려줄 확률
+            stall_rate: stall_seconds 동안 응답하지 않을 확률 (클라이언트 타임아웃 시험용)
+            stall_seconds: 응답 멈춤 시간(초)
+            csrf_ttl: CSRF 토큰 유효 시간(초, None이면 만료 없음)
+            openings: (시작 후 초, 슬롯 키) 슬롯 오픈 스크립트
+            open_every: 이 간격(초)마다 매진된 대상 테마 슬롯 하나를 무작위로 오픈
+            etag: True면 예약 페이지에 ETag를 붙이고 If-None-Match가 같으면 304로 응답
+            seed: 지연/오류/무작위 오픈 난수 시드
+        """
+        self.site = site
+        self.dates = set(site.dates())
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self.csrf_ttl = csrf_ttl
+        self.openings = sorted(openings or [])
+        self.open_every = open_every
+        self.etag = etag
+        self.rng = random.Random(seed)
+        
+        self.started = time.monotonic()
+        self.started_at = time.time()
+        self._tokens: Dict[str, float] = {}
+        # 슬롯 키 → 오픈 시각 (epoch 초)
+        self.opened: Dict[str, float] = {}
+        self._random_opened = 0
+        self.stats = {
+            'requests': 0,
+            'pages': 0,
+            'api_calls': 0,
+            'injected_errors': 0,
+            'stalls': 0,
+            'csrf_rejections': 0,
+            'not_modified': 0,
+        }
+        
+        # 무작위 오픈 후보: 아직 지나지 않은 매진 슬롯
+        now_key = current_time().strftime("%Y-%m-%d %H:%M:%S")
+        self._closed_slots = sorted(
+            slot_key for slot_key, status in site.slot_states().items()
+            if status == "매진" and slot_key > now_key
+        )
+    
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+    
+    def _advance_openings(self):
+        """경과 시간까지 예정된 슬롯 오픈 반영"""
+        elapsed = self.elapsed()
+        while self.openings and self.openings[0][0] <= elapsed:
+            at, slot_key = self.openings.pop(0)
+            self._open(slot_key, self.started_at + at)
+        
+        if self.open_every:
+            due = int(elapsed // self.open_every)
+            while self._random_opened < due and self._closed_slots:
+                self._random_opened += 1
+                slot_key = self._closed_slots.pop(self.rng.randrange(len(self._closed_slots)))
+                self._open(slot_key, self.started_at + self._random_opened * self.open_every)
+    
+    def _open(self, slot_key: str, opened_at: float):
+        if slot_key not in self.opened:
+            self.opened[slot_key] = opened_at
+            logger.info(f"🟢 대역 서버 슬롯 오픈: {slot_key} (시작 후 {opened_at - self.started_at:.1f}초)")
+    
+    def theme_data(self, date_str: str) -> Tuple[Dict, Dict]:
+        """슬롯 오픈을 반영한 (API 응답, 숨겨진 데이터) - 합성 원본은 수정하지 않음"""
+        self._advance_openings()
+        api_data = self.site.theme_payload(date_str)
+        hidden_data = self.site.hidden_data(date_str)
+        
+        opened_times = {slot_key[11:] for slot_key in self.opened if slot_key.startswith(date_str)}
+        if not opened_times:
+            return api_data, hidden_data
+        
+        pk = str(self.site.target_pk)
+        times = dict(api_data['times'])
+        times[pk] = [
+            dict(slot, reservation=False) if slot['time'] in opened_times else slot
+            for slot in times[pk]
+        ]
+        opened_timestamps = {slot_timestamp(date_str, time_str) for time_str in opened_times}
+        other = dict(hidden_data['other'])
+        other[pk] = {ts: value for ts, value in other[pk].items() if ts not in opened_timestamps}
+        return dict(api_data, times=times), dict(hidden_data, other=other)
+    
+    def issue_token(self) -> str:
+        token = secrets.token_hex(20)
+        self._tokens[token] = time.monotonic()
+        return token
+    
+    def token_valid(self, token: Optional[str]) -> bool:
+        issued = self._tokens.get(token or "")
+        if issued is None:
+            return False
+        if self.csrf_ttl is not None and time.monotonic() - issued > self.csrf_ttl:
+            return False
+        return True
+    
+    def snapshot(self) -> Dict:
+        self._advance_openings()
+        return {
+            'uptime_seconds': round(self.elapsed(), 3),
+            'stats': dict(self.stats),
+            'opened': [
+                {'slot': slot_key, 'opened_at': opened_at}
+                for slot_key, opened_at in sorted(self.opened.items(), key=lambda item: item[1])
+            ],
+            'pending_openings': len(self.openings),
+        }
+
+
+def create_app(standin: StandinSite):
+    """대역 서버 aiohttp 앱 생성"""
+    from aiohttp import web
+    
+    @web.middleware
+    async def faults(request, handler):
+        """응답 지연, 멈춤, 5xx 오류 주입 (통계 경로 제외)"""
+        if request.path.startswith("/_standin"):
+            return await handler(request)
+        
+        standin.stats['requests'] += 1
+        delay = standin.latency + (standin.rng.uniform(0, standin.jitter) if standin.jitter else 0)
+        if standin.rng.random() < standin.stall_rate:
+            standin.stats['stalls'] += 1
+            delay += standin.stall_seconds
+        if delay:
+            await asyncio.sleep(delay)
+        
+        if standin.rng.random() < standin.error_rate:
+            standin.stats['injected_errors'] += 1
+            status = standin.rng.choice(INJECTED_ERROR_STATUSES)
+            return web.Response(status=status, text=f"injected error {status}\n")
+        return await handler(request)
+    
+    async def reservation_page(request):
+        standin.stats['pages'] += 1
+        date_str = request.query.get('date')
+        if date_str is None:
+            body = standin.site.index_page()
+        elif date_str in standin.dates:
+            body = standin.site.reservation_page(date_str, *standin.theme_data(date_str))
+        else:
+            return web.Response(status=404, text="not found\n")
+        
+        headers = {}
+        if standin.etag:
+            # 요청마다 바뀌는 CSRF 토큰을 넣기 전 본문 기준 (데이터가 같으면 같은 ETag)
+            etag = f'W/"{hashlib.sha1(body.encode("utf-8")).hexdigest()[:16]}"'
+            if request.headers.get('If-None-Match') == etag:
+                standin.stats['not_modified'] += 1
+                return web.Response(status=304, headers={'ETag': etag})
+            headers['ETag'] = etag
+        
+        body = body.replace(f"synthetic-{standin.site.seed}-token", standin.issue_token())
+        return web.Response(text=body, content_type="text/html", headers=headers)
+    
+    async def theme_api(request):
+        standin.stats['api_calls'] += 1
+        if not standin.token_valid(request.headers.get('X-CSRF-TOKEN')):
+            standin.stats['csrf_rejections'] += 1
+            return web.json_response({'message': 'CSRF token mismatch.'}, status=CSRF_EXPIRED_STATUS)
+        
+        form = await request.post()
+        date_str = form.get('reservationDate')
+        if date_str not in standin.dates:
+            return web.json_response({'data': [], 'times': {}})
+        api_data, _ = standin.theme_data(date_str)
+        return web.json_response(api_data, dumps=lambda data: json.dumps(data, ensure_ascii=False))
+    
+    async def stats(request):
+        return web.json_response(standin.snapshot())
+    
+    app = web.Application(middlewares=[faults])
+    app.router.add_get("/reservation", reservation_page)
+    app.router.add_post("/reservation/theme", theme_api)
+    app.router.add_get("/_standin/stats", stats)
+    return app
+
+
+def main(argv=None) -> int:
+    import argparse
+    from aiohttp import web
+    
+    parser = argparse.ArgumentParser(description='제로월드 대역 서버 (부하/지연 테스트용)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--themes', type=int, default=10, help='테마 수')
+    parser.add_argument('--days', type=int, default=DATE_WINDOW_DAYS + 7, help='날짜 수 (오늘부터)')
+    parser.add_argument('--slots', type=int, default=8, help='테마별 하루 슬롯 수')
+    parser.add_argument('--density', type=float, default=0.7, help='예약된 슬롯 비율 (0~1)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 기본 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='무작위 추가 지연 상한(초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='5xx 오류 확률 (0~1)')
+    parser.add_argument('--stall-rate', type=float, default=0.0, help='응답 멈춤 확률 (0~1)')
+    parser.add_argument('--stall-seconds', type=float, default=60.0, help='응답 멈춤 시간(초)')
+    parser.add_argument('--csrf-ttl', type=float, default=None, help='CSRF 토큰 유효 시간(초)')
+    parser.add_argument('--open', dest='openings', action='append', type=parse_opening, default=[],
+                        metavar='SECONDS@SLOT', help='슬롯 오픈 스크립트 (예: "90@2025-08-02 19:00:00", 반복 가능)')
+    parser.add_argument('--open-every', type=float, default=None, help='이 간격(초)마다 매진 슬롯 하나를 무작위로 오픈')
+    parser.add_argument('--etag', action='store_true', help='예약 페이지에 ETag를 붙이고 변경이 없으면 304로 응답')
+    args = parser.parse_args(argv)
+    
+    site = SyntheticSite(args.themes, args.days, args.slots, args.density, seed=args.seed)
+    standin = StandinSite(
+        site, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        stall_rate=args.stall_rate, stall_seconds=args.stall_seconds, csrf_ttl=args.csrf_ttl,
+        openings=args.openings, open_every=args.open_every, etag=args.etag, seed=args.seed,
+    )
+    
+    store = f"http://{args.host}:{args.port}"
+    logger.info(f"🎭 제로월드 대역 서버: {store} ({site.describe()})")
+    logger.info(f"체커 연결: WATCHLIST='[{{\"theme\": \"{site.target_theme}\", \"store\": \"{store}\"}}]'")
+    web.run_app(create_app(standin), host=args.host, port=args.port, print=None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
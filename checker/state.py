@@ -8,11 +8,12 @@
 
 import json
 import threading
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from loguru import logger
 
 from .config import STATE_FILE
+from .metrics import stage_timer
 
 
 class StateManager:
@@ -67,7 +68,7 @@ class StateManager:
         Returns:
             bool: 저장 성공 여부
         """
-        with self._lock:
+        with self._lock, stage_timer('state_save'):
             try:
                 # 임시 파일에 먼저 저장 후 원자적 이동
                 temp_file = self.state_file.with_suffix('.tmp')
@@ -75,9 +76,8 @@ class StateManager:
                 with open(temp_file, 'w', encoding='utf-8') as f:
                     json.dump(state, f, indent=2, ensure_ascii=False)
                 
-                # 원자적 이동 (Windows에서는 기존 파일 삭제 후 이동)
-                if self.state_file.exists():
-                    self.state_file.unlink()
+                # 원자적 교체 (os.replace는 Windows에서도 기존 파일을 덮어씀)
+                # 먼저 삭제하면 다른 프로세스가 그 사이에 파일이 없는 상태를 읽을 수 있음
                 temp_file.replace(self.state_file)
                 
                 logger.debug(f"상태 파일 저장 완료: {len(state)}개 항목")
@@ -97,29 +97,94 @@ class StateManager:
         except Exception as e:
             logger.error(f"상태 파일 백업 실패: {e}")
     
-    def get_previous_slots(self) -> Dict[str, str]:
+    @staticmethod
+    def _target_state(state: Dict[str, Any], target_key: Optional[str]) -> Dict[str, Any]:
+        """대상별 상태 영역 (target_key가 None이면 최상위 = 기본 대상)"""
+        if target_key is None:
+            return state
+        return state.setdefault('targets', {}).setdefault(target_key, {})
+    
+    def get_previous_slots(self, target_key: Optional[str] = None) -> Dict[str, str]:
         """
         이전에 저장된 슬롯 상태 가져오기
         
+        Args:
+            target_key: 모니터링 대상 키 (None이면 기본 대상)
+        
         Returns:
             dict: 이전 슬롯 상태
         """
         state = self.load()
-        return state.get('slots', {})
+        return self._target_state(state, target_key).get('slots', {})
     
-    def update_slots(self, new_slots: Dict[str, str]) -> bool:
+    def update_slots(self, new_slots: Dict[str, str], target_key: Optional[str] = None) -> bool:
         """
         슬롯 상태 업데이트
         
         Args:
             new_slots: 새로운 슬롯 상태
+            target_key: 모니터링 대상 키 (None이면 기본 대상)
             
         Returns:
             bool: 업데이트 성공 여부
         """
         state = self.load()
-        state['slots'] = new_slots
-        state['last_updated'] = str(pd_timestamp_now())
+        target_state = self._target_state(state, target_key)
+        target_state['slots'] = new_slots
+        target_state['last_updated'] = str(pd_timestamp_now())
+        return self.save(state)
+    
+    def remove_target(self, target_key: Optional[str]) -> bool:
+        """
+        모니터링에서 빠진 대상의 상태 삭제
+        
+        Args:
+            target_key: 모니터링 대상 키 (None이면 기본 대상의 최상위 슬롯)
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        state = self.load()
+        if target_key is None:
+            state.pop('slots', None)
+            state.pop('last_updated', None)
+        else:
+            state.get('targets', {}).pop(target_key, None)
+        return self.save(state)
+    
+    def drop_dates(self, dates: List[str], target_key: Optional[str] = None) -> bool:
+        """
+        모니터링 창에서 빠진 날짜의 슬롯 상태 삭제
+        
+        Args:
+            dates: 삭제할 날짜 리스트 (YYYY-MM-DD)
+            target_key: 모니터링 대상 키 (None이면 기본 대상)
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        state = self.load()
+        target_state = self._target_state(state, target_key)
+        expired = set(dates)
+        slots = target_state.get('slots', {})
+        kept = {slot_time: status for slot_time, status in slots.items() if slot_time[:10] not in expired}
+        if len(kept) == len(slots):
+            return True
+        
+        target_state['slots'] = kept
+        logger.debug(f"지난 날짜 {len(dates)}개의 슬롯 {len(slots) - len(kept)}개 삭제")
+        return self.save(state)
+    
+    def promote_target(self, target_key: str) -> bool:
+        """
+        대상의 상태를 최상위(기본 대상) 슬롯으로 이동
+        
+        기본 대상이 빠져 다른 대상이 첫 번째가 될 때 이전 상태를 이어서 사용하기 위함
+        """
+        state = self.load()
+        target_state = state.get('targets', {}).pop(target_key, {})
+        state['slots'] = target_state.get('slots', {})
+        state['last_updated'] = target_state.get('last_updated', str(pd_timestamp_now()))
         return self.save(state)
     
     def find_new_available_slots(self, current_slots: Dict[str, str]) -> List[str]:
@@ -147,27 +212,104 @@ class StateManager:
         logger.info(f"새로 예약 가능한 슬롯: {len(new_available)}개")
         return new_available
     
-    def get_stats(self) -> Dict[str, Any]:
+    def merge_stale_dates(self, current_slots: Dict[str, str], stale_dates: List[str],
+                          target_key: Optional[str] = None) -> Dict[str, str]:
+        """
+        마감 시간 내에 수집하지 못한 날짜는 이전 상태를 유지한 슬롯 상태 반환
+        
+        Args:
+            current_slots: 이번 체크에서 수집한 슬롯 상태
+            stale_dates: 수집하지 못한 날짜 리스트 (YYYY-MM-DD)
+            target_key: 모니터링 대상 키 (None이면 기본 대상)
+            
+        Returns:
+            dict: stale 날짜의 이전 슬롯(지난 시간 제외)을 합친 슬롯 상태
+        """
+        if not stale_dates:
+            return current_slots
+        
+        from datetime import datetime
+        from .transport import current_time
+        # 지난 시간 판단은 스윕과 같은 기준 시각 사용 (재생 중에는 기록 시각)
+        now = current_time()
+        stale = set(stale_dates)
+        merged = dict(current_slots)
+        kept = 0
+        
+        for slot_time, previous_status in self.get_previous_slots(target_key).items():
+            if slot_time[:10] not in stale or slot_time in merged:
+                continue
+            try:
+                if datetime.strptime(slot_time, "%Y-%m-%d %H:%M:%S") <= now:
+                    continue
+            except ValueError:
+                pass
+            merged[slot_time] = previous_status
+            kept += 1
+        
+        logger.info(f"stale 날짜 {len(stale_dates)}개의 이전 슬롯 {kept}개 유지")
+        return merged
+    
+    def diff_slots(self, current_slots: Dict[str, str],
+                   target_key: Optional[str] = None) -> Tuple[List[str], List[str]]:
+        """
+        이전 상태와 비교하여 상태가 바뀐 슬롯 찾기
+        
+        Args:
+            current_slots: 현재 슬롯 상태
+            target_key: 모니터링 대상 키 (None이면 기본 대상)
+            
+        Returns:
+            tuple: (새로 예약 가능해진 슬롯 리스트, 새로 매진된 슬롯 리스트)
+        """
+        return diff_slots(self.get_previous_slots(target_key), current_slots)
+    
+    def get_stats(self, target_key: Optional[str] = None) -> Dict[str, Any]:
         """
         상태 파일 통계 정보
         
+        Args:
+            target_key: 모니터링 대상 키 (None이면 기본 대상)
+        
         Returns:
             dict: 통계 정보
         """
         state = self.load()
-        slots = state.get('slots', {})
+        target_state = self._target_state(state, target_key)
+        slots = target_state.get('slots', {})
         
         stats = {
             'total_slots': len(slots),
             'available_slots': len([s for s in slots.values() if s == "예약가능"]),
             'reserved_slots': len([s for s in slots.values() if s == "매진"]),
-            'last_updated': state.get('last_updated', 'N/A'),
+            'last_updated': target_state.get('last_updated', 'N/A'),
             'file_size': self.state_file.stat().st_size if self.state_file.exists() else 0
         }
         
         return stats
 
 
+def diff_slots(previous_slots: Dict[str, str],
+               current_slots: Dict[str, str]) -> Tuple[List[str], List[str]]:
+    """
+    두 슬롯 상태 비교
+    
+    Returns:
+        tuple: (opened, closed) - 예약가능으로 바뀐 슬롯, 예약가능에서 매진으로 바뀐 슬롯
+    """
+    opened = []
+    closed = []
+    
+    for slot_time, current_status in current_slots.items():
+        previous_status = previous_slots.get(slot_time)
+        if current_status == "예약가능" and previous_status != "예약가능":
+            opened.append(slot_time)
+        elif current_status != "예약가능" and previous_status == "예약가능":
+            closed.append(slot_time)
+    
+    return opened, closed
+
+
 def pd_timestamp_now():
     """현재 시간 문자열 반환 (datetime 대신 사용)"""
     from datetime import datetime
@@ -202,9 +344,9 @@ def get_previous_slots() -> Dict[str, str]:
     return get_state_manager().get_previous_slots()
 
 
-def update_slots(new_slots: Dict[str, str]) -> bool:
+def update_slots(new_slots: Dict[str, str], target_key: Optional[str] = None) -> bool:
     """슬롯 상태 업데이트 (편의 함수)"""
-    return get_state_manager().update_slots(new_slots)
+    return get_state_manager().update_slots(new_slots, target_key)
 
 
 def find_new_available_slots(current_slots: Dict[str, str]) -> List[str]:
@@ -0,0 +1,446 @@
+# -*- coding: utf-8 -*-
+"""
+구독자별 알림 필터 모듈
+
+채팅마다 테마, 날짜 범위, 요일, 시간대 필터를 두고 일치하는 슬롯만 보낸다.
+열린 슬롯은 (테마, 날짜, 시) 버킷으로 된 역색인에서 구독자 후보를 찾는다.
+- 테마 버킷: 테마 → 그 테마를 받는 구독자 (테마 필터가 없는 구독자 포함)
+- 날짜 버킷: 날짜 → 그 날짜(범위 + 요일)를 받는 구독자 (처음 조회할 때 만들어 재사용)
+- 시 버킷: 0~23시 → 그 시간대를 받는 구독자
+세 버킷 중 가장 작은 집합만 순회하며 나머지 두 집합의 포함 여부를 확인하므로
+매칭 비용은 구독자 수 x 슬롯 수가 아니라 후보(대부분 실제 일치) 수에 비례한다.
+시 버킷은 시간 단위라 분 단위 경계(예: 18:30-)는 후보에 대해서만 한 번 더 확인한다.
+
+사용법:
+    python -m checker.subscribers                          # 무작위 구독자/슬롯으로 역색인과 전수 비교 결과 검증 및 시간 측정
+    python -m checker.subscribers --subscribers 5000 --slots 2000
+"""
+
+import datetime as dt
+import json
+import re
+import sys
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from loguru import logger
+
+from .config import SUBSCRIBERS, SUBSCRIBERS_FILE
+
+# 요일 이름 → weekday() 번호
+WEEKDAY_NAMES = {
+    'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6,
+    '월': 0, '화': 1, '수': 2, '목': 3, '금': 4, '토': 5, '일': 6,
+}
+WEEKDAY_GROUPS = {
+    'weekday': {0, 1, 2, 3, 4},
+    'weekend': {5, 6},
+    '평일': {0, 1, 2, 3, 4},
+    '주말': {5, 6},
+}
+WEEKDAY_LABELS = "월화수목금토일"
+
+# 시간대 필터 (HH:MM-HH:MM, 끝 시각은 포함하지 않음, 끝이 시작보다 이르면 자정을 넘김)
+TIME_WINDOW_PATTERN = re.compile(r"(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})")
+MINUTES_PER_DAY = 24 * 60
+
+# 날짜 버킷 캐시 최대 크기 (넘으면 비우고 다시 만듦)
+DATE_BUCKET_LIMIT = 400
+
+
+def parse_weekdays(values: Iterable[str]) -> Set[int]:
+    """요일 이름 목록 → weekday() 번호 집합 (예: ['sat', 'sun'], ['주말'], ['월', '수'])"""
+    weekdays = set()
+    for value in values:
+        name = str(value).strip().lower()
+        if name in WEEKDAY_GROUPS:
+            weekdays |= WEEKDAY_GROUPS[name]
+        elif name in WEEKDAY_NAMES:
+            weekdays.add(WEEKDAY_NAMES[name])
+        elif name[:3] in WEEKDAY_NAMES:
+            # saturday → sat
+            weekdays.add(WEEKDAY_NAMES[name[:3]])
+        elif name.endswith('요일') and name[:-2] in WEEKDAY_NAMES:
+            weekdays.add(WEEKDAY_NAMES[name[:-2]])
+        else:
+            raise ValueError(f"알 수 없는 요일: {value}")
+    return weekdays
+
+
+def parse_time_window(text: str) -> Tuple[int, int]:
+    """'HH:MM-HH:MM' → (시작 분, 끝 분) (자정 기준 분, 끝은 포함하지 않음)"""
+    match = TIME_WINDOW_PATTERN.fullmatch(text.strip())
+    if not match:
+        raise ValueError(f"시간대는 HH:MM-HH:MM 형식이어야 합니다: {text}")
+    start_h, start_m, end_h, end_m = (int(group) for group in match.groups())
+    start = start_h * 60 + start_m
+    end = end_h * 60 + end_m
+    if start >= MINUTES_PER_DAY or end > MINUTES_PER_DAY or start_m >= 60 or end_m >= 60 or start == end:
+        raise ValueError(f"잘못된 시간대: {text}")
+    return start, end
+
+
+def _window_minutes(window: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """시간대를 자정을 넘지 않는 구간 목록으로 분리"""
+    start, end = window
+    if start < end:
+        return [(start, end)]
+    return [(start, MINUTES_PER_DAY), (0, end)]
+
+
+class Subscriber:
+    """알림 구독자 (채팅 하나 + 필터)"""
+    
+    def __init__(self, chat_id: int, name: Optional[str] = None, themes: Optional[Iterable[str]] = None,
+                 date_start: Optional[str] = None, date_end: Optional[str] = None,
+                 weekdays: Optional[Iterable[str]] = None, times: Optional[Iterable[str]] = None):
+        self.chat_id = int(chat_id)
+        self.name = name or str(self.chat_id)
+        # None이면 모든 테마/날짜/요일/시간
+        self.themes: Optional[Set[str]] = set(themes) if themes else None
+        self.date_start = date_start
+        self.date_end = date_end
+        self._start = dt.datetime.strptime(date_start, "%Y-%m-%d").date() if date_start else None
+        self._end = dt.datetime.strptime(date_end, "%Y-%m-%d").date() if date_end else None
+        if self._start and self._end and self._start > self._end:
+            raise ValueError(f"시작일이 종료일보다 늦습니다: {date_start} ~ {date_end}")
+        self.weekday_names = list(weekdays) if weekdays else []
+        self.weekdays: Optional[Set[int]] = parse_weekdays(self.weekday_names) if self.weekday_names else None
+        self.time_labels = list(times) if times else []
+        self.windows = [segment for label in self.time_labels for segment in _window_minutes(parse_time_window(label))]
+    
+    @property
+    def has_date_filter(self) -> bool:
+        return bool(self._start or self._end or self.weekdays is not None)
+    
+    def accepts_theme(self, theme: str) -> bool:
+        return self.themes is None or theme in self.themes
+    
+    def accepts_date(self, date: dt.date) -> bool:
+        if self._start and date < self._start:
+            return False
+        if self._end and date > self._end:
+            return False
+        return self.weekdays is None or date.weekday() in self.weekdays
+    
+    def accepts_minute(self, minute_of_day: int) -> bool:
+        if not self.windows:
+            return True
+        return any(start <= minute_of_day < end for start, end in self.windows)
+    
+    def hours(self) -> Optional[Set[int]]:
+        """시간대가 걸치는 시(0~23) 집합 (None이면 모든 시간)"""
+        if not self.windows:
+            return None
+        hours = set()
+        for start, end in self.windows:
+            hours.update(range(start // 60, (end - 1) // 60 + 1))
+        return hours
+    
+    def matches(self, theme: str, slot: str) -> bool:
+        """슬롯('YYYY-MM-DD HH:MM:SS') 하나를 필터와 직접 비교 (역색인 검증용)"""
+        date_part, time_part = slot.split(' ', 1)
+        date = dt.datetime.strptime(date_part, "%Y-%m-%d").date()
+        minute_of_day = int(time_part[:2]) * 60 + int(time_part[3:5])
+        return self.accepts_theme(theme) and self.accepts_date(date) and self.accepts_minute(minute_of_day)
+    
+    def describe(self) -> str:
+        """필터 설명 (예: '테마 전체 · 주말 · 18:00-23:00')"""
+        parts = [f"테마 {', '.join(sorted(self.themes))}" if self.themes else "테마 전체"]
+        if self.date_start or self.date_end:
+            if self.date_start == self.date_end:
+                parts.append(self.date_start)
+            else:
+                parts.append(f"{self.date_start or '오늘'} ~ {self.date_end or ''}".rstrip())
+        if self.weekdays is not None:
+            parts.append("".join(WEEKDAY_LABELS[day] for day in sorted(self.weekdays)) + "요일")
+        if self.time_labels:
+            parts.append(", ".join(self.time_labels))
+        return " · ".join(parts)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {'chat_id': self.chat_id, 'name': self.name}
+        if self.themes:
+            data['themes'] = sorted(self.themes)
+        if self.date_start:
+            data['date_start'] = self.date_start
+        if self.date_end:
+            data['date_end'] = self.date_end
+        if self.weekday_names:
+            data['weekdays'] = self.weekday_names
+        if self.time_labels:
+            data['times'] = self.time_labels
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Subscriber":
+        if not data.get('chat_id'):
+            raise ValueError(f"채팅 ID가 없습니다: {data}")
+        themes = data.get('themes')
+        if isinstance(themes, str):
+            themes = [themes]
+        return cls(
+            chat_id=data['chat_id'],
+            name=data.get('name'),
+            themes=themes,
+            date_start=data.get('date_start'),
+            date_end=data.get('date_end'),
+            weekdays=data.get('weekdays'),
+            times=data.get('times'),
+        )
+    
+    def __repr__(self) -> str:
+        return f"Subscriber({self.chat_id}, {self.describe()})"
+
+
+class SubscriberIndex:
+    """구독자 역색인 (테마 / 날짜 / 시 버킷 → 구독자 번호 집합, 만든 뒤에는 바꾸지 않음)"""
+    
+    def __init__(self, subscribers: Iterable[Subscriber]):
+        self.subscribers = list(subscribers)
+        self.chat_ids = frozenset(subscriber.chat_id for subscriber in self.subscribers)
+        
+        # 테마: 필터 없는 구독자는 모든 테마 버킷에 포함
+        self._any_theme = frozenset(i for i, s in enumerate(self.subscribers) if s.themes is None)
+        themes: Dict[str, Set[int]] = {}
+        for i, subscriber in enumerate(self.subscribers):
+            for theme in subscriber.themes or ():
+                themes.setdefault(theme, set(self._any_theme)).add(i)
+        self._themes = {theme: frozenset(members) for theme, members in themes.items()}
+        
+        # 시: 시간대 필터가 없는 구독자는 모든 시 버킷에 포함
+        hours: List[Set[int]] = [set() for _ in range(24)]
+        for i, subscriber in enumerate(self.subscribers):
+            for hour in subscriber.hours() or range(24):
+                hours[hour].add(i)
+        self._hours = [frozenset(members) for members in hours]
+        
+        # 날짜: 범위/요일 필터가 있는 구독자만 날짜별로 확인 (버킷은 처음 조회할 때 생성)
+        self._dated = [i for i, s in enumerate(self.subscribers) if s.has_date_filter]
+        self._any_date = frozenset(i for i, s in enumerate(self.subscribers) if not s.has_date_filter)
+        self._dates: Dict[str, FrozenSet[int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.subscribers)
+    
+    def _date_bucket(self, date_str: str) -> FrozenSet[int]:
+        bucket = self._dates.get(date_str)
+        if bucket is None:
+            date = dt.datetime.strptime(date_str, "%Y-%m-%d").date()
+            bucket = self._any_date | {i for i in self._dated if self.subscribers[i].accepts_date(date)}
+            if len(self._dates) >= DATE_BUCKET_LIMIT:
+                self._dates.clear()
+            self._dates[date_str] = bucket
+        return bucket
+    
+    def match(self, theme: str, slot: str) -> List[Subscriber]:
+        """슬롯('YYYY-MM-DD HH:MM:SS')을 받을 구독자 목록"""
+        date_str, time_str = slot.split(' ', 1)
+        hour, minute = int(time_str[:2]), int(time_str[3:5])
+        
+        buckets = sorted(
+            (self._themes.get(theme, self._any_theme), self._date_bucket(date_str), self._hours[hour]),
+            key=len,
+        )
+        smallest, second, third = buckets
+        minute_of_day = hour * 60 + minute
+        return [
+            self.subscribers[i] for i in smallest
+            if i in second and i in third and self.subscribers[i].accepts_minute(minute_of_day)
+        ]
+    
+    def route(self, theme: str, slots: List[str], default_chat_id: int) -> Dict[int, List[str]]:
+        """
+        슬롯을 받을 채팅별로 나누기
+        
+        Args:
+            theme: 슬롯의 테마
+            slots: 예약 가능 슬롯 목록
+            default_chat_id: 대상의 기본 채팅 (구독자로 등록되지 않았으면 모든 슬롯을 받음)
+        
+        Returns:
+            dict: 채팅 ID → 그 채팅이 받을 슬롯 목록
+        """
+        routes: Dict[int, List[str]] = {}
+        if default_chat_id not in self.chat_ids:
+            routes[default_chat_id] = list(slots)
+        if not self.subscribers:
+            return routes
+        
+        for slot in slots:
+            try:
+                matched = self.match(theme, slot)
+            except (ValueError, IndexError):
+                logger.debug(f"구독 필터를 적용할 수 없는 슬롯 형식: {slot}")
+                continue
+            for subscriber in matched:
+                routes.setdefault(subscriber.chat_id, []).append(slot)
+        return routes
+
+
+def parse_subscribers(entries: List[Dict[str, Any]]) -> List[Subscriber]:
+    """구독자 항목 목록 → 구독자 목록 (잘못된 항목은 무시, 같은 채팅은 마지막 항목 사용)"""
+    subscribers: Dict[int, Subscriber] = {}
+    for entry in entries:
+        try:
+            subscriber = Subscriber.from_dict(entry)
+        except (ValueError, TypeError) as e:
+            logger.error(f"잘못된 구독자 항목 무시: {e}")
+            continue
+        subscribers[subscriber.chat_id] = subscriber
+    return list(subscribers.values())
+
+
+class SubscriberRegistry:
+    """구독자 목록과 역색인 (봇 명령으로 바꾸면 파일에 저장하고 역색인을 새로 만들어 교체)"""
+    
+    def __init__(self, subscribers_file=SUBSCRIBERS_FILE):
+        self.subscribers_file = subscribers_file
+        self._lock = threading.Lock()
+        self._index = SubscriberIndex(self._load())
+        if len(self._index):
+            logger.info(f"📬 구독자 필터 {len(self._index)}개 로드")
+    
+    def _load(self) -> List[Subscriber]:
+        """봇 명령으로 저장한 파일 → 환경변수 SUBSCRIBERS 순으로 로드"""
+        if self.subscribers_file.exists():
+            try:
+                with open(self.subscribers_file, 'r', encoding='utf-8') as f:
+                    return parse_subscribers(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"구독자 파일 로드 실패: {e} - 환경변수 설정을 사용합니다")
+        
+        if SUBSCRIBERS:
+            try:
+                return parse_subscribers(json.loads(SUBSCRIBERS))
+            except json.JSONDecodeError as e:
+                logger.error(f"SUBSCRIBERS JSON 파싱 실패: {e} - 구독자 필터 없이 실행합니다")
+        return []
+    
+    def _save_locked(self, subscribers: List[Subscriber]) -> bool:
+        """구독자 파일 원자적 저장 (호출하는 쪽에서 잠금 보유)"""
+        try:
+            temp_file = self.subscribers_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump([subscriber.to_dict() for subscriber in subscribers], f, indent=2, ensure_ascii=False)
+            temp_file.replace(self.subscribers_file)
+            return True
+        except OSError as e:
+            logger.error(f"구독자 파일 저장 오류: {e}")
+            return False
+    
+    @property
+    def index(self) -> SubscriberIndex:
+        return self._index
+    
+    def route(self, theme: str, slots: List[str], default_chat_id: int) -> Dict[int, List[str]]:
+        """현재 역색인으로 슬롯을 채팅별로 나누기 (SubscriberIndex.route)"""
+        return self._index.route(theme, slots, default_chat_id)
+    
+    def get(self, chat_id: int) -> Optional[Subscriber]:
+        return next((s for s in self._index.subscribers if s.chat_id == chat_id), None)
+    
+    def subscribe(self, subscriber: Subscriber) -> bool:
+        """채팅의 필터 등록/교체 (새로 등록했으면 True)"""
+        with self._lock:
+            others = [s for s in self._index.subscribers if s.chat_id != subscriber.chat_id]
+            added = len(others) == len(self._index.subscribers)
+            subscribers = others + [subscriber]
+            self._save_locked(subscribers)
+            self._index = SubscriberIndex(subscribers)
+        logger.info(f"📬 구독 필터 {'등록' if added else '변경'}: {subscriber}")
+        return added
+    
+    def unsubscribe(self, chat_id: int) -> bool:
+        """채팅의 필터 삭제 (없으면 False)"""
+        with self._lock:
+            subscribers = [s for s in self._index.subscribers if s.chat_id != chat_id]
+            if len(subscribers) == len(self._index.subscribers):
+                return False
+            self._save_locked(subscribers)
+            self._index = SubscriberIndex(subscribers)
+        logger.info(f"📭 구독 필터 삭제: {chat_id}")
+        return True
+
+
+# 전역 구독자 목록
+_subscriber_registry: Optional[SubscriberRegistry] = None
+_subscriber_registry_lock = threading.Lock()
+
+
+def get_subscriber_registry() -> SubscriberRegistry:
+    """전역 구독자 목록 반환"""
+    global _subscriber_registry
+    with _subscriber_registry_lock:
+        if _subscriber_registry is None:
+            _subscriber_registry = SubscriberRegistry()
+    return _subscriber_registry
+
+
+def random_subscribers(count: int, themes: List[str], today: dt.date, rng) -> List[Subscriber]:
+    """검증/측정용 무작위 구독자"""
+    weekday_choices = [None, ['weekend'], ['weekday'], ['fri', 'sat'], ['월', '수']]
+    time_choices = [None, ['18:00-23:00'], ['10:30-13:15'], ['22:00-02:00'], ['09:00-12:00', '19:00-21:00']]
+    subscribers = []
+    for i in range(count):
+        start = today + dt.timedelta(days=rng.randrange(30)) if rng.random() < 0.3 else None
+        end = start + dt.timedelta(days=rng.randrange(7)) if start and rng.random() < 0.7 else None
+        subscribers.append(Subscriber(
+            chat_id=i + 1,
+            themes=rng.sample(themes, rng.randint(1, 2)) if rng.random() < 0.6 else None,
+            date_start=start.strftime("%Y-%m-%d") if start else None,
+            date_end=end.strftime("%Y-%m-%d") if end else None,
+            weekdays=rng.choice(weekday_choices),
+            times=rng.choice(time_choices),
+        ))
+    return subscribers
+
+
+def main(argv=None) -> int:
+    import argparse
+    import random
+    import time
+    
+    parser = argparse.ArgumentParser(description='구독자 역색인 검증 및 매칭 시간 측정 (전수 비교 대비)')
+    parser.add_argument('--subscribers', type=int, default=1000, help='무작위 구독자 수')
+    parser.add_argument('--slots', type=int, default=500, help='무작위 슬롯 수')
+    parser.add_argument('--themes', type=int, default=10, help='테마 수')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    rng = random.Random(args.seed)
+    today = dt.date.today()
+    themes = [f"테마{i}" for i in range(args.themes)]
+    subscribers = random_subscribers(args.subscribers, themes, today, rng)
+    slots = [
+        (rng.choice(themes),
+         f"{today + dt.timedelta(days=rng.randrange(30))} {rng.randrange(9, 24):02d}:{rng.choice((0, 15, 30, 45)):02d}:00")
+        for _ in range(args.slots)
+    ]
+    
+    started = time.perf_counter()
+    index = SubscriberIndex(subscribers)
+    build_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    indexed = [{s.chat_id for s in index.match(theme, slot)} for theme, slot in slots]
+    index_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    brute = [{s.chat_id for s in subscribers if s.matches(theme, slot)} for theme, slot in slots]
+    brute_seconds = time.perf_counter() - started
+    
+    mismatches = sum(1 for a, b in zip(indexed, brute) if a != b)
+    matches = sum(len(chats) for chats in brute)
+    print(f"구독자 {args.subscribers}명, 슬롯 {args.slots}개, 일치 {matches}건")
+    print(f"  역색인 생성 {build_seconds * 1000:.1f}ms")
+    print(f"  역색인 매칭 {index_seconds * 1000:.1f}ms (일치 1건당 {index_seconds / max(matches, 1) * 1e6:.2f}µs)")
+    print(f"  전수 비교   {brute_seconds * 1000:.1f}ms")
+    if mismatches:
+        print(f"❌ 전수 비교와 다른 결과 {mismatches}건")
+        return 1
+    print("✅ 전수 비교와 결과 일치")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
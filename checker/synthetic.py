@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+합성 예약 데이터 생성 모듈
+
+테마 수, 날짜 수, 하루 슬롯 수, 예약 밀도를 조절해 제로월드 예약 페이지
+(reservationHiddenData 포함)와 /reservation/theme API 응답을 만들어 낸다.
+날짜 창을 넓히거나 테마를 늘리기 전에 추출/상태 코드가 어떻게 늘어나는지 측정하는 데 쓴다.
+
+- SyntheticSite: 시드 기반 결정적 데이터 생성기
+- SyntheticTransport: 합성 사이트로 응답하는 전송 계층 (네트워크 없음)
+- write_corpus: ReplayTransport로 재생할 수 있는 코퍼스로 저장
+
+사용법:
+    python -m checker.synthetic corpus/ --themes 60 --days 180 --slots 16 --density 0.7
+    python -m checker.main --profile 3 --replay corpus/
+"""
+
+import datetime as dt
+import html
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from .config import BASE_URL, THEME_NAME
+from .transport import RecordingTransport, build_response, current_date
+
+# 예약된 슬롯 중 API 응답에도 매진(reservation=true)으로 반영된 비율
+# (나머지는 숨겨진 데이터에만 있어 조합 판정 경로를 거친다)
+API_SYNC_RATIO = 0.5
+
+# 슬롯 시간대 (10:00부터 23:00 사이에 균등 배치)
+FIRST_SLOT_MINUTES = 10 * 60
+LAST_SLOT_MINUTES = 23 * 60
+
+
+def slot_timestamp(date_str: str, time_str: str) -> str:
+    """숨겨진 데이터의 예약 키 (ZeroworldFetcher._time_to_timestamp과 같은 로컬 시간 기준)"""
+    return str(int(dt.datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S").timestamp()))
+
+
+class SyntheticSite:
+    """시드 기반 합성 예약 사이트"""
+    
+    def __init__(self, themes: int = 10, days: int = 30, slots_per_day: int = 8, density: float = 0.7,
+                 start_date: Optional[dt.date] = None, seed: int = 0, target_theme: str = THEME_NAME):
+        """
+        Args:
+            themes: 테마 수 (대상 테마 포함, 대상 테마는 목록 마지막에 배치)
+            days: 날짜 수
+            slots_per_day: 테마별 하루 슬롯 수
+            density: 예약된 슬롯 비율 (0~1)
+            start_date: 첫 날짜 (기본값: 현재 전송 계층 기준 오늘)
+            seed: 난수 시드 (같은 시드면 같은 데이터)
+            target_theme: 모니터링 대상 테마 이름
+        """
+        if themes < 1 or days < 1 or slots_per_day < 1:
+            raise ValueError("themes, days, slots_per_day는 1 이상이어야 합니다")
+        if not 0 <= density <= 1:
+            raise ValueError(f"density는 0~1 사이여야 합니다: {density}")
+        
+        self.themes = themes
+        self.days = days
+        self.slots_per_day = slots_per_day
+        self.density = density
+        self.seed = seed
+        self.target_theme = target_theme
+        self.start_date = start_date or current_date()
+        # 합성 데이터의 기준 시각 (첫 날 자정, 모든 슬롯이 미래)
+        self.now = dt.datetime.combine(self.start_date, dt.time.min)
+        
+        # 대상 테마를 마지막에 두어 테마 이름 검색이 전체 목록을 훑게 한다
+        self.theme_list = [{'title': f"가상 테마 {pk}", 'PK': pk} for pk in range(1, themes)]
+        self.theme_list.append({'title': target_theme, 'PK': themes})
+        self.target_pk = themes
+        
+        step = max(1, min(70, (LAST_SLOT_MINUTES - FIRST_SLOT_MINUTES) // slots_per_day))
+        self.times = [
+            f"{minutes // 60:02d}:{minutes % 60:02d}:00"
+            for minutes in range(FIRST_SLOT_MINUTES, FIRST_SLOT_MINUTES + step * slots_per_day, step)
+        ]
+        self._days: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+    
+    def dates(self) -> List[str]:
+        return [(self.start_date + dt.timedelta(days=offset)).isoformat() for offset in range(self.days)]
+    
+    def _generate(self, date_str: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """날짜별 (API 응답, 숨겨진 데이터) 생성 (날짜마다 독립된 난수열)"""
+        if date_str not in self._days:
+            rng = random.Random(f"{self.seed}:{date_str}")
+            times: Dict[str, List[Dict[str, Any]]] = {}
+            other: Dict[str, Dict[str, Any]] = {}
+            
+            for theme in self.theme_list:
+                pk = str(theme['PK'])
+                theme_times = []
+                reserved = {}
+                for time_str in self.times:
+                    booked = rng.random() < self.density
+                    api_reservation = booked and rng.random() < API_SYNC_RATIO
+                    theme_times.append({'time': time_str, 'reservation': api_reservation})
+                    if booked:
+                        reserved[slot_timestamp(date_str, time_str)] = {'reservation': True}
+                times[pk] = theme_times
+                other[pk] = reserved
+            
+            self._days[date_str] = ({'data': self.theme_list, 'times': times}, {'other': other})
+        return self._days[date_str]
+    
+    def theme_payload(self, date_str: str) -> Dict[str, Any]:
+        """/reservation/theme API 응답"""
+        return self._generate(date_str)[0]
+    
+    def hidden_data(self, date_str: str) -> Dict[str, Any]:
+        """reservationHiddenData JSON"""
+        return self._generate(date_str)[1]
+    
+    def index_page(self) -> str:
+        """세션 초기화용 예약 페이지 (CSRF 토큰 포함)"""
+        return (
+            "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+            f"<meta name=\"csrf-token\" content=\"synthetic-{self.seed}-token\">"
+            "<title>예약하기</title></head><body><div id=\"reservation\"></div></body></html>"
+        )
+    
+    def reservation_page(self, date_str: str, api_data: Optional[Dict[str, Any]] = None,
+                         hidden_data: Optional[Dict[str, Any]] = None) -> str:
+        """
+        날짜별 예약 페이지 (테마 목록과 시간표 마크업 + 숨겨진 데이터)
+        
+        api_data/hidden_data를 주면 생성 데이터 대신 사용한다 (대역 서버의 슬롯 오픈 반영용).
+        """
+        generated_api, generated_hidden = self._generate(date_str)
+        api_data = api_data or generated_api
+        hidden_data = hidden_data or generated_hidden
+        parts = [
+            "<!DOCTYPE html><html><head><meta charset=\"utf-8\">",
+            f"<meta name=\"csrf-token\" content=\"synthetic-{self.seed}-token\">",
+            f"<title>예약하기 - {date_str}</title></head><body>",
+            f"<form id=\"reservationForm\"><input type=\"hidden\" name=\"reservationDate\" value=\"{date_str}\">",
+            "<ul class=\"theme-list\">",
+        ]
+        for theme in api_data['data']:
+            pk = str(theme['PK'])
+            title = html.escape(theme['title'])
+            parts.append(
+                f"<li class=\"theme\" data-pk=\"{pk}\"><h3>{title}</h3>"
+                f"<p class=\"desc\">{title} 테마 소개. 제한 시간 70분, 권장 인원 2~4명.</p><div class=\"times\">"
+            )
+            for slot in api_data['times'][pk]:
+                state = "disabled" if slot['reservation'] else "able"
+                parts.append(f"<label class=\"time {state}\"><input type=\"radio\" name=\"time\" "
+                             f"value=\"{slot['time']}\">{slot['time'][:5]}</label>")
+            parts.append("</div></li>")
+        parts.append("</ul></form>")
+        parts.append("<div id=\"reservationHiddenData\" style=\"display:none\">")
+        parts.append(html.escape(json.dumps(hidden_data, ensure_ascii=False), quote=False))
+        parts.append("</div></body></html>")
+        return "".join(parts)
+    
+    def slot_states(self, theme_pk: Optional[int] = None) -> Dict[str, str]:
+        """
+        테마의 전체 슬롯 상태 (StateManager 형식 {"2025-01-29 18:30:00": "예약가능"})
+        
+        Args:
+            theme_pk: 테마 PK (기본값: 대상 테마)
+        """
+        pk = str(theme_pk or self.target_pk)
+        slots = {}
+        for date_str in self.dates():
+            api_data, hidden_data = self._generate(date_str)
+            reserved = hidden_data['other'][pk]
+            for slot in api_data['times'][pk]:
+                booked = slot['reservation'] or slot_timestamp(date_str, slot['time']) in reserved
+                slots[f"{date_str} {slot['time']}"] = "매진" if booked else "예약가능"
+        return slots
+    
+    def describe(self) -> str:
+        return (f"테마 {self.themes}개 x 날짜 {self.days}개 x 하루 슬롯 {self.slots_per_day}개, "
+                f"예약 밀도 {self.density:.0%}, 시드 {self.seed}")
+
+
+class SyntheticTransport:
+    """합성 사이트로 응답하는 전송 계층 (시각은 합성 데이터 기준 시각)"""
+    
+    live = False
+    
+    def __init__(self, site: SyntheticSite, store: str = BASE_URL):
+        self.site = site
+        self.reservation_url = f"{store.rstrip('/')}/reservation"
+        self._dates = set(site.dates())
+    
+    def request(self, session, method: str, url: str, **kwargs):
+        path, _, query = url.partition('?')
+        method = method.upper()
+        
+        if method == 'GET' and path == self.reservation_url:
+            date_str = parse_qs(query).get('date', [None])[0]
+            if date_str is None:
+                return build_response(url, 200, self.site.index_page())
+            if date_str in self._dates:
+                return build_response(url, 200, self.site.reservation_page(date_str))
+        elif method == 'POST' and path == f"{self.reservation_url}/theme":
+            date_str = (kwargs.get('data') or {}).get('reservationDate')
+            if date_str in self._dates:
+                body = json.dumps(self.site.theme_payload(date_str), ensure_ascii=False)
+                return build_response(url, 200, body, content_type="application/json")
+        
+        return build_response(url, 404)
+    
+    def now(self) -> dt.datetime:
+        return self.site.now
+
+
+def write_corpus(site: SyntheticSite, corpus_dir, store: str = BASE_URL) -> int:
+    """
+    합성 사이트 응답을 ReplayTransport 코퍼스로 저장하고 저장한 응답 수 반환
+    
+    기록 시각은 합성 데이터 기준 시각이므로, 재생 시 날짜 창이 첫 날짜부터 시작한다.
+    """
+    recorder = RecordingTransport(corpus_dir, recorded_at=site.now)
+    reservation_url = f"{store.rstrip('/')}/reservation"
+    
+    recorder.add_entry('GET', reservation_url, None, 200, site.index_page(), write_manifest=False)
+    for date_str in site.dates():
+        recorder.add_entry('GET', f"{reservation_url}?date={date_str}", None, 200,
+                           site.reservation_page(date_str), write_manifest=False)
+        data = {'reservationDate': date_str, 'name': '', 'phone': '', 'paymentType': '1'}
+        recorder.add_entry('POST', f"{reservation_url}/theme", data, 200,
+                           json.dumps(site.theme_payload(date_str), ensure_ascii=False),
+                           content_type="application/json", write_manifest=False)
+    recorder.write_manifest()
+    return len(recorder.manifest['entries'])
+
+
+def main(argv=None) -> int:
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='제로월드 합성 예약 코퍼스 생성')
+    parser.add_argument('corpus', help='코퍼스 디렉터리')
+    parser.add_argument('--themes', type=int, default=10, help='테마 수')
+    parser.add_argument('--days', type=int, default=30, help='날짜 수')
+    parser.add_argument('--slots', type=int, default=8, help='테마별 하루 슬롯 수')
+    parser.add_argument('--density', type=float, default=0.7, help='예약된 슬롯 비율 (0~1)')
+    parser.add_argument('--start', type=dt.date.fromisoformat, default=None, help='첫 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args(argv)
+    
+    site = SyntheticSite(args.themes, args.days, args.slots, args.density, args.start, args.seed)
+    count = write_corpus(site, Path(args.corpus))
+    print(f"합성 코퍼스 생성: {args.corpus} ({site.describe()}, 응답 {count}개)")
+    print(f"재생: python -m checker.main --profile 3 --replay {args.corpus}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+모니터링 대상(watch-list) 관리 모듈
+
+하나의 프로세스에서 여러 (매장, 테마, 날짜 범위) 대상을 동시에 모니터링한다.
+같은 매장의 대상들은 fetcher와 날짜별 응답을 공유하고,
+대상마다 별도의 상태(diff)와 알림 채팅을 가진다.
+
+날짜 범위를 지정하지 않은 대상은 오늘부터 DATE_WINDOW_DAYS일의 롤링 창을 모니터링하며,
+날짜가 바뀌면 지난 날짜를 빼고 새 마지막 날짜만 추가한다.
+"""
+
+import json
+import datetime as dt
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+
+from .config import THEME_NAME, BASE_URL, DATE_WINDOW_DAYS, CHAT_ID, WATCHLIST, WATCHLIST_FILE, ALLOWED_STORE_HOSTS
+from .transport import current_date
+
+
+def store_allowed(store: str) -> bool:
+    """매장 URL이 허용된 호스트(ALLOWED_STORE_HOSTS 또는 그 하위 도메인)인지 확인"""
+    parsed = urlparse(store)
+    host = (parsed.hostname or "").lower()
+    if parsed.scheme not in ("http", "https") or not host:
+        return False
+    return any(host == allowed or host.endswith(f".{allowed}") for allowed in ALLOWED_STORE_HOSTS)
+
+
+class WatchTarget:
+    """모니터링 대상 (매장 + 테마 + 날짜 범위 + 알림 채팅)"""
+    
+    def __init__(self, theme: str, store: str = BASE_URL, date_start: Optional[str] = None,
+                 date_end: Optional[str] = None, chat_id: Optional[int] = None,
+                 window_days: int = DATE_WINDOW_DAYS):
+        self.theme = theme
+        self.store = store.rstrip('/')
+        # 명시한 날짜 범위 (None이면 오늘 / 오늘+window_days-1 기준 롤링)
+        self.date_start = date_start
+        self.date_end = date_end
+        self.window_days = window_days
+        self.chat_id = chat_id or CHAT_ID
+        # 첫 번째 대상은 기존 state.json 최상위 'slots'를 그대로 사용 (하위 호환)
+        self.primary = False
+        # 현재 모니터링 중인 날짜 창 (refresh_dates에서 증분 갱신)
+        self._dates: Optional[deque] = None
+        
+        # 잘못된 날짜 형식은 생성 시점에 거부
+        self._bounds(dt.date.today())
+    
+    @property
+    def key(self) -> str:
+        """대상 식별자 (예: '층간소음@zerohongdae.com')"""
+        return f"{self.theme}@{urlparse(self.store).netloc or self.store}"
+    
+    @property
+    def state_key(self) -> Optional[str]:
+        """상태 저장 키 (primary 대상은 None = 최상위 slots)"""
+        return None if self.primary else self.key
+    
+    @property
+    def reservation_url(self) -> str:
+        return f"{self.store}/reservation"
+    
+    def _bounds(self, today: dt.date) -> Tuple[dt.date, dt.date]:
+        """오늘 기준 날짜 창 (시작일, 종료일) - 지난 날짜는 포함하지 않음"""
+        start_date = today
+        if self.date_start:
+            start_date = max(today, dt.datetime.strptime(self.date_start, "%Y-%m-%d").date())
+        
+        if self.date_end:
+            end_date = dt.datetime.strptime(self.date_end, "%Y-%m-%d").date()
+        else:
+            end_date = today + dt.timedelta(days=self.window_days - 1)
+        return start_date, end_date
+    
+    def refresh_dates(self, today: Optional[dt.date] = None) -> Tuple[List[str], List[str]]:
+        """
+        오늘 기준으로 날짜 창 증분 갱신 (처음 호출 시 전체 생성)
+        
+        날짜가 바뀌면 창 앞쪽의 지난 날짜를 빼고 뒤쪽에 새 날짜만 추가한다.
+        이어받은 창보다 시작일이 앞당겨졌으면 앞쪽에도 빠진 날짜를 추가한다.
+        
+        Returns:
+            tuple: (추가된 날짜 리스트, 빠진 날짜 리스트) (YYYY-MM-DD)
+        """
+        start_date, end_date = self._bounds(today or current_date())
+        if self._dates is None:
+            self._dates = deque()
+        
+        dropped = []
+        while self._dates and self._dates[0] < start_date:
+            dropped.append(self._dates.popleft())
+        while self._dates and self._dates[-1] > end_date:
+            dropped.append(self._dates.pop())
+        
+        added = []
+        if self._dates:
+            leading = []
+            previous_date = self._dates[0] - dt.timedelta(days=1)
+            while previous_date >= start_date:
+                self._dates.appendleft(previous_date)
+                leading.append(previous_date)
+                previous_date -= dt.timedelta(days=1)
+            added.extend(reversed(leading))
+        
+        next_date = self._dates[-1] + dt.timedelta(days=1) if self._dates else start_date
+        while next_date <= end_date:
+            self._dates.append(next_date)
+            added.append(next_date)
+            next_date += dt.timedelta(days=1)
+        
+        return [d.strftime("%Y-%m-%d") for d in added], [d.strftime("%Y-%m-%d") for d in dropped]
+    
+    def inherit_dates(self, previous: "WatchTarget"):
+        """같은 대상의 이전 날짜 창을 이어받음 (다음 refresh_dates에서 차이만 추가/삭제)"""
+        if previous._dates is not None:
+            self._dates = deque(previous._dates)
+    
+    def dates(self) -> List[str]:
+        """현재 모니터링 날짜 목록 (YYYY-MM-DD, 창이 없으면 오늘 기준으로 생성)"""
+        if self._dates is None:
+            self.refresh_dates()
+        # 지난 체크의 마감 초과 워커가 아직 읽는 중일 수 있어 복사본 사용
+        return [d.strftime("%Y-%m-%d") for d in list(self._dates)]
+    
+    def window_label(self) -> str:
+        """날짜 범위 설명 (예: '오늘부터 30일', '2026-11-01 ~ 2026-11-30')"""
+        if not self.date_start and not self.date_end:
+            return f"오늘부터 {self.window_days}일"
+        start = self.date_start or "오늘"
+        end = self.date_end or f"+{self.window_days}일"
+        return f"{start} ~ {end}"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """저장용 dict (롤링 창은 날짜를 고정하지 않도록 명시한 범위만 저장)"""
+        data = {'theme': self.theme, 'store': self.store, 'chat_id': self.chat_id}
+        if self.date_start:
+            data['date_start'] = self.date_start
+        if self.date_end:
+            data['date_end'] = self.date_end
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WatchTarget":
+        if not data.get('theme'):
+            raise ValueError(f"테마 이름이 없습니다: {data}")
+        store = data.get('store', BASE_URL)
+        if not store_allowed(store):
+            raise ValueError(f"허용되지 않은 매장입니다: {store} (ALLOWED_STORE_HOSTS: {', '.join(ALLOWED_STORE_HOSTS)})")
+        return cls(
+            theme=data['theme'],
+            store=store,
+            date_start=data.get('date_start'),
+            date_end=data.get('date_end'),
+            chat_id=int(data['chat_id']) if data.get('chat_id') else None,
+        )
+    
+    def __repr__(self) -> str:
+        return f"WatchTarget({self.key}, {self.window_label()})"
+
+
+def default_target() -> WatchTarget:
+    """기존 단일 테마 설정(THEME_NAME, 롤링 날짜 창)에 해당하는 대상"""
+    target = WatchTarget(THEME_NAME)
+    target.primary = True
+    return target
+
+
+def parse_watchlist(entries: List[Dict[str, Any]]) -> List[WatchTarget]:
+    """watch-list 항목 목록을 대상 목록으로 변환 (중복 제거, 첫 대상이 primary)"""
+    targets = []
+    seen = set()
+    
+    for entry in entries:
+        try:
+            target = WatchTarget.from_dict(entry)
+        except (ValueError, TypeError) as e:
+            logger.error(f"잘못된 모니터링 대상 항목 무시: {e}")
+            continue
+        
+        if target.key in seen:
+            logger.warning(f"중복 모니터링 대상 무시: {target.key}")
+            continue
+        seen.add(target.key)
+        targets.append(target)
+    
+    if targets:
+        targets[0].primary = True
+    return targets
+
+
+def load_runtime_config() -> Dict[str, Any]:
+    """
+    봇 명령으로 저장된 런타임 설정 로드
+    
+    Returns:
+        dict: {'targets': [...], 'interval_seconds': float} (파일이 없거나 손상되면 빈 dict)
+    """
+    if not WATCHLIST_FILE.exists():
+        return {}
+    try:
+        with open(WATCHLIST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"런타임 설정 파일 로드 실패: {e} - 무시합니다")
+        return {}
+
+
+def save_runtime_config(targets: List[WatchTarget], interval_seconds: Optional[float] = None) -> bool:
+    """런타임 설정 저장 (임시 파일에 쓴 뒤 원자적 교체)"""
+    config: Dict[str, Any] = {'targets': [target.to_dict() for target in targets]}
+    if interval_seconds:
+        config['interval_seconds'] = interval_seconds
+    
+    try:
+        temp_file = WATCHLIST_FILE.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
+        temp_file.replace(WATCHLIST_FILE)
+        logger.debug(f"런타임 설정 저장 완료: 대상 {len(targets)}개")
+        return True
+    except OSError as e:
+        logger.error(f"런타임 설정 저장 오류: {e}")
+        return False
+
+
+def load_watch_targets() -> List[WatchTarget]:
+    """
+    모니터링 대상 목록 로드
+    
+    봇 명령으로 저장한 런타임 설정 → 환경변수 WATCHLIST(JSON 리스트) → THEME_NAME 단일 대상 순으로 사용
+    """
+    runtime_targets = parse_watchlist(load_runtime_config().get('targets', []))
+    if runtime_targets:
+        return runtime_targets
+    
+    if WATCHLIST:
+        try:
+            targets = parse_watchlist(json.loads(WATCHLIST))
+            if targets:
+                return targets
+            logger.warning("WATCHLIST에 유효한 대상이 없어 기본 테마를 사용합니다")
+        except json.JSONDecodeError as e:
+            logger.error(f"WATCHLIST JSON 파싱 실패: {e} - 기본 테마를 사용합니다")
+    
+    return [default_target()]
+
+
+def group_by_store(targets: List[WatchTarget]) -> Dict[str, List[WatchTarget]]:
+    """매장(base URL)별 대상 묶음"""
+    groups: Dict[str, List[WatchTarget]] = {}
+    for target in targets:
+        groups.setdefault(target.store, []).append(target)
+    return groups
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+체크 파이프라인 트레이싱 모듈
+
+체크 한 번이 span 트리 하나가 된다.
+    check_slots
+    ├── collect_slots
+    │   └── sweep_store
+    │       ├── session_init
+    │       ├── get_theme_data (날짜별)
+    │       │   └── html_get / hidden_parse / api_post
+    │       └── extract_slots_from_data (날짜 x 대상별)
+    ├── diff
+    ├── notify (대상 x 채팅별)
+    └── update_slots (대상별)
+
+끝난 span은 버퍼에 쌓였다가 루트 span이 끝날 때 파일에 추가된다.
+- jsonl: span 하나당 JSON 한 줄 (trace_id/span_id/parent_id로 트리 복원)
+- chrome: Chrome trace-event 형식 (chrome://tracing, ui.perfetto.dev에서 바로 열림)
+
+트레이싱이 꺼져 있으면 span()은 공유 no-op 객체를 반환하고 traced()는 플래그만 확인하므로
+체크 경로에 추가되는 비용이 거의 없다. 현재 span은 contextvars로 전달되므로
+asyncio.to_thread와 copy_context()로 시작한 워커 스레드에서도 부모-자식 관계가 유지된다.
+
+사용법:
+    python -m checker.main --once --trace traces/check.jsonl
+    TRACE_FILE=traces/check.json TRACE_FORMAT=chrome python -m checker.main
+    python -m checker.tracing traces/check.jsonl -o traces/check.json   # jsonl → Chrome 형식 변환
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+from .config import TRACE_FILE, TRACE_FORMAT
+
+FORMATS = ('jsonl', 'chrome')
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("zeroworld_current_span", default=None)
+
+
+def _new_id() -> str:
+    return os.urandom(8).hex()
+
+
+class Span:
+    """실행 구간 하나 (with 블록으로 사용)"""
+    
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'attrs', 'start', 'duration',
+                 'thread_id', 'thread_name', '_started', '_token')
+    
+    def __init__(self, name: str, parent: Optional["Span"], attrs: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else _new_id()
+        self.span_id = _new_id()
+        self.parent_id = parent.span_id if parent else None
+        self.attrs = attrs
+        self.start = 0.0
+        self.duration = 0.0
+        self.thread_id = 0
+        self.thread_name = ""
+        self._started = 0.0
+        self._token = None
+    
+    def set(self, **attrs):
+        """속성 추가 (예: 응답 상태 코드)"""
+        self.attrs.update(attrs)
+    
+    def __enter__(self):
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.start = time.time()
+        self._started = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self._started
+        if exc_type is not None:
+            self.attrs['error'] = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        tracer = _tracer
+        if tracer is not None:
+            tracer.export(self)
+        return False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """jsonl 한 줄"""
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': round(self.start, 6),
+            'duration_ms': round(self.duration * 1000, 3),
+            'thread_id': self.thread_id,
+            'thread': self.thread_name,
+            'attrs': self.attrs,
+        }
+
+
+class _NoopSpan:
+    """트레이싱이 꺼져 있을 때 반환하는 공유 span"""
+    
+    __slots__ = ()
+    
+    def set(self, **attrs):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def chrome_event(record: Dict[str, Any], pid: int) -> Dict[str, Any]:
+    """jsonl 레코드 → Chrome trace-event 완료(X) 이벤트"""
+    args = dict(record['attrs'])
+    args.update(trace_id=record['trace_id'], span_id=record['span_id'], parent_id=record['parent_id'])
+    return {
+        'name': record['name'],
+        'cat': 'zeroworld',
+        'ph': 'X',
+        'ts': round(record['start'] * 1_000_000, 1),
+        'dur': round(record['duration_ms'] * 1000, 1),
+        'pid': pid,
+        'tid': record['thread_id'],
+        'args': args,
+    }
+
+
+def thread_name_event(pid: int, thread_id: int, thread_name: str) -> Dict[str, Any]:
+    """Chrome trace-event 스레드 이름 메타데이터"""
+    return {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': thread_name}}
+
+
+class Tracer:
+    """끝난 span을 파일로 내보내는 트레이서"""
+    
+    def __init__(self, path, fmt: str = 'jsonl'):
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 트레이스 형식: {fmt} (jsonl 또는 chrome)")
+        self.path = Path(path)
+        self.format = fmt
+        self.pid = os.getpid()
+        self.spans_total = 0
+        self._buffer: List[str] = []
+        self._named_threads = set()
+        self._lock = threading.Lock()
+    
+    def export(self, span: Span):
+        """span 기록 (루트 span이 끝나면 버퍼를 파일에 씀)"""
+        record = span.to_dict()
+        with self._lock:
+            if self.format == 'chrome':
+                if span.thread_id not in self._named_threads:
+                    self._named_threads.add(span.thread_id)
+                    self._buffer.append(json.dumps(thread_name_event(self.pid, span.thread_id, span.thread_name)))
+                self._buffer.append(json.dumps(chrome_event(record, self.pid), ensure_ascii=False))
+            else:
+                self._buffer.append(json.dumps(record, ensure_ascii=False))
+            self.spans_total += 1
+            if span.parent_id is None:
+                self._flush_locked()
+    
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not self.path.exists() or self.path.stat().st_size == 0
+            with open(self.path, 'a', encoding='utf-8') as f:
+                if self.format == 'chrome':
+                    # 닫는 ]가 없는 JSON 배열 형식 (trace viewer가 허용, 실행 중에도 이어 쓸 수 있음)
+                    if is_new:
+                        f.write("[\n")
+                    f.write("".join(f"{line},\n" for line in self._buffer))
+                else:
+                    f.write("".join(f"{line}\n" for line in self._buffer))
+        except OSError as e:
+            logger.warning(f"트레이스 저장 실패 ({self.path}): {e}")
+        self._buffer.clear()
+
+
+# 현재 트레이서 (None이면 트레이싱 꺼짐)
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def configure_tracing(path=None, fmt: str = 'jsonl') -> Optional[Tracer]:
+    """트레이싱 켜기 (path가 비어 있으면 끄기)"""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is not None:
+            _tracer.flush()
+        _tracer = Tracer(path, fmt) if path else None
+        if _tracer is not None:
+            logger.info(f"🧵 트레이싱: {_tracer.path} ({fmt})")
+        return _tracer
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **attrs):
+    """
+    현재 span의 자식 span 생성 (with span("html_get", date=date) as s: ...)
+    
+    트레이싱이 꺼져 있으면 공유 no-op 객체를 반환한다.
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+    return Span(name, _current_span.get(), attrs)
+
+
+def traced(name: Optional[str] = None):
+    """함수 전체를 span으로 감싸는 데코레이터 (코루틴 함수도 지원)"""
+    def decorator(func):
+        span_name = name or func.__name__
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with Span(span_name, _current_span.get(), {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with Span(span_name, _current_span.get(), {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _flush_at_exit():
+    tracer = _tracer
+    if tracer is not None:
+        tracer.flush()
+
+
+atexit.register(_flush_at_exit)
+
+if TRACE_FILE:
+    configure_tracing(TRACE_FILE, TRACE_FORMAT)
+
+
+def convert_to_chrome(jsonl_path, output_path) -> int:
+    """jsonl 트레이스를 Chrome trace-event JSON으로 변환 (변환한 span 수 반환)"""
+    events = []
+    threads = {}
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            threads.setdefault(record['thread_id'], record['thread'])
+            events.append(chrome_event(record, 1))
+    
+    metadata = [thread_name_event(1, thread_id, thread_name) for thread_id, thread_name in threads.items()]
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+    return len(events)
+
+
+def main(argv=None) -> int:
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='jsonl 트레이스를 Chrome trace-event 형식으로 변환')
+    parser.add_argument('trace', help='jsonl 트레이스 파일')
+    parser.add_argument('-o', '--output', help='출력 파일 (기본값: 같은 이름의 .json)')
+    args = parser.parse_args(argv)
+    
+    output = args.output or str(Path(args.trace).with_suffix('.json'))
+    count = convert_to_chrome(args.trace, output)
+    print(f"span {count}개 변환: {output} (chrome://tracing 또는 ui.perfetto.dev에서 열기)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 전송 계층 모듈 (실시간 / 기록 / 재생)
+
+ZeroworldFetcher의 모든 요청은 현재 전송 계층을 거친다.
+- LiveTransport: 실제 사이트로 요청 (기본값)
+- RecordingTransport: 실제 요청 후 응답을 압축 코퍼스(디렉터리)에 저장
+- ReplayTransport: 저장된 코퍼스로 응답 (오프라인, 속도 제한 없음)
+
+재생 시에는 기록 시각을 현재 시각으로 사용하므로, 날짜 창과 지난 슬롯 판정이
+기록 당시와 같아져 파싱/추출/diff 변경을 실제 데이터로 결정적으로 비교할 수 있다.
+
+사용법:
+    python -m checker.transport record corpus/   # 한 번 스윕하며 응답 기록
+    python -m checker.transport replay corpus/   # 기록한 응답으로 오프라인 스윕
+"""
+
+import datetime as dt
+import gzip
+import hashlib
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+from loguru import logger
+
+from .config import RECORD_DIR, REPLAY_DIR
+
+MANIFEST_FILE = "manifest.json"
+ENTRIES_DIR = "entries"
+# 기록 중에는 보내지 않는 조건부 요청 헤더 (소문자)
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+
+def request_key(method: str, url: str, data: Optional[Dict[str, Any]] = None) -> str:
+    """요청 식별 키 (메서드 + URL + 정렬된 폼 데이터, CSRF 헤더 등은 제외)"""
+    key = f"{method.upper()} {url}"
+    if data:
+        key += f" {urlencode(sorted(data.items()))}"
+    return key
+
+
+def build_response(url: str, status: int, body: str = "", content_type: str = "text/html; charset=utf-8",
+                   encoding: str = "utf-8"):
+    """네트워크 없이 requests.Response 생성 (재생/합성 전송 계층용)"""
+    import requests
+    
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response.headers['Content-Type'] = content_type
+    response.encoding = encoding
+    response._content = body.encode(encoding)
+    return response
+
+
+class LiveTransport:
+    """실제 사이트로 요청하는 기본 전송 계층"""
+    
+    live = True
+    
+    def request(self, session, method: str, url: str, **kwargs):
+        return session.request(method, url, **kwargs)
+    
+    def now(self) -> dt.datetime:
+        return dt.datetime.now()
+
+
+class RecordingTransport(LiveTransport):
+    """실제 요청 후 응답을 gzip 코퍼스에 저장하는 전송 계층"""
+    
+    def __init__(self, corpus_dir, recorded_at: Optional[dt.datetime] = None):
+        self.corpus_dir = Path(corpus_dir)
+        (self.corpus_dir / ENTRIES_DIR).mkdir(parents=True, exist_ok=True)
+        self.manifest = {
+            'recorded_at': recorded_at.isoformat(timespec='seconds') if recorded_at else None,
+            'entries': {},
+        }
+        self._lock = threading.Lock()
+    
+    def request(self, session, method: str, url: str, **kwargs):
+        # 코퍼스는 method+url+data로만 구분하므로 조건부 요청을 보내지 않고 항상 본문을 기록
+        # (304의 빈 본문이 앞서 기록한 200 응답을 덮어쓰면 재생할 데이터가 없어짐)
+        headers = kwargs.get('headers')
+        if headers:
+            kwargs['headers'] = {
+                name: value for name, value in headers.items()
+                if name.lower() not in CONDITIONAL_HEADERS
+            }
+        response = super().request(session, method, url, **kwargs)
+        self.add_entry(
+            method, url, kwargs.get('data'), response.status_code, response.text,
+            content_type=response.headers.get('Content-Type', ''),
+            encoding=response.encoding or 'utf-8',
+        )
+        return response
+    
+    def add_entry(self, method: str, url: str, data: Optional[Dict[str, Any]], status: int, body: str,
+                  content_type: str = "text/html; charset=utf-8", encoding: str = "utf-8",
+                  write_manifest: bool = True):
+        """
+        응답 한 건을 코퍼스에 저장
+        
+        여러 건을 한꺼번에 쓸 때는 write_manifest=False로 저장한 뒤 write_manifest()를 한 번 호출한다.
+        """
+        key = request_key(method, url, data)
+        filename = f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json.gz"
+        entry = {
+            'key': key,
+            'method': method.upper(),
+            'url': url,
+            'data': data,
+            'status': status,
+            'headers': {'Content-Type': content_type},
+            'encoding': encoding,
+            'body': body,
+        }
+        
+        with self._lock:
+            with gzip.open(self.corpus_dir / ENTRIES_DIR / filename, 'wt', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            
+            if self.manifest['recorded_at'] is None:
+                self.manifest['recorded_at'] = dt.datetime.now().isoformat(timespec='seconds')
+            self.manifest['entries'][key] = filename
+        
+        if write_manifest:
+            self.write_manifest()
+        logger.debug(f"응답 기록: {key} ({status}, {len(body)}자)")
+    
+    def write_manifest(self):
+        """매니페스트 원자적 저장"""
+        with self._lock:
+            temp_file = self.corpus_dir / f"{MANIFEST_FILE}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+            temp_file.replace(self.corpus_dir / MANIFEST_FILE)
+
+
+class ReplayTransport:
+    """기록된 코퍼스로 응답하는 오프라인 전송 계층 (시각은 기록 시각으로 고정)"""
+    
+    live = False
+    
+    def __init__(self, corpus_dir):
+        self.corpus_dir = Path(corpus_dir)
+        manifest_path = self.corpus_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"코퍼스 매니페스트가 없습니다: {manifest_path}")
+        
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self.recorded_at = dt.datetime.fromisoformat(manifest['recorded_at'])
+        self.index: Dict[str, str] = manifest['entries']
+        # 압축 해제한 항목 캐시 (반복 재생 시 디스크/압축 해제 비용 제외)
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.misses = 0
+    
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        if key not in self._cache:
+            filename = self.index.get(key)
+            if filename is None:
+                return None
+            with gzip.open(self.corpus_dir / ENTRIES_DIR / filename, 'rt', encoding='utf-8') as f:
+                self._cache[key] = json.load(f)
+        return self._cache[key]
+    
+    def request(self, session, method: str, url: str, **kwargs):
+        key = request_key(method, url, kwargs.get('data'))
+        entry = self._load(key)
+        
+        if entry is None:
+            self.misses += 1
+            logger.warning(f"코퍼스에 없는 요청: {key}")
+            return build_response(url, 404)
+        
+        return build_response(
+            url, entry['status'], entry['body'],
+            content_type=entry['headers'].get('Content-Type', ''), encoding=entry['encoding'],
+        )
+    
+    def now(self) -> dt.datetime:
+        return self.recorded_at
+
+
+# 현재 전송 계층 (RECORD_DIR / REPLAY_DIR 환경변수로 기본값 결정)
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """현재 전송 계층 반환"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            if REPLAY_DIR:
+                _transport = ReplayTransport(REPLAY_DIR)
+                logger.info(f"📼 재생 모드: {REPLAY_DIR} (기록 시각 {_transport.recorded_at})")
+            elif RECORD_DIR:
+                _transport = RecordingTransport(RECORD_DIR)
+                logger.info(f"⏺️ 기록 모드: {RECORD_DIR}")
+            else:
+                _transport = LiveTransport()
+    return _transport
+
+
+def set_transport(transport):
+    """전송 계층 교체 (None이면 환경변수 기본값으로 복귀)"""
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+@contextmanager
+def using_transport(transport):
+    """블록 안에서만 전송 계층 교체 (벤치마크/하네스용)"""
+    previous = get_transport()
+    set_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_transport(previous)
+
+
+def current_time() -> dt.datetime:
+    """현재 전송 계층 기준 시각 (재생 중에는 기록 시각)"""
+    return get_transport().now()
+
+
+def current_date() -> dt.date:
+    """현재 전송 계층 기준 날짜"""
+    return current_time().date()
+
+
+def main(argv=None) -> int:
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='제로월드 응답 기록/재생')
+    parser.add_argument('mode', choices=['record', 'replay'], help='record: 실제 스윕 기록, replay: 오프라인 재생')
+    parser.add_argument('corpus', help='코퍼스 디렉터리')
+    args = parser.parse_args(argv)
+    
+    # python -m으로 실행하면 이 파일은 __main__이므로 fetch가 사용하는 checker.transport 모듈에 설정한다
+    from . import transport as module
+    if args.mode == 'record':
+        module.set_transport(module.RecordingTransport(args.corpus))
+    else:
+        module.set_transport(module.ReplayTransport(args.corpus))
+    
+    from .fetch import get_slots
+    started = time.perf_counter()
+    slots = get_slots()
+    elapsed = time.perf_counter() - started
+    
+    available = len([s for s in slots.values() if s == "예약가능"])
+    print(f"{args.mode}: 슬롯 {len(slots)}개 (예약가능 {available}개), {elapsed:.2f}초")
+    transport = module.get_transport()
+    if isinstance(transport, module.RecordingTransport):
+        print(f"기록한 응답 {len(transport.manifest['entries'])}개: {args.corpus}")
+    elif transport.misses:
+        print(f"⚠️ 코퍼스에 없는 요청 {transport.misses}개")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+장시간 실행 자원 감시 모듈
+
+체크마다 RSS, 열린 파일 디스크립터, 스레드 수(선택적으로 tracemalloc 추적 메모리)를 샘플링해
+증가 추세를 로그로 남기고, 설정한 한도를 연속으로 넘으면 재시작이 필요하다고 알린다.
+재시작은 ZeroworldChecker가 스케줄러/봇/서버를 정리한 뒤 restart_process()로 수행한다.
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from loguru import logger
+
+from .config import (
+    WATCHDOG_MAX_RSS_MB, WATCHDOG_MAX_FDS, WATCHDOG_MAX_THREADS, WATCHDOG_BREACH_CHECKS,
+    WATCHDOG_WARMUP_CHECKS, WATCHDOG_REPORT_EVERY, WATCHDOG_TRACEMALLOC
+)
+from .metrics import get_registry
+
+# 추세 계산에 사용하는 최근 샘플 수
+TREND_WINDOW = 120
+
+PROCESS_RSS_BYTES = get_registry().gauge("zeroworld_process_rss_bytes", "프로세스 RSS (바이트)")
+PROCESS_OPEN_FDS = get_registry().gauge("zeroworld_process_open_fds", "열린 파일 디스크립터 수")
+PROCESS_THREADS = get_registry().gauge("zeroworld_process_threads", "실행 중인 스레드 수")
+
+
+def read_rss_bytes() -> Optional[int]:
+    """현재 RSS (Linux는 /proc, 그 외는 최대 RSS로 대체)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KiB 단위
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+def count_open_fds() -> Optional[int]:
+    """열린 파일 디스크립터 수 (지원하지 않는 플랫폼이면 None)"""
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(fd_dir))
+        except OSError:
+            continue
+    return None
+
+
+def _slope_per_hour(points: List[Tuple[float, float]]) -> float:
+    """최소제곱 기울기 (단위/시간)"""
+    if len(points) < 2:
+        return 0.0
+    mean_t = sum(t for t, _ in points) / len(points)
+    mean_v = sum(v for _, v in points) / len(points)
+    denominator = sum((t - mean_t) ** 2 for t, _ in points)
+    if denominator == 0:
+        return 0.0
+    return sum((t - mean_t) * (v - mean_v) for t, v in points) / denominator * 3600
+
+
+class ResourceWatchdog:
+    """체크마다 자원 사용량을 샘플링하고 한도 초과를 판정"""
+    
+    def __init__(self, max_rss_mb: float = WATCHDOG_MAX_RSS_MB, max_fds: int = WATCHDOG_MAX_FDS,
+                 max_threads: int = WATCHDOG_MAX_THREADS, breach_checks: int = WATCHDOG_BREACH_CHECKS,
+                 warmup_checks: int = WATCHDOG_WARMUP_CHECKS, report_every: int = WATCHDOG_REPORT_EVERY,
+                 use_tracemalloc: bool = WATCHDOG_TRACEMALLOC):
+        """
+        Args:
+            max_rss_mb: RSS 한도 (MB, 0이면 검사 안 함)
+            max_fds: 파일 디스크립터 한도 (0이면 검사 안 함)
+            max_threads: 스레드 수 한도 (0이면 검사 안 함)
+            breach_checks: 재시작을 요청하기까지 연속으로 한도를 넘어야 하는 샘플 수
+            warmup_checks: 기준선을 잡기 전 건너뛰는 샘플 수 (임포트/캐시 워밍업)
+            report_every: 추세 로그 간격 (샘플 수)
+            use_tracemalloc: True면 tracemalloc으로 기준선 대비 할당 증가 위치도 보고
+        """
+        self.limits = {'rss_mb': max_rss_mb, 'fds': max_fds, 'threads': max_threads}
+        self.breach_checks = max(1, breach_checks)
+        self.warmup_checks = warmup_checks
+        self.report_every = max(1, report_every)
+        self.use_tracemalloc = use_tracemalloc
+        self.samples: Deque[Dict[str, float]] = deque(maxlen=TREND_WINDOW)
+        self.sample_count = 0
+        self.baseline: Optional[Dict[str, float]] = None
+        self._baseline_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._consecutive_breaches = 0
+        
+        if use_tracemalloc and not tracemalloc.is_tracing():
+            # 프레임 1개만 기록해 오버헤드를 줄인다 (위치별 증가량 보고용)
+            tracemalloc.start(1)
+    
+    def _collect(self) -> Dict[str, float]:
+        rss = read_rss_bytes()
+        fds = count_open_fds()
+        sample = {
+            'time': time.time(),
+            'rss_mb': rss / 1024 / 1024 if rss is not None else 0.0,
+            'fds': float(fds) if fds is not None else 0.0,
+            'threads': float(threading.active_count()),
+        }
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            sample['traced_mb'] = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+        
+        if rss is not None:
+            PROCESS_RSS_BYTES.set(rss)
+        if fds is not None:
+            PROCESS_OPEN_FDS.set(fds)
+        PROCESS_THREADS.set(sample['threads'])
+        return sample
+    
+    def observe(self) -> Optional[str]:
+        """
+        샘플 하나를 기록하고 한도를 판정
+        
+        Returns:
+            str: 한도를 연속으로 넘어 재시작이 필요하면 사유, 아니면 None
+        """
+        sample = self._collect()
+        self.samples.append(sample)
+        self.sample_count += 1
+        
+        if self.sample_count == self.warmup_checks + 1:
+            self.baseline = dict(sample)
+            if self.use_tracemalloc and tracemalloc.is_tracing():
+                self._baseline_snapshot = tracemalloc.take_snapshot()
+            logger.info(f"🩺 자원 기준선: {self._format_sample(sample)}")
+        elif self.baseline and (self.sample_count - self.warmup_checks - 1) % self.report_every == 0:
+            self._log_trend()
+        
+        breaches = [
+            f"{name} {sample[name]:.0f} > {limit:g}"
+            for name, limit in self.limits.items()
+            if limit and sample[name] > limit
+        ]
+        if not breaches:
+            self._consecutive_breaches = 0
+            return None
+        
+        self._consecutive_breaches += 1
+        logger.warning(
+            f"🩺 자원 한도 초과 ({self._consecutive_breaches}/{self.breach_checks}회 연속): {', '.join(breaches)}"
+        )
+        if self._consecutive_breaches < self.breach_checks:
+            return None
+        self._log_trend()
+        return ", ".join(breaches)
+    
+    def trend(self, name: str) -> float:
+        """최근 샘플 기준 시간당 증가량"""
+        return _slope_per_hour([(s['time'], s[name]) for s in self.samples if name in s])
+    
+    @staticmethod
+    def _format_sample(sample: Dict[str, float]) -> str:
+        text = f"RSS {sample['rss_mb']:.1f}MB, fd {sample['fds']:.0f}개, 스레드 {sample['threads']:.0f}개"
+        if 'traced_mb' in sample:
+            text += f", 추적 메모리 {sample['traced_mb']:.1f}MB"
+        return text
+    
+    def _log_trend(self):
+        """기준선 대비 변화와 시간당 추세, tracemalloc 증가 위치 로그"""
+        if not self.samples or not self.baseline:
+            return
+        latest = self.samples[-1]
+        logger.info(
+            f"🩺 자원 추세 ({self.sample_count}회 샘플): {self._format_sample(latest)} | "
+            f"기준선 대비 RSS {latest['rss_mb'] - self.baseline['rss_mb']:+.1f}MB, "
+            f"fd {latest['fds'] - self.baseline['fds']:+.0f}, 스레드 {latest['threads'] - self.baseline['threads']:+.0f} | "
+            f"시간당 RSS {self.trend('rss_mb'):+.1f}MB, fd {self.trend('fds'):+.1f}"
+        )
+        
+        if self._baseline_snapshot is not None and tracemalloc.is_tracing():
+            growth = tracemalloc.take_snapshot().compare_to(self._baseline_snapshot, 'lineno')
+            for stat in [stat for stat in growth if stat.size_diff > 0][:5]:
+                frame = stat.traceback[0]
+                logger.info(f"  📈 {frame.filename}:{frame.lineno} {stat.size_diff / 1024:+.1f}KiB ({stat.count_diff:+d}개 블록)")
+    
+    def summary_line(self) -> str:
+        """상태 메시지용 한 줄 요약"""
+        if not self.samples:
+            return "🩺 자원: 아직 샘플 없음"
+        return f"🩺 {self._format_sample(self.samples[-1])} (시간당 RSS {self.trend('rss_mb'):+.1f}MB)"
+
+
+def restart_process():
+    """같은 명령줄로 현재 프로세스를 다시 실행 (로그 싱크를 닫아 버퍼를 비운 뒤 execv)"""
+    # python -m checker.main처럼 실행한 경우에도 원래 인자를 그대로 사용
+    args = list(getattr(sys, 'orig_argv', [])[1:]) or sys.argv
+    logger.warning(f"♻️ 프로세스 재시작: {sys.executable} {' '.join(args)}")
+    logger.remove()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, [sys.executable] + args)